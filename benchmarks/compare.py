@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _flatten(node, prefix: str = "") -> dict[str, dict]:
+    # Any dict with a "p50" is a summarize() result; its path names the case.
+    if isinstance(node, dict) and "p50" in node:
+        return {prefix: node}
+    out: dict[str, dict] = {}
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key != "meta":
+                out.update(_flatten(value, f"{prefix}.{key}" if prefix else key))
+    return out
+
+
+def compare(old: dict, new: dict, stat: str = "p50") -> list[tuple[str, float, float, float]]:
+    before, after = _flatten(old), _flatten(new)
+    rows = []
+    for name in sorted(before.keys() & after.keys()):
+        a, b = before[name].get(stat), after[name].get(stat)
+        if a is None or b is None:
+            continue
+        rows.append((name, a, b, b / a if a else float("inf")))
+    return rows
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        prog="python -m benchmarks.compare",
+        description="Compare two benchmark result files from reports/bench/.",
+    )
+    ap.add_argument("baseline", type=Path)
+    ap.add_argument("candidate", type=Path)
+    ap.add_argument("--stat", default="p50", choices=["p50", "p95", "mean", "min"])
+    ap.add_argument("--threshold", type=float, default=1.10, help="fail when candidate/baseline exceeds this")
+    args = ap.parse_args()
+
+    old = json.loads(args.baseline.read_text(encoding="utf-8"))
+    new = json.loads(args.candidate.read_text(encoding="utf-8"))
+    rows = compare(old, new, args.stat)
+
+    slower = 0
+    print(f"{'case':<40}{'baseline':>11}{'candidate':>11}{'ratio':>8}")
+    for name, a, b, ratio in rows:
+        flag = ""
+        if ratio > args.threshold:
+            flag, slower = "  ❌ slower", slower + 1
+        elif ratio < 1 / args.threshold:
+            flag = "  ✅ faster"
+        print(f"{name:<40}{a:>11.2f}{b:>11.2f}{ratio:>8.2f}{flag}")
+    if slower:
+        print(f"\n{slower} case(s) slower than x{args.threshold:.2f} on {args.stat}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
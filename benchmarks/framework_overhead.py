@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import platform
+import time
+from importlib.metadata import version
+from pathlib import Path
+from typing import Callable
+
+from customer_app.pages.login_page import CustomerLoginPage
+from shared.core import assertions
+from shared.core.base_page import BasePage
+from shared.core.browser_factory import new_context
+from shared.core.browser_server import BrowserClient
+from shared.core.config import settings
+from shared.core.stats import summarize
+from shared.reporting.attachments import save_screenshot
+from .common import write_results
+
+FIXTURE = Path(__file__).parent / "fixtures" / "login.html"
+
+
+def _time(fn: Callable[[], object], reps: int, warmup: int = 2) -> dict:
+    for _ in range(warmup):
+        fn()
+    ms = []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        fn()
+        ms.append((time.perf_counter() - t0) * 1000)
+    return summarize(ms)
+
+
+def bench_fixture(reps: int) -> dict:
+    """What the `page` fixture costs per test: launch-per-test vs one browser per process."""
+    launch_setup, launch_teardown = [], []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        p, browser, context = new_context("about:blank")
+        context.new_page()
+        launch_setup.append((time.perf_counter() - t0) * 1000)
+        t0 = time.perf_counter()
+        context.close()
+        browser.close()
+        p.stop()
+        launch_teardown.append((time.perf_counter() - t0) * 1000)
+
+    client = BrowserClient()
+    client.browser(settings.browser)  # launched once per worker in a real run
+    client_setup, client_teardown = [], []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        context = client.new_context(settings.browser, "about:blank")
+        context.new_page()
+        client_setup.append((time.perf_counter() - t0) * 1000)
+        t0 = time.perf_counter()
+        context.close()
+        client_teardown.append((time.perf_counter() - t0) * 1000)
+    client.close()
+    return {
+        "fixture.launch.setup": summarize(launch_setup),
+        "fixture.launch.teardown": summarize(launch_teardown),
+        "fixture.shared.setup": summarize(client_setup),
+        "fixture.shared.teardown": summarize(client_teardown),
+    }
+
+
+def bench_page_objects(reps: int) -> dict:
+    """Each framework call next to the raw Playwright call it wraps."""
+    url = FIXTURE.as_uri()
+    html = FIXTURE.read_text(encoding="utf-8")
+    client = BrowserClient()
+    context = client.new_context(settings.browser, "about:blank")
+    page = context.new_page()
+    po = CustomerLoginPage(page)
+    page.goto(url)
+
+    def raw_login():
+        page.fill(po.USERNAME, "bench@example.com")
+        page.fill(po.PASSWORD, "secret")
+        page.click(po.LOGIN_BTN)
+
+    shots: list[Path] = []
+    results = {
+        "base_page.init": _time(lambda: BasePage(page), reps),
+        "goto.raw": _time(lambda: page.goto(url, wait_until="domcontentloaded"), reps),
+        "goto.base_page": _time(lambda: po.goto(url), reps),
+        "set_content.raw": _time(lambda: page.set_content(html), reps),
+        "login.raw": _time(raw_login, reps),
+        "login.page_object": _time(lambda: po.login("bench@example.com", "secret"), reps),
+        "screenshot.raw": _time(lambda: page.screenshot(full_page=True), reps),
+        "screenshot.base_page": _time(lambda: shots.append(Path(po.screenshot("bench"))), reps),
+        "screenshot.attachments": _time(lambda: shots.append(save_screenshot(page, "bench")), reps),
+        "assert.text_visible": _time(lambda: assertions.assert_text_visible(page, "Sign in"), reps),
+        "assert.locator_visible": _time(lambda: assertions.assert_locator_visible(page, po.LOGIN_BTN), reps),
+        "assert.url_contains": _time(lambda: assertions.assert_url_contains(page, "login.html"), reps),
+    }
+    for shot in shots:
+        shot.unlink(missing_ok=True)
+    context.close()
+    client.close()
+    return results
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        prog="python -m benchmarks.framework_overhead",
+        description="Framework overhead against a local HTML fixture (no network).",
+    )
+    ap.add_argument("--reps", type=int, default=20)
+    ap.add_argument("--skip-fixture", action="store_true", help="skip the slow launch-per-test case")
+    args = ap.parse_args()
+
+    cases = {} if args.skip_fixture else bench_fixture(max(3, args.reps // 4))
+    cases.update(bench_page_objects(args.reps))
+
+    print(f"{'case':<26}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, s in cases.items():
+        print(f"{name:<26}{s['p50']:>10.2f}{s['p95']:>10.2f}")
+    meta = {
+        "python": platform.python_version(),
+        "playwright": version("playwright"),
+        "browser": settings.browser,
+        "profile": settings.launch_profile,
+        "perf_metrics": settings.perf_metrics,
+        "network_log": settings.network_log,
+    }
+    print(f"\nResults: {write_results('framework_overhead', {'meta': meta, 'reps': args.reps, 'cases': cases})}")
+
+
+if __name__ == "__main__":
+    main()
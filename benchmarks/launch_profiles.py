@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from dashboard_app.stub import build_server
+from shared.core.browser_factory import new_context
+from shared.core.launch_profiles import PROFILES
+from shared.core.stats import summarize
+from .common import browser_rss_mb, write_results
+
+
+def bench_profile(name: str, url: str, reps: int) -> dict:
+    launch_ms, cold_ms, warm_ms, rss = [], [], [], []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        p, browser, context = new_context(url, name)
+        page = context.new_page()
+        launch_ms.append((time.perf_counter() - t0) * 1000)
+
+        # First load in this launch is only "cold" without a persistent cache.
+        t0 = time.perf_counter()
+        page.goto(url + "/en/login", wait_until="load")
+        cold_ms.append((time.perf_counter() - t0) * 1000)
+        t0 = time.perf_counter()
+        page.reload(wait_until="load")
+        warm_ms.append((time.perf_counter() - t0) * 1000)
+
+        mb = browser_rss_mb()
+        if mb is not None:
+            rss.append(mb)
+        context.close()
+        browser.close()
+        p.stop()
+    return {
+        "launch_ms": summarize(launch_ms),
+        "first_load_ms": summarize(cold_ms),
+        "reload_ms": summarize(warm_ms),
+        "rss_mb": summarize(rss),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        prog="python -m benchmarks.launch_profiles",
+        description="Launch time, memory and page-load time per launch profile.",
+    )
+    ap.add_argument("--profiles", default="default,ci-fast,fidelity", help=f"any of {sorted(PROFILES)}")
+    ap.add_argument("--reps", type=int, default=5)
+    ap.add_argument("--url", help="page origin to load (default: in-process dashboard stub)")
+    args = ap.parse_args()
+
+    srv = None if args.url else build_server().start()
+    url = args.url or srv.url
+    try:
+        results = {name: bench_profile(name, url, args.reps) for name in args.profiles.split(",")}
+    finally:
+        if srv:
+            srv.stop()
+
+    print(f"{'profile':<12}{'launch p50':>12}{'1st load p50':>14}{'reload p50':>12}{'RSS MB':>10}")
+    for name, r in results.items():
+        rss = r["rss_mb"].get("p50")
+        print(
+            f"{name:<12}{r['launch_ms']['p50']:>12.0f}{r['first_load_ms']['p50']:>14.0f}"
+            f"{r['reload_ms']['p50']:>12.0f}{rss if rss is not None else float('nan'):>10.0f}"
+        )
+    print(f"\nResults: {write_results('launch_profiles', {'url': url, 'reps': args.reps, 'profiles': results})}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+# Framework-wide pytest plugins, shared by customer_app and dashboard_app.
+pytest_plugins = [
+    "shared.plugins.browser",
+    "shared.plugins.matrix",
+    "shared.plugins.network",
+    "shared.plugins.retry",
+    "shared.plugins.preflight",
+    "shared.plugins.timings",
+    "shared.plugins.results",
+    "shared.plugins.report",
+    "shared.plugins.artifacts",
+    "shared.plugins.api_checks",
+]
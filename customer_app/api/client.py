@@ -1,2 +1,139 @@
-# Placeholder for API client helpers (requests/httpx).
-# Keep API logic app-specific (customer vs dashboard).
+from __future__ import annotations
+
+import itertools
+import ssl
+from typing import Any, TypeVar
+
+import certifi
+import httpx
+
+from shared.core.config import settings
+from shared.core.errors import ApiStatusError, ReachabilityError
+from . import endpoints as ep
+from .endpoints import Endpoint
+
+T = TypeVar("T")
+
+POOL_SHARD_SIZE = 8  # connections per httpx pool
+
+
+class CustomerApiClient:
+    """
+    Async client for the customer API with pooled keep-alive connections.
+
+    Open it once and share it between many concurrent checks; it holds no
+    per-user state, so every authenticated call takes its own `token`:
+
+        async with CustomerApiClient() as api:
+            customer = await api.register(user.email, user.password)
+            token = await api.login(user.email, user.password)
+            assert (await api.me(token)).id == customer.id
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        max_connections: int = settings.api_concurrency,
+        timeout_s: float = settings.api_timeout_s,
+    ):
+        base_url = base_url or settings.customer_api_url
+        if not base_url:
+            raise ValueError("CUSTOMER_API_URL is not set (or use CUSTOMER_API_STUB=true)")
+        # httpcore scans its whole pool on every request, which gets quadratic
+        # beyond a few dozen connections; several small pools keep that scan short.
+        shards = max(1, -(-max_connections // POOL_SHARD_SIZE))
+        per_shard = -(-max_connections // shards)
+        tls = ssl.create_default_context(cafile=certifi.where())  # built once, not once per pool
+        self._pools = [
+            httpx.AsyncClient(
+                base_url=base_url,
+                limits=httpx.Limits(max_connections=per_shard, max_keepalive_connections=per_shard),
+                timeout=timeout_s,
+                verify=tls,
+                headers={"User-Agent": "waakia-api-checks", "Accept": "application/json"},
+            )
+            for _ in range(shards)
+        ]
+        self._next_pool = itertools.cycle(self._pools)
+        self.base_url = base_url
+        self.timeout_s = timeout_s
+
+    async def __aenter__(self) -> "CustomerApiClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        for pool in self._pools:
+            await pool.aclose()
+
+    # =========================
+    # Generic calls
+    # =========================
+    async def request(
+        self,
+        endpoint: Endpoint,
+        *,
+        json: Any = None,
+        token: str | None = None,
+        params: dict | None = None,
+        **path: object,
+    ) -> httpx.Response:
+        """Send the call and return the raw response, whatever its status."""
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        try:
+            return await next(self._next_pool).request(
+                endpoint.method, endpoint.url(**path), json=json, params=params, headers=headers
+            )
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"⏱ {endpoint.name}: no response within {self.timeout_s}s") from e
+        except httpx.TransportError as e:
+            raise ReachabilityError(f"🌐 {endpoint.name}: {self.base_url} unreachable ({e!r})") from e
+
+    async def call(self, endpoint: Endpoint[T], **kwargs: Any) -> T:
+        """Send the call, require one of `endpoint.ok` and parse the body into the endpoint's model."""
+        resp = await self.request(endpoint, **kwargs)
+        if resp.status_code not in endpoint.ok:
+            raise ApiStatusError(
+                f"❌ {endpoint.method} {resp.request.url.path} -> {resp.status_code}, "
+                f"expected {'/'.join(map(str, endpoint.ok))}: {resp.text[:300]}",
+                resp.status_code,
+                resp.text,
+            )
+        return endpoint.parse(resp.json())
+
+    async def expect_status(self, endpoint: Endpoint, status: int, **kwargs: Any) -> dict:
+        """Negative checks: require exactly `status` and return the JSON error body."""
+        resp = await self.request(endpoint, **kwargs)
+        if resp.status_code != status:
+            raise ApiStatusError(
+                f"❌ {endpoint.method} {resp.request.url.path} -> {resp.status_code}, "
+                f"expected {status}: {resp.text[:300]}",
+                resp.status_code,
+                resp.text,
+            )
+        return resp.json() if resp.content else {}
+
+    # =========================
+    # Typed shortcuts
+    # =========================
+    async def health(self) -> ep.Health:
+        return await self.call(ep.HEALTH)
+
+    async def register(self, email: str, password: str, name: str = "", phone: str = "") -> ep.Customer:
+        body = {"email": email, "password": password, "name": name, "phone": phone}
+        return await self.call(ep.REGISTER, json=body)
+
+    async def login(self, email: str, password: str) -> str:
+        token = await self.call(ep.LOGIN, json={"email": email, "password": password})
+        return token.token
+
+    async def me(self, token: str) -> ep.Customer:
+        return await self.call(ep.ME, token=token)
+
+    async def update_me(self, token: str, **fields: str) -> ep.Customer:
+        return await self.call(ep.UPDATE_ME, token=token, json=fields)
+
+    async def get_customer(self, token: str, customer_id: int) -> ep.Customer:
+        return await self.call(ep.GET_CUSTOMER, token=token, id=customer_id)
@@ -1 +1,80 @@
-# Placeholder for API endpoint paths/constants.
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, TypeVar
+from urllib.parse import quote
+
+T = TypeVar("T")
+
+
+# =========================
+# Response models
+# =========================
+@dataclass(frozen=True)
+class Health:
+    status: str
+    app: str = ""
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Health":
+        return cls(status=data["status"], app=data.get("app", ""))
+
+
+@dataclass(frozen=True)
+class Token:
+    token: str
+    expires_in: int
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Token":
+        return cls(token=data["token"], expires_in=int(data["expiresIn"]))
+
+
+@dataclass(frozen=True)
+class Customer:
+    id: int
+    email: str
+    name: str
+    phone: str
+    created_at: str
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Customer":
+        return cls(
+            id=int(data["id"]),
+            email=data["email"],
+            name=data.get("name", ""),
+            phone=data.get("phone", ""),
+            created_at=data["createdAt"],
+        )
+
+
+# =========================
+# Endpoints
+# =========================
+@dataclass(frozen=True)
+class Endpoint(Generic[T]):
+    """
+    One API operation: method, path template and how to read a success body.
+
+    `path` may contain `{name}` placeholders filled by `CustomerApiClient.call(..., name=...)`.
+    `ok` lists the statuses that count as success; `auth` sends the bearer token.
+    """
+
+    name: str
+    method: str
+    path: str
+    parse: Callable[[Any], T]
+    ok: tuple[int, ...] = (200,)
+    auth: bool = False
+
+    def url(self, **params: object) -> str:
+        return self.path.format(**{k: quote(str(v), safe="") for k, v in params.items()})
+
+
+HEALTH = Endpoint("health", "GET", "/api/health", Health.from_json)
+REGISTER = Endpoint("register", "POST", "/api/customers", Customer.from_json, ok=(201,))
+LOGIN = Endpoint("login", "POST", "/api/auth/token", Token.from_json)
+ME = Endpoint("me", "GET", "/api/me", Customer.from_json, auth=True)
+UPDATE_ME = Endpoint("update_me", "PATCH", "/api/me", Customer.from_json, auth=True)
+GET_CUSTOMER = Endpoint("get_customer", "GET", "/api/customers/{id}", Customer.from_json, auth=True)
@@ -1,12 +1,36 @@
+import json
+import urllib.request
+
 import pytest
-from shared.core.browser_factory import new_context
 from shared.core.config import settings
 
-@pytest.fixture(scope="function")
-def page():
-    p, browser, context = new_context(settings.customer_base_url)
-    page = context.new_page()
-    yield page
-    context.close()
-    browser.close()
-    p.stop()
+
+def _stub_running(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(f"{url}/api/health", timeout=1) as resp:
+            return json.load(resp).get("app") == "customer-api-stub"
+    except OSError:
+        return False
+
+
+def pytest_configure(config):
+    # Start the customer API stand-in once per run (controller only under xdist);
+    # reuse one that is already running, e.g. `python -m customer_app.stub`.
+    if not settings.customer_api_stub or hasattr(config, "workerinput"):
+        return
+    if _stub_running(settings.customer_api_url):
+        return
+    from customer_app.stub import build_server
+
+    config._customer_api_stub = build_server(port=settings.customer_api_stub_port).start()
+
+
+def pytest_unconfigure(config):
+    srv = getattr(config, "_customer_api_stub", None)
+    if srv is not None:
+        srv.stop()
+
+
+@pytest.fixture(scope="session")
+def app_base_url() -> str:
+    return settings.customer_base_url
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import re
+import secrets
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from shared.stub import Request, Response, StubServer
+
+USERS_FILE = Path(__file__).resolve().parents[1] / "configs" / "testdata" / "customer_users.json"
+
+TOKEN_TTL_S = 3600
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+class CustomerStore:
+    """In-memory customers and bearer tokens, seeded with the users from customer_users.json."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_id: dict[int, dict] = {}
+        self._by_email: dict[str, dict] = {}
+        self._tokens: dict[str, int] = {}
+        for user in json.loads(USERS_FILE.read_text(encoding="utf-8")).values():
+            self.create(user["username"], user["password"])
+
+    def create(self, email: str, password: str, name: str = "", phone: str = "") -> dict | None:
+        with self._lock:
+            if email.lower() in self._by_email:
+                return None
+            row = {
+                "id": len(self._by_id) + 1,
+                "email": email,
+                "password": password,
+                "name": name,
+                "phone": phone,
+                "createdAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self._by_id[row["id"]] = row
+            self._by_email[email.lower()] = row
+            return row
+
+    def authenticate(self, email: str, password: str) -> str | None:
+        with self._lock:
+            row = self._by_email.get(email.lower())
+            if row is None or row["password"] != password:
+                return None
+            token = secrets.token_urlsafe(24)
+            self._tokens[token] = row["id"]
+            return token
+
+    def by_token(self, req: Request) -> dict | None:
+        auth = req.headers.get("authorization", "")
+        if not auth.startswith("Bearer "):
+            return None
+        with self._lock:
+            return self._by_id.get(self._tokens.get(auth[7:], 0))
+
+    def get(self, customer_id: int) -> dict | None:
+        with self._lock:
+            return self._by_id.get(customer_id)
+
+    def update(self, row: dict, fields: dict) -> dict:
+        with self._lock:
+            row.update(fields)
+            return row
+
+
+def _public(row: dict) -> dict:
+    return {k: v for k, v in row.items() if k != "password"}
+
+
+def build_server(host: str = "127.0.0.1", port: int = 0, latency_ms: int = 0) -> StubServer:
+    """
+    Local stand-in for the customer API.
+
+    Registration, token login and profile endpoints with the validation
+    rules of the real service (email format, 8+ character passwords,
+    digits-only phones, unique emails, customers only see themselves).
+    """
+    srv = StubServer(host, port, latency_ms)
+    store = CustomerStore()
+
+    def _validate(data: dict, partial: bool = False) -> str | None:
+        if not partial or "email" in data:
+            if not _EMAIL_RE.match(data.get("email") or ""):
+                return "A valid email is required"
+        if not partial or "password" in data:
+            if len(data.get("password") or "") < 8:
+                return "Password must be at least 8 characters"
+        phone = data.get("phone") or ""
+        if phone and not phone.isdigit():
+            return "Phone must contain digits only"
+        return None
+
+    @srv.route("GET", "/api/health")
+    def health(req: Request) -> Response:
+        return Response.json({"status": "ok", "app": "customer-api-stub"})
+
+    @srv.route("POST", "/api/customers")
+    def register(req: Request) -> Response:
+        data = req.json() or {}
+        error = _validate(data)
+        if error:
+            return Response.json({"error": error}, status=422)
+        row = store.create(data["email"], data["password"], data.get("name") or "", data.get("phone") or "")
+        if row is None:
+            return Response.json({"error": "Email is already registered"}, status=409)
+        return Response.json(_public(row), status=201)
+
+    @srv.route("POST", "/api/auth/token")
+    def login(req: Request) -> Response:
+        data = req.json() or {}
+        token = store.authenticate(data.get("email") or "", data.get("password") or "")
+        if token is None:
+            return Response.json({"error": "Invalid email or password"}, status=401)
+        return Response.json({"token": token, "expiresIn": TOKEN_TTL_S})
+
+    @srv.route("GET", "/api/me")
+    def me(req: Request) -> Response:
+        row = store.by_token(req)
+        if row is None:
+            return Response.json({"error": "unauthorized"}, status=401)
+        return Response.json(_public(row))
+
+    @srv.route("PATCH", "/api/me")
+    def update_me(req: Request) -> Response:
+        row = store.by_token(req)
+        if row is None:
+            return Response.json({"error": "unauthorized"}, status=401)
+        data = {k: v for k, v in (req.json() or {}).items() if k in ("name", "phone")}
+        error = _validate(data, partial=True)
+        if error:
+            return Response.json({"error": error}, status=422)
+        return Response.json(_public(store.update(row, data)))
+
+    @srv.route("GET", "/api/customers/*")
+    def get_customer(req: Request) -> Response:
+        row = store.by_token(req)
+        if row is None:
+            return Response.json({"error": "unauthorized"}, status=401)
+        raw_id = req.path.rsplit("/", 1)[-1]
+        target = store.get(int(raw_id)) if raw_id.isdigit() else None
+        if target is None:
+            return Response.json({"error": "not found"}, status=404)
+        if target["id"] != row["id"]:
+            return Response.json({"error": "forbidden"}, status=403)
+        return Response.json(_public(target))
+
+    return srv
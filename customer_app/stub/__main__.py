@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import argparse
+
+from shared.core.config import settings
+from . import build_server
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="python -m customer_app.stub", description="Local customer API stand-in.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=settings.customer_api_stub_port)
+    ap.add_argument("--latency-ms", type=int, default=0, help="delay added to every response")
+    args = ap.parse_args()
+
+    srv = build_server(args.host, args.port, args.latency_ms)
+    print(f"🧪 Customer API stub on {srv.url}  (health: {srv.url}/api/health)")
+    srv.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import pytest
+
+from customer_app.api import endpoints as ep
+from customer_app.api.client import CustomerApiClient
+from shared.core.api_checks import api_check
+from shared.core.config import settings
+from shared.data.faker_utils import random_phone
+from shared.data.generators import generate_user
+
+# Every check below runs concurrently with the others in this module, on one
+# event loop and one pooled client. Run the tier on its own with `pytest -m api`.
+pytestmark = [
+    pytest.mark.customer,
+    pytest.mark.skipif(not settings.customer_api_url, reason="CUSTOMER_API_URL not set (or CUSTOMER_API_STUB=true)"),
+]
+
+
+@api_check(CustomerApiClient)
+async def check_health(api: CustomerApiClient):
+    assert (await api.health()).status == "ok"
+
+
+@api_check(CustomerApiClient, cases=range(200))
+async def check_register_login_me(api: CustomerApiClient, case: int):
+    user = generate_user()
+    phone = random_phone()
+    customer = await api.register(user.email, user.password, name=f"API Customer {case}", phone=phone)
+    token = await api.login(user.email, user.password)
+    me = await api.me(token)
+    assert me == customer, f"❌ /api/me returned {me}, registered {customer}"
+    assert me.phone == phone
+
+
+@api_check(CustomerApiClient, cases=range(50))
+async def check_update_profile(api: CustomerApiClient, case: int):
+    user = generate_user()
+    await api.register(user.email, user.password)
+    token = await api.login(user.email, user.password)
+    updated = await api.update_me(token, name=f"Renamed {case}")
+    assert updated.name == f"Renamed {case}"
+    assert (await api.me(token)).name == updated.name
+
+
+@api_check(CustomerApiClient)
+async def check_duplicate_email_rejected(api: CustomerApiClient):
+    user = generate_user()
+    await api.register(user.email, user.password)
+    await api.expect_status(ep.REGISTER, 409, json={"email": user.email.upper(), "password": user.password})
+
+
+@api_check(
+    CustomerApiClient,
+    cases=[
+        {"email": "not-an-email", "password": "Password123!"},
+        {"email": "", "password": "Password123!"},
+        {"email": generate_user().email, "password": "short"},
+        {"email": generate_user().email, "password": "Password123!", "phone": "98-12"},
+    ],
+    ids=["bad-email", "no-email", "short-password", "bad-phone"],
+)
+async def check_invalid_registration(api: CustomerApiClient, case: dict):
+    body = await api.expect_status(ep.REGISTER, 422, json=case)
+    assert body.get("error"), f"❌ 422 without an error message: {body}"
+
+
+@api_check(CustomerApiClient)
+async def check_wrong_password(api: CustomerApiClient):
+    user = generate_user()
+    await api.register(user.email, user.password)
+    await api.expect_status(ep.LOGIN, 401, json={"email": user.email, "password": user.password + "x"})
+
+
+@api_check(CustomerApiClient)
+async def check_me_requires_token(api: CustomerApiClient):
+    await api.expect_status(ep.ME, 401)
+    await api.expect_status(ep.ME, 401, token="not-a-token")
+
+
+@api_check(CustomerApiClient)
+async def check_other_customer_forbidden(api: CustomerApiClient):
+    a, b = generate_user(), generate_user()
+    await api.register(a.email, a.password)
+    other = await api.register(b.email, b.password)
+    token = await api.login(a.email, a.password)
+    await api.expect_status(ep.GET_CUSTOMER, 403, token=token, id=other.id)
+
+
+@api_check(CustomerApiClient)
+async def check_default_customer_login(api: CustomerApiClient):
+    if not settings.customer_user:
+        pytest.skip("CUSTOMER_USER not set")
+    token = await api.login(settings.customer_user, settings.customer_pass)
+    assert (await api.me(token)).email == settings.customer_user
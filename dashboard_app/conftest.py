@@ -1,18 +1,36 @@
+import json
+import urllib.request
+
 import pytest
-from shared.core.browser_factory import new_context
 from shared.core.config import settings
 
 
-@pytest.fixture(scope="function")
-def page():
-    p, browser, context = new_context(settings.customer_base_url)
-    page = context.new_page()
+def _stub_running(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(f"{url}/api/health", timeout=1) as resp:
+            return json.load(resp).get("app") == "dashboard-stub"
+    except OSError:
+        return False
+
+
+def pytest_configure(config):
+    # Start the local stand-in once per run (controller only under xdist);
+    # reuse one that is already running, e.g. `python -m dashboard_app.stub`.
+    if not settings.dashboard_stub or hasattr(config, "workerinput"):
+        return
+    if _stub_running(settings.dashboard_base_url):
+        return
+    from dashboard_app.stub import build_server
+
+    config._dashboard_stub = build_server(port=settings.stub_port).start()
+
 
-    #  REQUIRED for BasePage.goto() resolver
-    page.base_url = settings.customer_base_url
+def pytest_unconfigure(config):
+    srv = getattr(config, "_dashboard_stub", None)
+    if srv is not None:
+        srv.stop()
 
-    yield page
 
-    context.close()
-    browser.close()
-    p.stop()
+@pytest.fixture(scope="session")
+def app_base_url() -> str:
+    return settings.dashboard_base_url
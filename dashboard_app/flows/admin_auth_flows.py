@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dashboard_app.pages.admin_login_page import AdminLoginPage
 from shared.core.config import settings
+from shared.core.steps import step
 
 
 class AdminAuthFlows:
@@ -10,7 +11,8 @@ class AdminAuthFlows:
 
     def login_super_admin(self) -> None:
         # Use .env credentials (don’t hardcode)
-        self.login_page.login(
-            email_or_phone=settings.admin_user,
-            password=settings.admin_pass,
-        )
+        with step("admin.login"):
+            self.login_page.login(
+                email_or_phone=settings.admin_user,
+                password=settings.admin_pass,
+            )
@@ -9,8 +9,9 @@ class CategoryManagementFlows:
         self.page = page
         self.cm = CategoryManagementPage(page)
 
-    def add_categories_with_image_and_service_type(self) -> None:
-        self.cm.go_to_categories()
+    def add_categories_with_image_and_service_type(self, via: str | None = None) -> None:
+        # via="menu" for tests that cover the sidebar; otherwise a direct deep link
+        self.cm.open_route(via)
         self.cm.assert_on_category_management()
         self.cm.assert_table_headers()
 
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from playwright.sync_api import Page
+
+from dashboard_app.flows.admin_auth_flows import AdminAuthFlows
+from dashboard_app.pages.category_management_page import CategoryManagementPage
+from shared.core.steps import step
+from shared.load import think
+
+
+# Scenarios for `python -m shared.load`. Each one is a single user journey;
+# wrap every stage in step() so it shows up in the latency summary.
+
+def admin_login(page: Page) -> None:
+    AdminAuthFlows(page).login_super_admin()
+
+
+def admin_categories(page: Page) -> None:
+    AdminAuthFlows(page).login_super_admin()
+    think()
+
+    cm = CategoryManagementPage(page)
+    with step("categories.open"):
+        cm.go_to_categories()
+        cm.assert_on_category_management()
+    think()
+
+    with step("categories.headers"):
+        cm.assert_table_headers()
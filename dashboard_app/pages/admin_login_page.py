@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import weakref
 from pathlib import Path
+from playwright.sync_api import BrowserContext
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import Error as PlaywrightError
 
 from shared.core.base_page import BasePage
 from shared.core.config import settings
+from shared.core.errors import ElementNotFoundError, ReachabilityError
+from shared.core.timeouts import timeouts
+
+# Context -> credentials of the admin session it holds; a retried test logging in
+# again as the same user skips the form, anyone else goes through it.
+_authenticated: "weakref.WeakKeyDictionary[BrowserContext, tuple[str, str]]" = weakref.WeakKeyDictionary()
 
 
 class AdminLoginPage(BasePage):
@@ -13,27 +21,39 @@ class AdminLoginPage(BasePage):
     INPUT_PASSWORD = '//input[@placeholder="Enter your password"]'
     BTN_LOGIN = '//button[normalize-space()="Login"]'
 
+    # "Poor" thresholds from Core Web Vitals guidance: crossing them fails the test
+    PERF_BUDGET = {"ttfb": 1800, "fcp": 3000, "lcp": 4000, "cls": 0.25}
+
+    @property
+    def base_url(self) -> str:
+        # The fixture / load runner put the context's base URL on the page; fall back to settings.
+        return (getattr(self.page, "base_url", None) or settings.dashboard_base_url).rstrip("/")
+
+    @property
+    def dashboard_url(self) -> str:
+        return f"{self.base_url}/en/dashboard/admin"
+
     def open(self) -> None:
-        base = settings.dashboard_base_url.rstrip("/")
-        dashboard_url = f"{base}/en/dashboard/admin"
+        base = self.base_url
+        dashboard_url = self.dashboard_url
         fallback_login_url = f"{base}/en/login"
 
-        # Debug listeners (optional)
-        self.page.on("console", lambda msg: print(f"[BROWSER:{msg.type}] {msg.text}"))
-        self.page.on("pageerror", lambda err: print(f"[PAGEERROR] {err}"))
-        self.page.on("requestfailed", lambda req: print(f"[REQFAILED] {req.url} -> {req.failure}"))
+        # Console / page errors / failed requests are buffered by the NetworkCollector
+        # attached in BasePage and reported only when the test fails.
 
         try:
             print(f"🌐 Opening dashboard: {dashboard_url}")
-            self.page.goto(dashboard_url, wait_until="domcontentloaded", timeout=60000)
+            with timeouts.window_for("login.open", 60000) as t:
+                self.page.goto(dashboard_url, wait_until="domcontentloaded", timeout=t)
         except PlaywrightError as e:
             print(f"⚠️ Dashboard open failed: {e}")
             print(f"🌐 Trying fallback login URL: {fallback_login_url}")
             try:
-                self.page.goto(fallback_login_url, wait_until="domcontentloaded", timeout=60000)
+                with timeouts.window_for("login.open", 60000) as t:
+                    self.page.goto(fallback_login_url, wait_until="domcontentloaded", timeout=t)
             except PlaywrightError as e2:
                 shot = self.screenshot("dashboard_open_net_failed")
-                raise AssertionError(
+                raise ReachabilityError(
                     "❌ Network/Reachability issue.\n\n"
                     f"Dashboard URL failed: {dashboard_url}\n"
                     f"Fallback URL failed: {fallback_login_url}\n\n"
@@ -43,25 +63,51 @@ class AdminLoginPage(BasePage):
                 )
 
         try:
-            self.page.locator(self.INPUT_EMAIL_OR_PHONE).wait_for(state="visible", timeout=20000)
+            with timeouts.window_for("login.form_visible", 20000) as t:
+                self.locator(self.INPUT_EMAIL_OR_PHONE).wait_for(state="visible", timeout=t)
         except PlaywrightTimeoutError:
             shot = self.screenshot("login_form_not_found")
-            raise AssertionError(
+            raise ElementNotFoundError(
                 "❌ Open succeeded but login form not visible.\n"
                 f"Current URL: {self.page.url}\n"
                 f"Screenshot: {Path(shot).resolve()}"
             )
 
+        self.measure_load()
+
     def login(self, email_or_phone: str, password: str) -> None:
+        identity = (email_or_phone, password)
+        if self._resume_session(identity):
+            return
         self.open()
-        self.page.locator(self.INPUT_EMAIL_OR_PHONE).fill(email_or_phone)
-        self.page.locator(self.INPUT_PASSWORD).fill(password)
-        self.page.locator(self.BTN_LOGIN).click()
-        self._verify_login_result()
+        self.locator(self.INPUT_EMAIL_OR_PHONE).fill(email_or_phone)
+        self.locator(self.INPUT_PASSWORD).fill(password)
+        self.locator(self.BTN_LOGIN).click()
+        self._verify_login_result(identity)
+
+    def _resume_session(self, identity: tuple[str, str]) -> bool:
+        context = self.page.context
+        held = _authenticated.get(context)
+        if held is None:
+            return False
+        if held != identity:
+            # Another user's session: drop it so the form is shown and verified.
+            _authenticated.pop(context, None)
+            context.clear_cookies()
+            return False
+        with timeouts.window_for("login.open", 60000) as t:
+            self.page.goto(self.dashboard_url, wait_until="domcontentloaded", timeout=t)
+        if "/login" not in self.page.url:
+            print("🔑 Reusing authenticated session")
+            return True
+        _authenticated.pop(context, None)  # session expired server-side
+        return False
 
-    def _verify_login_result(self) -> None:
+    def _verify_login_result(self, identity: tuple[str, str]) -> None:
         try:
-            self.page.wait_for_url(lambda url: "/login" not in url, timeout=20000)
+            with timeouts.window_for("login.result", 20000) as t:
+                self.page.wait_for_url(lambda url: "/login" not in url, timeout=t)
+            _authenticated[self.page.context] = identity
             return
         except PlaywrightTimeoutError:
             shot = self.screenshot("dashboard_login_failed")
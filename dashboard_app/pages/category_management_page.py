@@ -10,9 +10,17 @@ from playwright.sync_api import (
 )
 
 from shared.core.base_page import BasePage
+from shared.core.errors import ElementNotFoundError
+from shared.core.navigation import Route
+from shared.core.table import Column, DataTable, parse_datetime, parse_int
+from shared.core.timeouts import timeouts
+from shared.data.assets import IMAGES_DIR, ImageAsset, get_catalog
 
 
 class CategoryManagementPage(BasePage):
+    PERF_BUDGET = {"fcp": 3000, "lcp": 4000, "cls": 0.25, "tbt": 600}
+    VISUAL_MASKS = ("//tbody",)  # row data changes with every created category
+
     # =========================
     # Navigation
     # =========================
@@ -21,6 +29,16 @@ class CategoryManagementPage(BasePage):
     LNK_CATEGORIES_2 = "//a[.//span[text()='Categories']]"
     H1_CATEGORY_MGMT = "//h1[normalize-space()='Category Management']"
 
+    ROUTE = Route(
+        "dashboard.categories",
+        "/en/dashboard/admin/category-management/categories",
+        ready=H1_CATEGORY_MGMT,
+        menu="go_to_categories",
+        # Deep link not yet confirmed on QA: reached through the menu unless a test
+        # asks for via="direct", and then given up on quickly.
+        direct_timeout_ms=10000,
+    )
+
     # =========================
     # Headers (Assertions)
     # =========================
@@ -34,6 +52,22 @@ class CategoryManagementPage(BasePage):
     TH_CREATED_AT = "//th//button[normalize-space()='Created At']"
     TH_ACTIONS = "//th[normalize-space()='Actions']"
 
+    # =========================
+    # Table (bulk reads)
+    # =========================
+    TABLE_CATEGORIES = "//table[.//th[normalize-space()='S/N']]"
+    BTN_NEXT_PAGE = "//button[@aria-label='Next page']"
+    CATEGORY_COLUMNS = (
+        Column("sn", "S/N", parse_int),
+        Column("service_type", "Service Type"),
+        Column("name", "Category Name"),
+        Column("description", "Description"),
+        Column("status", "Status"),
+        Column("created_by", "Created By"),
+        Column("last_updated_by", "Last Updated By"),
+        Column("created_at", "Created At", parse_datetime),
+    )
+
     # =========================
     # Row actions / menus (kept for flow compatibility)
     # =========================
@@ -65,52 +99,62 @@ class CategoryManagementPage(BasePage):
     # =========================
     def go_to_categories(self) -> None:
         # Step 1: click Category Management
-        self.page.locator(self.LNK_CATEGORY_MGMT).click()
+        self.locator(self.LNK_CATEGORY_MGMT).click()
 
-        # Step 2: click Categories
-        if self.page.locator(self.LNK_CATEGORIES_1).count() > 0:
-            self.page.locator(self.LNK_CATEGORIES_1).click()
-        else:
-            self.page.locator(self.LNK_CATEGORIES_2).click()
+        # Step 2: click Categories (whichever link variant the menu renders)
+        self.locator(self.LNK_CATEGORIES_1).or_(self.locator(self.LNK_CATEGORIES_2)).first.click()
 
     def assert_on_category_management(self) -> None:
         # Step 3
-        expect(self.page.locator(self.H1_CATEGORY_MGMT)).to_be_visible(timeout=20000)
+        with timeouts.window_for("categories.heading", 20000) as t:
+            expect(self.locator(self.H1_CATEGORY_MGMT)).to_be_visible(timeout=t)
         print("We reached on Category Management")
 
     def assert_table_headers(self) -> None:
         # Step 4
-        expect(self.page.locator(self.TH_SN)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_SERVICE_TYPE)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_CATEGORY_NAME)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_DESCRIPTION)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_STATUS)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_CREATED_BY)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_LAST_UPDATED_BY)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_CREATED_AT)).to_be_visible(timeout=20000)
-        expect(self.page.locator(self.TH_ACTIONS)).to_be_visible(timeout=20000)
+        with timeouts.window_for("categories.headers", 20000) as t:
+            expect(self.locator(self.TH_SN)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_SERVICE_TYPE)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_CATEGORY_NAME)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_DESCRIPTION)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_STATUS)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_CREATED_BY)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_LAST_UPDATED_BY)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_CREATED_AT)).to_be_visible(timeout=t)
+            expect(self.locator(self.TH_ACTIONS)).to_be_visible(timeout=t)
+
+    def categories_table(self) -> DataTable:
+        return DataTable(self.page, self.TABLE_CATEGORIES, self.CATEGORY_COLUMNS, self.BTN_NEXT_PAGE)
+
+    def sort_by(self, header: str) -> None:
+        """Click a sortable header and wait for the table to re-render."""
+        # Role lookup instead of an XPath literal: header text may contain quotes.
+        button = self.locator("th").get_by_role("button", name=header, exact=True)
+        self.categories_table().after(button.click, "categories.sort")
 
     # =========================
     # ✅ Methods REQUIRED by your flow (don’t remove)
     # =========================
     def open_first_row_actions(self) -> None:
-        actions = self.page.locator(self.BTN_ACTIONS)
+        actions = self.locator(self.BTN_ACTIONS)
         if actions.count() == 0:
             print("ℹ️ Actions button not found (skipping open_first_row_actions)")
             return
         try:
-            expect(actions.first).to_be_visible(timeout=8000)
+            with timeouts.window_for("categories.row_actions", 8000) as t:
+                expect(actions.first).to_be_visible(timeout=t)
             actions.first.click()
         except Exception:
             print("ℹ️ Unable to click Actions (skipping)")
 
     def click_view_subcategories(self) -> None:
-        menu = self.page.locator(self.MENU_VIEW_SUBCATEGORIES)
+        menu = self.locator(self.MENU_VIEW_SUBCATEGORIES)
         if menu.count() == 0:
             print("ℹ️ View Subcategories not found (skipping click_view_subcategories)")
             return
         try:
-            expect(menu).to_be_visible(timeout=8000)
+            with timeouts.window_for("categories.view_subcategories", 8000) as t:
+                expect(menu).to_be_visible(timeout=t)
             menu.click()
         except Exception:
             print("ℹ️ Unable to click View Subcategories (skipping)")
@@ -121,32 +165,27 @@ class CategoryManagementPage(BasePage):
     def _frames(self) -> Iterable[Frame]:
         return self.page.frames
 
-    def _pick_image(self, images_dir: Path) -> Path:
-        images_dir = images_dir.resolve()
-        if not images_dir.exists():
-            raise FileNotFoundError(f"Images folder not found: {images_dir}")
-
-        exts = (".png", ".jpg", ".jpeg", ".webp", ".gif")
-        files = [p for p in images_dir.iterdir() if p.suffix.lower() in exts]
-        if not files:
-            raise FileNotFoundError(f"No image files found in: {images_dir}")
-        return files[0].resolve()
+    def _pick_image(self, images_dir: Path) -> ImageAsset:
+        # Indexed once per directory; skips zero-byte / unreadable fixtures.
+        return get_catalog(images_dir).pick(valid=True)
 
     # =========================
     # Step 7: Click Add Category
     # =========================
     def click_add_category(self) -> None:
-        btn = self.page.locator(self.BTN_ADD_CATEGORY)
-        expect(btn).to_be_visible(timeout=20000)
+        btn = self.locator(self.BTN_ADD_CATEGORY)
+        with timeouts.window_for("categories.add_button", 20000) as t:
+            expect(btn).to_be_visible(timeout=t)
         btn.click()
 
         # Modal opened indicator (from your screenshot)
-        expect(self.page.locator(self.P_CHOOSE_MAIN_IMAGE)).to_be_visible(timeout=20000)
+        with timeouts.window_for("categories.modal", 20000) as t:
+            expect(self.locator(self.P_CHOOSE_MAIN_IMAGE)).to_be_visible(timeout=t)
 
     # =========================
     # Step 8: Upload Main Image (NO OS FILE PICKER)
     # =========================
-    def upload_main_image(self, images_dir: Path) -> Path:
+    def upload_main_image(self, images_dir: Path = IMAGES_DIR, payload: dict | None = None) -> Path:
         """
         IMPORTANT:
         Do NOT click the dropzone because that opens Windows "Browse" dialog.
@@ -155,16 +194,24 @@ class CategoryManagementPage(BasePage):
         In your modal there are 2 uploaders:
         0 -> Category Main Image
         1 -> Category Banner Image
+
+        Files are sent as in-memory buffers. Pass `payload` (e.g. from
+        `synthetic_image_payload`) to upload a generated image instead of a fixture.
         """
-        file_path = self._pick_image(images_dir)
+        if payload is None:
+            asset = self._pick_image(images_dir)
+            payload, file_path = asset.payload(), asset.path
+        else:
+            file_path = Path(payload["name"])
 
         # Wait file inputs to exist inside modal
-        file_inputs = self.page.locator("input[type='file']")
+        file_inputs = self.locator("input[type='file']")
         try:
-            file_inputs.first.wait_for(state="attached", timeout=15000)
+            with timeouts.window_for("categories.file_input", 15000) as t:
+                file_inputs.first.wait_for(state="attached", timeout=t)
         except PlaywrightTimeoutError:
             shot = self.screenshot("file_inputs_not_found")
-            raise AssertionError(
+            raise ElementNotFoundError(
                 "❌ input[type=file] not found in Add New Category modal.\n"
                 f"URL: {self.page.url}\n"
                 f"Screenshot: {Path(shot).resolve()}"
@@ -173,7 +220,7 @@ class CategoryManagementPage(BasePage):
         count = file_inputs.count()
         if count == 0:
             shot = self.screenshot("file_inputs_count_zero")
-            raise AssertionError(
+            raise ElementNotFoundError(
                 "❌ input[type=file] count is 0.\n"
                 f"URL: {self.page.url}\n"
                 f"Screenshot: {Path(shot).resolve()}"
@@ -181,13 +228,13 @@ class CategoryManagementPage(BasePage):
 
         # Use first input for MAIN IMAGE
         try:
-            file_inputs.nth(0).set_input_files(str(file_path))
+            file_inputs.nth(0).set_input_files(payload)
             print(f"✅ Uploaded MAIN image: {file_path.name}")
             return file_path
         except Exception:
             # fallback: some UIs reverse ordering, try second
             if count > 1:
-                file_inputs.nth(1).set_input_files(str(file_path))
+                file_inputs.nth(1).set_input_files(payload)
                 print(f"✅ Uploaded MAIN image via 2nd input: {file_path.name}")
                 return file_path
 
@@ -202,20 +249,23 @@ class CategoryManagementPage(BasePage):
     # Step 9: Service Type
     # =========================
     def select_service_type_digital_services(self) -> None:
-        cmb = self.page.locator(self.CMB_SERVICE_TYPE)
-        expect(cmb).to_be_visible(timeout=20000)
+        cmb = self.locator(self.CMB_SERVICE_TYPE)
+        with timeouts.window_for("categories.service_type", 20000) as t:
+            expect(cmb).to_be_visible(timeout=t)
         cmb.click()
 
-        opt = self.page.locator(self.OPT_DIGITAL_SERVICES)
-        expect(opt).to_be_visible(timeout=20000)
+        opt = self.locator(self.OPT_DIGITAL_SERVICES)
+        with timeouts.window_for("categories.service_type_option", 20000) as t:
+            expect(opt).to_be_visible(timeout=t)
         opt.click()
 
     # =========================
     # Step 10: Names
     # =========================
     def enter_service_names(self, names: list[str]) -> None:
-        inp = self.page.locator(self.INPUT_CATEGORY_NAMES)
-        expect(inp).to_be_visible(timeout=20000)
+        inp = self.locator(self.INPUT_CATEGORY_NAMES)
+        with timeouts.window_for("categories.names_input", 20000) as t:
+            expect(inp).to_be_visible(timeout=t)
 
         for name in names:
             inp.fill(name)
@@ -225,6 +275,7 @@ class CategoryManagementPage(BasePage):
     # Step 11: Save
     # =========================
     def save_category(self) -> None:
-        btn = self.page.locator(self.BTN_SAVE_CATEGORY)
-        expect(btn).to_be_visible(timeout=20000)
+        btn = self.locator(self.BTN_SAVE_CATEGORY)
+        with timeouts.window_for("categories.save", 20000) as t:
+            expect(btn).to_be_visible(timeout=t)
         btn.click()
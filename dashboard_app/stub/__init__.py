@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from shared.stub import Request, Response, StubServer
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+SESSION_COOKIE = "stub_admin_session"
+MAX_IMAGE_BYTES = 2 * 1024 * 1024
+SERVICE_TYPES = ("Digital Services", "Financial Services")
+
+
+class CategoryStore:
+    """In-memory Category Management data, seeded so the table has several pages."""
+
+    def __init__(self, seed_rows: int = 25):
+        self._lock = threading.Lock()
+        self._items: list[dict] = []
+        base = datetime(2025, 1, 1, 9, 0, 0)
+        for i in range(seed_rows):
+            self._items.append({
+                "id": i + 1,
+                "serviceType": SERVICE_TYPES[i % 2],
+                "name": f"Seed Category {i + 1:03d}",
+                "description": f"Seeded row {i + 1}",
+                "status": "Active" if i % 3 else "Inactive",
+                "createdBy": "seed@example.com",
+                "lastUpdatedBy": "seed@example.com",
+                "createdAt": (base + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S"),
+            })
+
+    def page(self, page: int, size: int, sort: str = "") -> dict:
+        with self._lock:
+            items = list(self._items)
+        if sort:
+            key = sort.lstrip("-")
+            items.sort(key=lambda c: str(c.get(key, "")), reverse=sort.startswith("-"))
+        start = (page - 1) * size
+        return {"items": items[start:start + size], "total": len(items), "page": page, "size": size}
+
+    def add(self, service_type: str, names: list[str], user: str) -> list[dict]:
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        created = []
+        with self._lock:
+            for name in names:
+                row = {
+                    "id": len(self._items) + 1,
+                    "serviceType": service_type,
+                    "name": name,
+                    "description": "",
+                    "status": "Active",
+                    "createdBy": user,
+                    "lastUpdatedBy": user,
+                    "createdAt": now,
+                }
+                self._items.append(row)
+                created.append(row)
+        return created
+
+
+def build_server(host: str = "127.0.0.1", port: int = 0, latency_ms: int = 0) -> StubServer:
+    """
+    Local stand-in for the admin dashboard.
+
+    Serves the login form and the Category Management screen with the same
+    markup the page objects target (placeholders, button labels, th/button
+    headers, role=combobox/option), backed by mock JSON endpoints.
+    """
+    srv = StubServer(host, port, latency_ms)
+    store = CategoryStore()
+    sessions: dict[str, str] = {}
+    login_html = (STATIC_DIR / "login.html").read_text(encoding="utf-8")
+    admin_html = (STATIC_DIR / "admin.html").read_text(encoding="utf-8")
+
+    srv.static("/static", STATIC_DIR)
+
+    def _user(req: Request) -> str | None:
+        return sessions.get(req.cookies.get(SESSION_COOKIE, ""))
+
+    @srv.route("GET", "/api/health")
+    def health(req: Request) -> Response:
+        return Response.json({"status": "ok", "app": "dashboard-stub"})
+
+    @srv.route("GET", "/en/login")
+    def login_page(req: Request) -> Response:
+        return Response.html(login_html)
+
+    @srv.route("GET", "/en/dashboard/admin")
+    @srv.route("GET", "/en/dashboard/admin/*")
+    def admin_page(req: Request) -> Response:
+        if _user(req) is None:
+            return Response.redirect("/en/login")
+        return Response.html(admin_html)
+
+    @srv.route("POST", "/api/auth/login")
+    def login(req: Request) -> Response:
+        data = req.json() or {}
+        identifier = (data.get("identifier") or "").strip()
+        if not identifier or not data.get("password"):
+            return Response.json({"error": "Email/phone and password are required"}, status=401)
+        token = f"s{len(sessions) + 1}-{threading.get_ident()}"
+        sessions[token] = identifier
+        return Response.json(
+            {"user": identifier},
+            **{"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"},
+        )
+
+    @srv.route("POST", "/api/auth/logout")
+    def logout(req: Request) -> Response:
+        sessions.pop(req.cookies.get(SESSION_COOKIE, ""), None)
+        return Response.json({"ok": True}, **{"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+
+    @srv.route("GET", "/api/categories")
+    def list_categories(req: Request) -> Response:
+        if _user(req) is None:
+            return Response.json({"error": "unauthorized"}, status=401)
+        page = max(1, int(req.arg("page", "1")))
+        size = min(100, max(1, int(req.arg("size", "10"))))
+        return Response.json(store.page(page, size, req.arg("sort", "")))
+
+    @srv.route("POST", "/api/categories")
+    def create_categories(req: Request) -> Response:
+        user = _user(req)
+        if user is None:
+            return Response.json({"error": "unauthorized"}, status=401)
+        data = req.json() or {}
+        image = data.get("mainImage")
+        if not image or not image.get("size"):
+            return Response.json({"error": "Main image is required"}, status=422)
+        if image["size"] > MAX_IMAGE_BYTES:
+            return Response.json({"error": "Image must be 2MB or smaller"}, status=413)
+        if data.get("serviceType") not in SERVICE_TYPES:
+            return Response.json({"error": "Service type is required"}, status=422)
+        names = [n for n in data.get("names") or [] if n.strip()]
+        if not names:
+            return Response.json({"error": "At least one category name is required"}, status=422)
+        return Response.json({"created": store.add(data["serviceType"], names, user)}, status=201)
+
+    return srv
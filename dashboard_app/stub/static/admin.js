@@ -0,0 +1,142 @@
+(() => {
+  const CATEGORIES_PATH = "/en/dashboard/admin/category-management/categories";
+  const $ = (sel) => document.querySelector(sel);
+
+  // ---------- sidebar ----------
+  const mgmt = $("#nav-category-management");
+  mgmt.querySelector(":scope > span").addEventListener("click", () => {
+    const sub = mgmt.querySelector(".submenu");
+    sub.hidden = !sub.hidden;
+  });
+
+  const onCategories = window.location.pathname.startsWith(CATEGORIES_PATH);
+  $("#home").hidden = onCategories;
+  $("#categories").hidden = !onCategories;
+  if (!onCategories) return;
+  mgmt.querySelector(".submenu").hidden = false;
+
+  // ---------- table ----------
+  const state = {page: 1, size: 10, sort: "", total: 0};
+
+  async function loadRows() {
+    const q = new URLSearchParams({page: state.page, size: state.size, sort: state.sort});
+    const data = await (await fetch(`/api/categories?${q}`)).json();
+    state.total = data.total;
+    const body = $("#rows");
+    body.replaceChildren(...data.items.map((c, i) => {
+      const tr = document.createElement("tr");
+      const cells = [
+        (state.page - 1) * state.size + i + 1,
+        c.serviceType, c.name, c.description, c.status,
+        c.createdBy, c.lastUpdatedBy, c.createdAt,
+      ];
+      for (const v of cells) {
+        const td = document.createElement("td");
+        td.textContent = v;
+        tr.appendChild(td);
+      }
+      const actions = document.createElement("td");
+      actions.innerHTML = '<button type="button" aria-label="Actions">&#8942;</button>';
+      actions.querySelector("button").addEventListener("click", (ev) => openRowMenu(ev.currentTarget, c));
+      tr.appendChild(actions);
+      return tr;
+    }));
+    const pages = Math.max(1, Math.ceil(state.total / state.size));
+    $("#page-info").textContent = `Page ${state.page} of ${pages}`;
+    $("#prev-page").disabled = state.page <= 1;
+    $("#next-page").disabled = state.page >= pages;
+  }
+
+  function openRowMenu(button, category) {
+    document.querySelectorAll(".menu").forEach((m) => m.remove());
+    const menu = document.createElement("div");
+    menu.className = "menu";
+    menu.setAttribute("role", "menu");
+    menu.innerHTML = "<span>View Subcategories</span><span>Edit</span>";
+    menu.firstChild.addEventListener("click", () => {
+      menu.remove();
+      const banner = $("#subcategory-banner");
+      banner.textContent = `Subcategories of ${category.name}`;
+      banner.hidden = false;
+    });
+    button.after(menu);
+  }
+
+  $("#prev-page").addEventListener("click", () => { state.page -= 1; loadRows(); });
+  $("#next-page").addEventListener("click", () => { state.page += 1; loadRows(); });
+  document.querySelectorAll("th button[data-sort]").forEach((b) => b.addEventListener("click", () => {
+    const key = b.dataset.sort;
+    state.sort = state.sort === key ? `-${key}` : key;
+    state.page = 1;
+    loadRows();
+  }));
+
+  // ---------- Add Category modal ----------
+  const form = $("#category-form");
+  const names = [];
+  let serviceType = "";
+
+  function resetForm() {
+    form.reset();
+    names.length = 0;
+    serviceType = "";
+    $("#service-type").textContent = "Select service type";
+    $("#name-chips").replaceChildren();
+    $("#form-error").hidden = true;
+  }
+
+  $("#add-category").addEventListener("click", () => { resetForm(); $("#modal").hidden = false; });
+  $("#cancel-category").addEventListener("click", () => { $("#modal").hidden = true; });
+
+  $("#service-type").addEventListener("click", (ev) => {
+    const list = $("#service-type-options");
+    list.hidden = !list.hidden;
+    ev.currentTarget.setAttribute("aria-expanded", String(!list.hidden));
+  });
+  document.querySelectorAll("#service-type-options [role=option]").forEach((o) => o.addEventListener("click", () => {
+    serviceType = o.textContent.trim();
+    $("#service-type").textContent = serviceType;
+    $("#service-type-options").hidden = true;
+  }));
+
+  const nameInput = form.querySelector("input[placeholder='Enter one or more names']");
+  nameInput.addEventListener("keydown", (ev) => {
+    if (ev.key !== "Enter") return;
+    ev.preventDefault();
+    const v = nameInput.value.trim();
+    if (!v) return;
+    names.push(v);
+    const chip = document.createElement("span");
+    chip.textContent = v;
+    $("#name-chips").appendChild(chip);
+    nameInput.value = "";
+  });
+
+  form.addEventListener("submit", async (ev) => {
+    ev.preventDefault();
+    const file = form.mainImage.files[0];
+    const res = await fetch("/api/categories", {
+      method: "POST",
+      headers: {"Content-Type": "application/json"},
+      body: JSON.stringify({
+        serviceType,
+        names,
+        mainImage: file ? {name: file.name, size: file.size, type: file.type} : null,
+      }),
+    });
+    if (!res.ok) {
+      const err = $("#form-error");
+      err.textContent = (await res.json()).error;
+      err.hidden = false;
+      return;
+    }
+    $("#modal").hidden = true;
+    const toast = $("#toast");
+    toast.textContent = "Category created successfully";
+    toast.hidden = false;
+    setTimeout(() => { toast.hidden = true; }, 3000);
+    loadRows();
+  });
+
+  loadRows();
+})();
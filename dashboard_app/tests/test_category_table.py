@@ -0,0 +1,33 @@
+import pytest
+from dashboard_app.flows.admin_auth_flows import AdminAuthFlows
+from dashboard_app.pages.category_management_page import CategoryManagementPage
+from shared.core.table import assert_all, assert_sorted, assert_unique
+
+
+@pytest.mark.dashboard
+def test_category_table_rows_and_sorting(page):
+    AdminAuthFlows(page).login_super_admin()
+    cm = CategoryManagementPage(page)
+    cm.open_route()
+
+    rows = list(cm.categories_table().iter_rows())
+    assert rows, "❌ Category table is empty"
+    assert_unique(rows, "sn")
+    assert_all(rows, "status is Active or Inactive", lambda r: r["status"] in ("Active", "Inactive"))
+
+    cm.sort_by("Category Name")
+    table = cm.categories_table()
+    descending = table.sort_direction("Category Name") == "descending"
+    assert_sorted(table.rows(), "name", descending=descending, by=str.casefold)
+
+
+@pytest.mark.dashboard
+def test_category_management_visual(page):
+    pytest.importorskip("numpy")
+    pytest.importorskip("PIL")
+    AdminAuthFlows(page).login_super_admin()
+    cm = CategoryManagementPage(page)
+    cm.open_route()
+    cm.assert_table_headers()
+
+    cm.check_visual("categories")
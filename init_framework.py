@@ -111,21 +111,8 @@ def main() -> None:
     """))
 
     # -------------------------
-    # Shared reporting placeholders
+    # Shared reporting helpers
     # -------------------------
-    write_file(ROOT / "shared/reporting/allure_helpers.py", dedent("""\
-        from __future__ import annotations
-
-        # Optional: enable later if you install allure-pytest.
-        # This file is a placeholder for reporting helpers.
-        #
-        # Example (after installing allure-pytest):
-        # import allure
-        #
-        # def attach_text(name: str, text: str):
-        #     allure.attach(text, name=name, attachment_type=allure.attachment_type.TEXT)
-    """))
-
     write_file(ROOT / "shared/reporting/attachments.py", dedent("""\
         from __future__ import annotations
         from pathlib import Path
@@ -236,7 +223,7 @@ def main() -> None:
         WORKDIR /app
         COPY . /app
 
-        RUN pip install --no-cache-dir pytest pytest-xdist python-dotenv playwright \\
+        RUN pip install --no-cache-dir pytest pytest-xdist python-dotenv playwright httpx certifi \\
             && python -m playwright install --with-deps
 
         CMD ["pytest"]
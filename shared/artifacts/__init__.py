@@ -0,0 +1,3 @@
+from .store import ArtifactStore, GcStats, close_store, get_store
+
+__all__ = ["ArtifactStore", "GcStats", "close_store", "get_store"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+
+from shared.core.config import settings
+from shared.reporting.live_report import prune_runs
+from .store import ArtifactStore
+
+# Flat, timestamp-per-file directories that predate the store.
+LEGACY_DIRS = {
+    "screenshot": "artifacts/screenshots",
+    "trace": "artifacts/traces",
+    "log": "reports/logs",
+}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="python -m shared.artifacts", description="Content-addressed artifact store.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    gc = sub.add_parser("gc", help="apply retention now")
+    gc.add_argument("--max-age-days", type=float, default=settings.artifact_max_age_days)
+    gc.add_argument("--max-mb", type=float, default=settings.artifact_max_mb)
+    sub.add_parser("ingest", help="move loose files from the legacy directories into the store")
+    sub.add_parser("stats")
+    find = sub.add_parser("find", help="artifacts of tests whose node id contains TEXT")
+    find.add_argument("text")
+    args = ap.parse_args()
+
+    store = ArtifactStore()
+    if args.command == "gc":
+        s = store.gc(args.max_age_days, args.max_mb)
+        print(f"🧹 {s.refs_removed} ref(s) expired, {s.objects_removed} object(s) removed, "
+              f"{s.bytes_freed / 2**20:.1f} MB freed, {prune_runs(args.max_age_days)} live report run(s) removed")
+    elif args.command == "ingest":
+        for kind, directory in LEGACY_DIRS.items():
+            print(f"{directory}: {store.ingest_dir(directory, kind)} file(s) ingested")
+    elif args.command == "stats":
+        for key, value in store.stats().items():
+            print(f"{key:<18}{value}")
+    else:
+        for nodeid, kind, name, path in store.find(args.text):
+            print(f"{nodeid}  {kind:<10} {name:<30} {path}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
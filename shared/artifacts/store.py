@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from shared.core.config import settings
+
+STORE_DIR = Path("artifacts") / "store"
+
+# Formats that are already compressed gain nothing from gzip.
+TEXT_SUFFIXES = {".txt", ".log", ".json", ".jsonl", ".html", ".xml", ".csv", ".har"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest      TEXT PRIMARY KEY,
+    file        TEXT NOT NULL,
+    raw_bytes   INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL,
+    created     REAL NOT NULL,
+    last_used   REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS refs (
+    digest   TEXT NOT NULL,
+    nodeid   TEXT NOT NULL,
+    name     TEXT NOT NULL,
+    kind     TEXT NOT NULL,
+    created  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS refs_nodeid ON refs(nodeid);
+CREATE INDEX IF NOT EXISTS refs_digest ON refs(digest);
+CREATE INDEX IF NOT EXISTS objects_last_used ON objects(last_used);
+"""
+
+
+@dataclass
+class GcStats:
+    refs_removed: int = 0
+    objects_removed: int = 0
+    bytes_freed: int = 0
+
+
+def _current_test() -> str:
+    return os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0]
+
+
+class ArtifactStore:
+    """
+    Content-addressed artifact storage with an SQLite index.
+
+    Files live at objects/<2 hex>/<sha256><suffix>[.gz]; identical content
+    (e.g. the same error screen captured by every retry) is stored once and
+    referenced many times. Text formats are gzip-compressed. The `refs`
+    table maps tests to their artifacts; `gc` works from the index alone,
+    without walking the object directories.
+    """
+
+    def __init__(self, root: str | Path = STORE_DIR):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Several xdist workers write at once: WAL + busy timeout instead of our own locking.
+        self.db = sqlite3.connect(self.root / "index.db", timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _object_path(self, digest: str, suffix: str) -> Path:
+        gz = ".gz" if suffix.lower() in TEXT_SUFFIXES else ""
+        return self.root / "objects" / digest[:2] / f"{digest}{suffix.lower()}{gz}"
+
+    def put_bytes(self, data: bytes, name: str, kind: str, suffix: str = "", nodeid: str | None = None) -> Path:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest, suffix)
+        now = time.time()
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(data, compresslevel=6) if path.suffix == ".gz" else data)
+            os.replace(tmp, path)  # same content from two workers: last rename wins, both identical
+        with self.db:
+            self.db.execute(
+                "INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(digest) DO UPDATE SET last_used = ?",
+                (digest, str(path.relative_to(self.root)), len(data), path.stat().st_size, now, now, now),
+            )
+            self.db.execute(
+                "INSERT INTO refs VALUES (?, ?, ?, ?, ?)",
+                (digest, nodeid if nodeid is not None else _current_test(), name, kind, now),
+            )
+        return path
+
+    def put_file(self, src: str | Path, kind: str, name: str | None = None, nodeid: str | None = None,
+                 move: bool = True) -> Path:
+        src = Path(src)
+        path = self.put_bytes(src.read_bytes(), name or src.name, kind, src.suffix, nodeid)
+        if move:
+            src.unlink(missing_ok=True)
+        return path
+
+    def read(self, path: str | Path) -> bytes:
+        path = Path(path)
+        data = path.read_bytes()
+        return gzip.decompress(data) if path.suffix == ".gz" else data
+
+    def find(self, nodeid_part: str) -> list[tuple[str, str, str, str]]:
+        rows = self.db.execute(
+            "SELECT r.nodeid, r.kind, r.name, o.file FROM refs r JOIN objects o USING (digest) "
+            "WHERE r.nodeid LIKE ? ORDER BY r.created",
+            (f"%{nodeid_part}%",),
+        )
+        return [(n, k, name, str(self.root / f)) for n, k, name, f in rows]
+
+    def stats(self) -> dict:
+        objects, raw, stored = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_bytes), 0), COALESCE(SUM(stored_bytes), 0) FROM objects"
+        ).fetchone()
+        refs, referenced = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(o.raw_bytes), 0) FROM refs r JOIN objects o USING (digest)"
+        ).fetchone()
+        return {
+            "objects": objects,
+            "refs": refs,
+            "stored_mb": round(stored / 2**20, 2),
+            "raw_mb": round(raw / 2**20, 2),
+            "without_dedup_mb": round(referenced / 2**20, 2),
+        }
+
+    def gc(self, max_age_days: float | None = None, max_total_mb: float | None = None) -> GcStats:
+        """
+        Drop references older than `max_age_days`, then unreferenced objects, then
+        least-recently-used objects until the store fits in `max_total_mb`.
+        """
+        out = GcStats()
+        doomed: list[tuple[str, str, int]] = []
+        with self.db:
+            if max_age_days is not None:
+                cutoff = time.time() - max_age_days * 86400
+                out.refs_removed = self.db.execute("DELETE FROM refs WHERE created < ?", (cutoff,)).rowcount
+            doomed += self.db.execute(
+                "SELECT digest, file, stored_bytes FROM objects WHERE digest NOT IN (SELECT digest FROM refs)"
+            ).fetchall()
+            if max_total_mb is not None:
+                budget = int(max_total_mb * 2**20)
+                gone = {d for d, _, _ in doomed}
+                total = self.db.execute("SELECT COALESCE(SUM(stored_bytes), 0) FROM objects").fetchone()[0]
+                total -= sum(b for _, _, b in doomed)
+                for digest, file, size in self.db.execute(
+                    "SELECT digest, file, stored_bytes FROM objects ORDER BY last_used"
+                ):
+                    if total <= budget:
+                        break
+                    if digest in gone:
+                        continue
+                    doomed.append((digest, file, size))
+                    total -= size
+            digests = [(d,) for d, _, _ in doomed]
+            self.db.executemany("DELETE FROM refs WHERE digest = ?", digests)
+            self.db.executemany("DELETE FROM objects WHERE digest = ?", digests)
+        for _, file, size in doomed:
+            (self.root / file).unlink(missing_ok=True)
+            out.objects_removed += 1
+            out.bytes_freed += size
+        return out
+
+    def ingest_dir(self, directory: str | Path, kind: str) -> int:
+        """Move loose files (e.g. artifacts/screenshots/*.png) into the store."""
+        count = 0
+        for f in sorted(Path(directory).glob("*")):
+            if f.is_file() and not f.name.startswith("."):
+                self.put_file(f, kind, nodeid="")
+                count += 1
+        return count
+
+
+_store: ArtifactStore | None = None
+
+
+def get_store() -> ArtifactStore | None:
+    """Process-wide store, or None when ARTIFACT_STORE is off."""
+    global _store
+    if not settings.artifact_store:
+        return None
+    if _store is None:
+        _store = ArtifactStore()
+    return _store
+
+
+def close_store() -> None:
+    """Close the process-wide store's index (checkpoints the WAL); the next get_store() reopens it."""
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any, AsyncContextManager, Awaitable, Callable, Hashable, Iterable, Sequence
+
+ClientFactory = Callable[[], AsyncContextManager[Any]]
+
+_NO_CASE = object()
+
+
+@dataclass(frozen=True)
+class CheckSpec:
+    client: ClientFactory
+    cases: tuple = (_NO_CASE,)
+    ids: tuple[str, ...] = ()
+
+
+def api_check(client: ClientFactory, cases: Iterable[Any] | None = None, ids: Sequence[str] | None = None):
+    """
+    Mark an `async def` as an API check, collected by `shared.plugins.api_checks`.
+
+    The check receives an open client from `client()` (shared by every check
+    in the batch) and, with `cases`, one case per collected item:
+
+        @api_check(CustomerApiClient, cases=range(100))
+        async def check_register(api, case): ...
+    """
+    case_list = tuple(cases) if cases is not None else (_NO_CASE,)
+    if ids is not None and len(ids) != len(case_list):
+        raise ValueError(f"{len(ids)} ids for {len(case_list)} cases")
+
+    def decorator(fn):
+        if not inspect.iscoroutinefunction(fn):
+            raise TypeError(f"@api_check needs an async function, got {fn.__qualname__}")
+        fn._api_check = CheckSpec(client, case_list, tuple(ids or ()))
+        return fn
+
+    return decorator
+
+
+def case_id(spec: CheckSpec, index: int) -> str | None:
+    if spec.cases[index] is _NO_CASE:
+        return None
+    return spec.ids[index] if spec.ids else str(spec.cases[index])
+
+
+@dataclass
+class CheckJob:
+    key: Hashable
+    fn: Callable[..., Awaitable[Any]]
+    spec: CheckSpec
+    case: Any = _NO_CASE
+
+
+@dataclass
+class CheckResult:
+    error: BaseException | None
+    ms: float
+
+
+@dataclass
+class BatchStats:
+    checks: int
+    wall_ms: float
+    busy_ms: float  # sum of individual check times
+
+
+async def run_checks(jobs: Sequence[CheckJob], limit: int) -> tuple[dict[Hashable, CheckResult], BatchStats]:
+    """
+    Run every job concurrently, at most `limit` in flight.
+
+    One client is opened per distinct factory and shared by all its jobs, so
+    they reuse one connection pool. Failures are captured per job instead of
+    cancelling the batch.
+    """
+    results: dict[Hashable, CheckResult] = {}
+    sem = asyncio.Semaphore(max(1, limit))
+    t0 = time.perf_counter()
+    async with AsyncExitStack() as stack:
+        clients = {}
+        for job in jobs:
+            if job.spec.client not in clients:
+                clients[job.spec.client] = await stack.enter_async_context(job.spec.client())
+
+        async def one(job: CheckJob) -> None:
+            async with sem:
+                start = time.perf_counter()
+                error = None
+                try:
+                    client = clients[job.spec.client]
+                    await (job.fn(client) if job.case is _NO_CASE else job.fn(client, job.case))
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except BaseException as e:  # includes pytest.skip / fail outcomes, re-raised per item
+                    error = e
+                results[job.key] = CheckResult(error, (time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(one(j) for j in jobs))
+    stats = BatchStats(len(jobs), (time.perf_counter() - t0) * 1000, sum(r.ms for r in results.values()))
+    return results, stats
@@ -1,8 +1,9 @@
 from __future__ import annotations
+import re
 from playwright.sync_api import Page, expect
 
 def assert_url_contains(page: Page, fragment: str) -> None:
-    expect(page).to_have_url(lambda url: fragment in url)
+    expect(page).to_have_url(re.compile(re.escape(fragment)))
 
 def assert_text_visible(page: Page, text: str) -> None:
     expect(page.get_by_text(text)).to_be_visible()
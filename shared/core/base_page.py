@@ -1,17 +1,183 @@
-from playwright.sync_api import Page
+import time
+from playwright.sync_api import Locator, Page, Error as PlaywrightError
 from pathlib import Path
 from datetime import datetime
 
+from shared.artifacts import get_store
+
+from . import web_vitals
+from .config import settings
+from .navigation import NavRecord, Route, nav_log, register
+from .network import NetworkCollector
+from .selectors import SelectorSample, collect_selectors, engine, measure, selector_profile
+from .timeouts import timeouts
+
 
 class BasePage:
+    # Per-page web-performance budget, e.g. {"lcp": 2500, "cls": 0.1}.
+    # Keys are the metric names returned by web_vitals.collect(); ms unless noted.
+    PERF_BUDGET: dict[str, float] = {}
+    # Canonical URL + readiness check; lets flows deep-link instead of clicking menus.
+    ROUTE: Route | None = None
+    # Selectors painted over before visual comparison (data tables, clocks, avatars).
+    VISUAL_MASKS: tuple[str, ...] = ()
+    # Attribute name -> selector for every UPPER_CASE string constant; filled per subclass.
+    SELECTORS: dict[str, str] = {}
+    _selector_names: dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("ROUTE") is not None:
+            register(cls.ROUTE)
+        cls.SELECTORS = collect_selectors(cls)
+        cls._selector_names = {sel: name for name, sel in cls.SELECTORS.items()}
+
     def __init__(self, page: Page):
         self.page = page
+        self._locators: dict[str, Locator] = {}
+        if settings.network_log != "off":
+            NetworkCollector.attach(page)
+        if settings.perf_metrics:
+            web_vitals.install(page)
+
+    def locator(self, selector: str) -> Locator:
+        """
+        Locator for `selector`, built once per page-object instance.
 
-    def goto(self, url: str, timeout: int = 60000) -> None:
-        self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        Locators are lazy queries, so the cached one stays valid across
+        navigations. With SELECTOR_PROFILE=true every call also times how long
+        the selector takes to resolve on the current DOM; calls made before the
+        element exists are not sampled, and step timings are not recorded.
+        """
+        loc = self._locators.get(selector)
+        if loc is None:
+            loc = self._locators[selector] = self.page.locator(selector)
+        if settings.selector_profile:
+            self._profile_selector(selector)
+        return loc
+
+    def _profile_selector(self, selector: str) -> None:
+        timing = measure(self.page, selector)
+        if timing is None:
+            return
+        ms, matches, nodes = timing
+        if matches == 0:
+            return  # called ahead of a wait: the element isn't rendered yet, the cost isn't representative
+        name = self._selector_names.get(selector, selector)
+        selector_profile.add(SelectorSample(type(self).__name__, name, selector, engine(selector), ms, matches, nodes))
+
+    def goto(self, url: str, timeout: int | None = None) -> None:
+        if timeout is None:
+            with timeouts.window_for("navigation", 60000) as t:
+                self.page.goto(url, wait_until="domcontentloaded", timeout=t)
+        else:
+            self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
         self.page.wait_for_timeout(500)
+        self.measure_load()
+
+    def open_route(self, via: str | None = None) -> None:
+        """
+        Reach this page object's ROUTE and wait until it is ready.
+
+        "direct" (NAVIGATION setting, for routes with ROUTE.direct) is one goto
+        to the canonical URL; "menu" clicks through the navigation via
+        ROUTE.menu. A deep link that does not become ready falls back to the
+        menu when the route has one. `via` overrides both.
+        """
+        route = self.ROUTE
+        if route is None:
+            raise TypeError(f"{type(self).__name__} declares no ROUTE")
+        mode = via or (settings.navigation if route.direct else "menu")
+        if route.menu is None:
+            mode = "direct"
+        t0 = time.perf_counter()
+        if mode == "menu":
+            self._open_route_via_menu(route)
+        else:
+            try:
+                with timeouts.window_for(f"nav.{route.name}", route.direct_timeout_ms) as t:
+                    url = route.url_for(getattr(self.page, "base_url", None))  # set by the fixture / load runner
+                    self.page.goto(url, wait_until="domcontentloaded", timeout=t)
+                    self.locator(route.ready).first.wait_for(state="visible", timeout=t)
+            except PlaywrightError:
+                if route.menu is None:
+                    raise
+                mode = "fallback"
+                self._open_route_via_menu(route)
+        nav_log.add(NavRecord(route.name, mode, (time.perf_counter() - t0) * 1000))
+        if mode == "direct":
+            # Only a document load has navigation timings of its own; after a
+            # menu click-through they would still describe the previous page.
+            self.measure_load()
+
+    def _open_route_via_menu(self, route: Route) -> None:
+        with timeouts.window_for(f"nav.{route.name}.menu", 30000) as t:
+            getattr(self, route.menu)()
+            self.locator(route.ready).first.wait_for(state="visible", timeout=t)
+
+    def _step_key(self, action: str, selector: str) -> str:
+        # One timing history per element: "fill.CustomerLoginPage.USERNAME".
+        return f"{action}.{type(self).__name__}.{self._selector_names.get(selector, selector)}"
+
+    def fill(self, selector: str, value: str, timeout: int | None = None) -> None:
+        with timeouts.window_for(self._step_key("fill", selector), 30000) as t:
+            self.locator(selector).fill(value, timeout=timeout or t)
+
+    def click(self, selector: str, timeout: int | None = None) -> None:
+        with timeouts.window_for(self._step_key("click", selector), 30000) as t:
+            self.locator(selector).click(timeout=timeout or t)
+
+    def measure_load(self) -> dict:
+        """Record load metrics for the current URL and enforce PERF_BUDGET."""
+        if not settings.perf_metrics:
+            return {}
+        metrics = web_vitals.collect(self.page)
+        violations = web_vitals.check_budget(metrics, self.PERF_BUDGET)
+        web_vitals.perf_store.add(self.page.url, type(self).__name__, metrics, violations)
+        if violations and settings.perf_budgets:
+            raise AssertionError(
+                f"❌ Performance budget exceeded on {type(self).__name__}.\n"
+                f"URL: {self.page.url}\n" + "\n".join(f"- {v}" for v in violations)
+            )
+        return metrics
+
+    def check_visual(
+        self,
+        name: str = "default",
+        regions: tuple[tuple[int, int, int, int], ...] = (),
+        max_diff_ratio: float | None = None,
+    ):
+        """
+        Compare a full-page screenshot with the baseline for this page object and viewport.
+
+        `regions` are (x, y, w, h) pixel rectangles ignored by the pixel diff;
+        VISUAL_MASKS selectors are masked in the screenshot itself.
+        """
+        from . import visual  # numpy / Pillow are optional
+
+        png = self.page.screenshot(
+            full_page=True,
+            animations="disabled",
+            caret="hide",
+            mask=[self.locator(sel) for sel in self.VISUAL_MASKS],
+        )
+        browser = self.page.context.browser  # None for persistent-cache contexts
+        engine = browser.browser_type.name if browser is not None else settings.browser.lower()
+        baseline = visual.baseline_path(type(self).__name__, engine, self.page.viewport_size, name)
+        kwargs = {} if max_diff_ratio is None else {"max_diff_ratio": max_diff_ratio}
+        result = visual.check(png, baseline, masks=regions, **kwargs)
+        if not result.ok:
+            detail = f"{result.diff_ratio:.2%} of pixels differ" if result.diff_ratio is not None else "size differs"
+            raise AssertionError(
+                f"❌ Visual mismatch on {type(self).__name__} ({name}): {detail}.\n"
+                f"Baseline: {baseline}\n" + "\n".join(f"- {a}" for a in result.artifacts)
+            )
+        return result
 
     def screenshot(self, name: str) -> str:
+        store = get_store()
+        if store is not None:
+            return str(store.put_bytes(self.page.screenshot(full_page=True), name, "screenshot", ".png"))
         Path("artifacts/screenshots").mkdir(parents=True, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         path = f"artifacts/screenshots/{name}_{ts}.png"
@@ -1,17 +1,85 @@
 from __future__ import annotations
+import shutil
+import tempfile
 from playwright.sync_api import sync_playwright, Browser, BrowserContext
 from .config import settings
+from .launch_profiles import LaunchProfile, get_profile
 
-def _launch_browser(p) -> Browser:
-    b = settings.browser.lower()
+
+class _PersistentBrowser:
+    """
+    Stands in for `Browser` when a profile uses a persistent HTTP cache.
+
+    Persistent contexts have no separate Browser object; closing this
+    closes the context and deletes its throwaway profile directory (the
+    shared cache directory is left in place).
+    """
+
+    def __init__(self, context: BrowserContext, user_data_dir: str):
+        self._context = context
+        self._user_data_dir = user_data_dir
+
+    def close(self) -> None:
+        self._context.close()
+        shutil.rmtree(self._user_data_dir, ignore_errors=True)
+
+
+def _engine(p, name: str | None = None):
+    b = (name or settings.browser).lower()
     if b == "firefox":
-        return p.firefox.launch(headless=settings.headless)
+        return p.firefox
     if b == "webkit":
-        return p.webkit.launch(headless=settings.headless)
-    return p.chromium.launch(headless=settings.headless)
+        return p.webkit
+    return p.chromium
+
+
+def _launch_browser(p, profile: LaunchProfile | None = None, browser_name: str | None = None) -> Browser:
+    profile = profile or get_profile()
+    engine = _engine(p, browser_name)
+    return engine.launch(**profile.launch_options(engine.name))
+
+
+def _launch_cached_context(
+    p, profile: LaunchProfile, base_url: str, browser_name: str | None = None, context_options: dict | None = None
+):
+    # Fresh profile dir per launch keeps cookies/storage isolated; only the
+    # HTTP cache is redirected to the long-lived per-worker directory.
+    engine = _engine(p, browser_name)
+    cache_dir = str(profile.cache_dir(engine.name))
+    user_data_dir = tempfile.mkdtemp(prefix=f"pw-{engine.name}-")
+    opts = {
+        **profile.launch_options(engine.name),
+        **profile.context_options(),
+        **(context_options or {}),
+        "base_url": base_url,
+    }
+    if engine.name == "chromium":
+        opts["args"] = [*opts.get("args", []), f"--disk-cache-dir={cache_dir}"]
+    elif engine.name == "firefox":
+        opts["firefox_user_prefs"] = {
+            "browser.cache.disk.enable": True,
+            "browser.cache.disk.parent_directory": cache_dir,
+        }
+    context = engine.launch_persistent_context(user_data_dir, **opts)
+    return _PersistentBrowser(context, user_data_dir), context
+
 
-def new_context(base_url: str) -> tuple[sync_playwright, Browser, BrowserContext]:
+def new_context(
+    base_url: str,
+    profile: LaunchProfile | str | None = None,
+    browser_name: str | None = None,
+    context_options: dict | None = None,
+) -> tuple[sync_playwright, Browser, BrowserContext]:
+    profile = profile if isinstance(profile, LaunchProfile) else get_profile(profile)
     p = sync_playwright().start()
-    browser = _launch_browser(p)
-    context = browser.new_context(base_url=base_url)
-    return p, browser, context
+    try:
+        if profile.persistent_cache and _engine(p, browser_name).name != "webkit":
+            browser, context = _launch_cached_context(p, profile, base_url, browser_name, context_options)
+            return p, browser, context
+        browser = _launch_browser(p, profile, browser_name)
+        context = browser.new_context(base_url=base_url, **profile.context_options(), **(context_options or {}))
+        return p, browser, context
+    except BaseException:
+        # A leaked driver keeps its event loop running and breaks every later sync_playwright() in the process.
+        p.stop()
+        raise
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+
+from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
+from playwright.sync_api import Error as PlaywrightError
+
+from .browser_factory import _launch_browser
+from .config import settings
+from .launch_profiles import LaunchProfile, get_profile
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def chromium_executable() -> str:
+    with sync_playwright() as p:
+        return p.chromium.executable_path
+
+
+def cdp_version(endpoint: str, timeout: float = 1.0) -> dict | None:
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout) as resp:
+            return json.load(resp)
+    except (OSError, ValueError):
+        return None
+
+
+class ChromiumServer:
+    """
+    One Chromium process exposing the DevTools protocol on a fixed local port.
+
+    Python Playwright has no `launch_server`, so the bundled Chromium binary
+    is started directly and clients attach with `connect_over_cdp`. A
+    watchdog thread restarts it on the same port if it dies, so connected
+    clients only need to reconnect.
+    """
+
+    def __init__(self, profile: LaunchProfile | None = None, port: int = 0, headless: bool | None = None):
+        self.profile = profile or get_profile()
+        self.port = port or _free_port()
+        self.headless = settings.headless if headless is None else headless
+        self.restarts = 0
+        self._exe: str | None = None
+        self._proc: subprocess.Popen | None = None
+        self._user_data_dir: str | None = None
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def pid(self) -> int | None:
+        return self._proc.pid if self._proc else None
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _spawn(self, timeout: float = 30.0) -> None:
+        self._exe = self._exe or chromium_executable()
+        self._user_data_dir = tempfile.mkdtemp(prefix="pw-shared-chromium-")
+        cmd = [
+            self._exe,
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={self._user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *self.profile.chromium_args,
+        ]
+        if self.profile.persistent_cache:
+            cmd.append(f"--disk-cache-dir={self.profile.cache_dir('chromium')}")
+        if self.headless:
+            cmd += ["--headless=new", "--hide-scrollbars", "--mute-audio"]
+        cmd.append("about:blank")
+        self._proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if cdp_version(self.endpoint, timeout=0.5):
+                return
+            if not self.alive():
+                break
+            time.sleep(0.1)
+        self._kill()
+        raise RuntimeError(f"Shared Chromium did not expose CDP on {self.endpoint}")
+
+    def _watch(self) -> None:
+        while not self._stop.wait(1.0):
+            if not self.alive():
+                self._kill()
+                try:
+                    self._spawn()
+                    self.restarts += 1
+                except RuntimeError:
+                    pass  # try again on the next tick
+
+    def start(self) -> "ChromiumServer":
+        self._spawn()
+        self._watchdog = threading.Thread(target=self._watch, name="chromium-watchdog", daemon=True)
+        self._watchdog.start()
+        return self
+
+    def _kill(self) -> None:
+        if self._proc is not None and self.alive():
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watchdog is not None and self._watchdog is not threading.current_thread():
+            self._watchdog.join(timeout=35)  # let an in-flight restart finish before killing it
+        self._kill()
+
+
+class BrowserClient:
+    """
+    Per-process owner of the Playwright driver for the test fixtures.
+
+    Chromium attaches to a running ChromiumServer when an endpoint is given;
+    other engines (or no endpoint) launch one browser per process and keep
+    it for the whole session. Every test still gets its own context.
+    """
+
+    def __init__(self, endpoint: str | None = None, profile: LaunchProfile | None = None):
+        self.endpoint = endpoint
+        self.profile = profile or get_profile()
+        self._p: Playwright | None = None
+        self._browsers: dict[str, Browser] = {}
+
+    @property
+    def playwright(self) -> Playwright:
+        if self._p is None:
+            self._p = sync_playwright().start()
+        return self._p
+
+    def _connect(self, engine: str, wait_s: float = 30.0) -> Browser:
+        if engine != "chromium" or not self.endpoint:
+            return _launch_browser(self.playwright, self.profile, engine)
+        deadline = time.monotonic() + wait_s
+        while True:
+            try:
+                return self.playwright.chromium.connect_over_cdp(self.endpoint)
+            except PlaywrightError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.5)  # server is being restarted by the watchdog
+
+    def browser(self, engine: str) -> Browser:
+        b = self._browsers.get(engine)
+        if b is None or not b.is_connected():
+            b = self._browsers[engine] = self._connect(engine)
+        return b
+
+    def new_context(self, engine: str, base_url: str, **extra) -> BrowserContext:
+        opts = {"base_url": base_url, **self.profile.context_options(), **extra}
+        try:
+            return self.browser(engine).new_context(**opts)
+        except PlaywrightError:
+            self._browsers.pop(engine, None)  # disconnected mid-run: reconnect once
+            return self.browser(engine).new_context(**opts)
+
+    def close(self) -> None:
+        for b in self._browsers.values():
+            try:
+                b.close()
+            except PlaywrightError:
+                pass
+        self._browsers.clear()
+        if self._p is not None:
+            self._p.stop()
+            self._p = None
@@ -10,18 +10,100 @@ ENV_PATH = ROOT_DIR / ".env"
 load_dotenv(dotenv_path=ENV_PATH, override=True)
 
 
+def _base_url(url_var: str, stub_var: str, port_var: str, default_port: int) -> str:
+    """`url_var`, or the local stand-in on http://127.0.0.1:<port_var> when `stub_var` is true."""
+    if os.getenv(stub_var, "false").lower() == "true":
+        return f"http://127.0.0.1:{os.getenv(port_var, str(default_port))}"
+    return os.getenv(url_var, "")
+
+
 @dataclass(frozen=True)
 class Settings:
     env: str = os.getenv("ENV", "local")
 
     headless: bool = os.getenv("HEADLESS", "true").lower() == "true"
     browser: str = os.getenv("BROWSER", "chromium")
+    # Matrix mode: BROWSERS=chromium,firefox,webkit runs every browser test once per engine
+    browsers: tuple[str, ...] = tuple(b.strip() for b in os.getenv("BROWSERS", "").split(",") if b.strip())
+    # Named launch profile from shared/core/launch_profiles.py: default | ci-fast | debug | fidelity
+    launch_profile: str = os.getenv("LAUNCH_PROFILE", "default")
+    # One Chromium for the whole run (started by the pytest controller); workers attach over CDP
+    browser_server: bool = os.getenv("BROWSER_SERVER", "false").lower() == "true"
+    # Attach to a warm `python -m shared.daemon start` Chromium when one is running
+    browser_daemon: bool = os.getenv("BROWSER_DAEMON", "true").lower() == "true"
+
+    # Web-performance capture after each navigation; budgets fail the test when enforced
+    perf_metrics: bool = os.getenv("PERF_METRICS", "true").lower() == "true"
+    perf_budgets: bool = os.getenv("PERF_BUDGETS", "true").lower() == "true"
+
+    # Playwright trace of failing tests: off | on-failure (artifacts/traces, `playwright show-trace`)
+    trace: str = os.getenv("TRACE", "off").lower()
+    # Incremental per-worker JSONL results merged into reports/live/<run>/report.html
+    live_report: bool = os.getenv("LIVE_REPORT", "true").lower() == "true"
+
+    # Content-addressed artifact store (artifacts/store) and its retention, applied after each run
+    artifact_store: bool = os.getenv("ARTIFACT_STORE", "true").lower() == "true"
+    artifact_max_age_days: float = float(os.getenv("ARTIFACT_MAX_AGE_DAYS", "14"))
+    artifact_max_mb: float = float(os.getenv("ARTIFACT_MAX_MB", "2048"))
+
+    # Failure-only video: off | on-failure; trimmed to the last VIDEO_TAIL_S seconds (needs ffmpeg)
+    video: str = os.getenv("VIDEO", "off").lower()
+    video_size: str = os.getenv("VIDEO_SIZE", "640x360")
+    video_tail_s: int = int(os.getenv("VIDEO_TAIL_S", "15"))
+    video_max_mb: float = float(os.getenv("VIDEO_MAX_MB", "200"))
+
+    # Visual checks (BasePage.check_visual): rewrite baselines, allowed fraction of changed pixels
+    visual_update: bool = os.getenv("VISUAL_UPDATE", "false").lower() == "true"
+    visual_max_diff: float = float(os.getenv("VISUAL_MAX_DIFF", "0.001"))
+
+    # Buffered browser console / network events: off | on-failure | always
+    network_log: str = os.getenv("NETWORK_LOG", "on-failure").lower()
+    network_buffer: int = int(os.getenv("NETWORK_BUFFER", "500"))
+
+    # Smart retry of transient failures (0 = only tests marked @pytest.mark.smart_retry)
+    retries: int = int(os.getenv("RETRIES", "0"))
+    retry_backoff_s: float = float(os.getenv("RETRY_BACKOFF_S", "1.0"))
+    retry_classes: tuple[str, ...] = tuple(
+        c.strip() for c in os.getenv("RETRY_CLASSES", "network,timeout,locator").split(",") if c.strip()
+    )
+
+    # Session preflight probe + circuit breaker per target app
+    preflight: bool = os.getenv("PREFLIGHT", "true").lower() == "true"
+    preflight_timeout_s: float = float(os.getenv("PREFLIGHT_TIMEOUT_S", "5"))
+    preflight_action: str = os.getenv("PREFLIGHT_ACTION", "skip").lower()  # skip | fail
+    breaker_threshold: int = int(os.getenv("BREAKER_THRESHOLD", "3"))
+
+    # Page-object navigation: direct (deep link to ROUTE) | menu (click through the sidebar)
+    navigation: str = os.getenv("NAVIGATION", "direct").lower()
+
+    # Time every page-object selector against the live DOM and flag slow XPath shapes (summary at the end)
+    selector_profile: bool = os.getenv("SELECTOR_PROFILE", "false").lower() == "true"
+    selector_slow_ms: float = float(os.getenv("SELECTOR_SLOW_MS", "2"))
+
+    # Timeout policy: fixed | adaptive (p99 of recorded step latency * factor, floored)
+    timeout_mode: str = os.getenv("TIMEOUT_MODE", "adaptive").lower()
+    timeout_safety_factor: float = float(os.getenv("TIMEOUT_SAFETY_FACTOR", "3.0"))
+    timeout_floor_ms: int = int(os.getenv("TIMEOUT_FLOOR_MS", "2000"))
+    timeout_overrides: str = os.getenv("TIMEOUT_OVERRIDES", "")  # "login.result=30000,..."
+
+    # SQLite history of results / durations / step timings (empty disables); see `python -m shared.results`
+    results_db: str = os.getenv("RESULTS_DB", str(Path("reports") / "results.db"))
 
     customer_base_url: str = os.getenv("CUSTOMER_BASE_URL", "")
     customer_user: str = os.getenv("CUSTOMER_USER", "")
     customer_pass: str = os.getenv("CUSTOMER_PASS", "")
 
-    dashboard_base_url: str = os.getenv("DASHBOARD_BASE_URL", "")
+    # Async API tier (customer_app/api); CUSTOMER_API_STUB=true points it at the local stand-in
+    customer_api_stub: bool = os.getenv("CUSTOMER_API_STUB", "false").lower() == "true"
+    customer_api_stub_port: int = int(os.getenv("CUSTOMER_API_STUB_PORT", "8766"))
+    customer_api_url: str = _base_url("CUSTOMER_API_URL", "CUSTOMER_API_STUB", "CUSTOMER_API_STUB_PORT", 8766)
+    api_concurrency: int = int(os.getenv("API_CONCURRENCY", "100"))  # in-flight checks and pooled connections
+    api_timeout_s: float = float(os.getenv("API_TIMEOUT_S", "10"))
+
+    # DASHBOARD_STUB=true points the dashboard suite at the local stand-in server
+    dashboard_stub: bool = os.getenv("DASHBOARD_STUB", "false").lower() == "true"
+    stub_port: int = int(os.getenv("STUB_PORT", "8765"))
+    dashboard_base_url: str = _base_url("DASHBOARD_BASE_URL", "DASHBOARD_STUB", "STUB_PORT", 8765)
     admin_user: str = os.getenv("ADMIN_USER", "")
     admin_pass: str = os.getenv("ADMIN_PASS", "")
 
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+
+# Subclasses of AssertionError so pytest still reports them as plain test
+# failures, while the retry / circuit-breaker logic can tell them apart.
+
+class ReachabilityError(AssertionError):
+    """The target environment could not be reached (DNS, refused, offline...)."""
+
+
+class ElementNotFoundError(AssertionError):
+    """An element the page object relies on never showed up."""
+
+
+class ApiStatusError(AssertionError):
+    """An API call answered with a status the endpoint does not treat as success."""
+
+    def __init__(self, message: str, status: int, body: object = None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+
+from .retry import FailureClass
+
+
+@dataclass
+class ProbeResult:
+    url: str
+    ok: bool
+    status: int | None = None
+    elapsed_ms: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def probe(url: str, timeout: float = 5.0) -> ProbeResult:
+    """
+    One cheap HTTP GET. Any response below 500 counts as reachable - a 401
+    or 404 still proves DNS, TLS and the web server are up.
+    """
+    t0 = time.perf_counter()
+    req = urllib.request.Request(url, headers={"User-Agent": "waakia-preflight"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, OSError) as e:
+        reason = getattr(e, "reason", e)
+        return ProbeResult(url, False, None, (time.perf_counter() - t0) * 1000, str(reason))
+    elapsed = (time.perf_counter() - t0) * 1000
+    return ProbeResult(url, status < 500, status, elapsed, None if status < 500 else f"HTTP {status}")
+
+
+def probe_all(urls: dict[str, str], timeout: float = 5.0) -> dict[str, ProbeResult]:
+    """Probe every named URL concurrently; names with an empty URL are left out."""
+    targets = {name: url for name, url in urls.items() if url}
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        futures = {name: pool.submit(probe, url, timeout) for name, url in targets.items()}
+        return {name: f.result() for name, f in futures.items()}
+
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive network-class failures; any other outcome resets it."""
+
+    def __init__(self, threshold: int = 3):
+        self.threshold = threshold
+        self.consecutive = 0
+        self.opened_by: str | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_by is not None
+
+    def record(self, failure: FailureClass | None, nodeid: str = "") -> None:
+        if self.is_open:
+            return
+        if failure is FailureClass.NETWORK:
+            self.consecutive += 1
+            if self.consecutive >= self.threshold:
+                self.opened_by = nodeid
+        else:
+            self.consecutive = 0
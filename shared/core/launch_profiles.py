@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import ROOT_DIR, settings
+
+CACHE_ROOT = ROOT_DIR / "artifacts" / ".browser-cache"
+
+# Flags that matter inside containers (ci/Dockerfile): /dev/shm is tiny, there is
+# no GPU, and background services only add noise to timings.
+_CONTAINER_ARGS = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-component-update",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+)
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    name: str
+    chromium_args: tuple[str, ...] = ()
+    headless: bool | None = None  # None -> settings.headless
+    slow_mo: float = 0
+    devtools: bool = False
+    viewport: dict | None = field(default_factory=lambda: {"width": 1280, "height": 720})
+    device_scale_factor: float = 1
+    reduced_motion: str = "no-preference"
+    persistent_cache: bool = False  # HTTP disk cache kept between launches (chromium/firefox)
+
+    def launch_options(self, engine: str) -> dict:
+        opts: dict = {"headless": settings.headless if self.headless is None else self.headless}
+        if self.slow_mo:
+            opts["slow_mo"] = self.slow_mo
+        if engine == "chromium":
+            args = list(self.chromium_args)
+            if self.devtools:
+                args.append("--auto-open-devtools-for-tabs")
+            if args:
+                opts["args"] = args
+        return opts
+
+    def context_options(self) -> dict:
+        opts: dict = {"reduced_motion": self.reduced_motion}
+        if self.viewport is None:
+            opts["no_viewport"] = True
+        else:
+            opts["viewport"] = self.viewport
+            opts["device_scale_factor"] = self.device_scale_factor
+        return opts
+
+    def cache_dir(self, engine: str) -> Path:
+        # One directory per xdist worker: a browser's disk cache cannot be
+        # opened by two processes at once, but it survives across tests and runs.
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        path = CACHE_ROOT / f"{engine}-{worker}"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+
+PROFILES: dict[str, LaunchProfile] = {
+    # Previous behaviour: bare launch, Playwright's default context.
+    "default": LaunchProfile("default", viewport={"width": 1280, "height": 720}),
+    # Containers / CI: trimmed background work, no animations, warm HTTP cache.
+    "ci-fast": LaunchProfile(
+        "ci-fast",
+        chromium_args=_CONTAINER_ARGS,
+        headless=True,
+        reduced_motion="reduce",
+        persistent_cache=True,
+    ),
+    # Local debugging: headed, slowed down, devtools open, window-sized viewport.
+    "debug": LaunchProfile(
+        "debug",
+        headless=False,
+        slow_mo=250,
+        devtools=True,
+        viewport=None,
+    ),
+    # Screenshot / visual work: full-HD at 2x, stable colour and font rendering.
+    "fidelity": LaunchProfile(
+        "fidelity",
+        chromium_args=("--force-color-profile=srgb", "--font-render-hinting=none", "--hide-scrollbars"),
+        viewport={"width": 1920, "height": 1080},
+        device_scale_factor=2,
+    ),
+}
+
+
+def get_profile(name: str | None = None) -> LaunchProfile:
+    name = name or settings.launch_profile
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown LAUNCH_PROFILE {name!r}; choose one of {sorted(PROFILES)}") from None
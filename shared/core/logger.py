@@ -3,6 +3,8 @@ import logging
 from pathlib import Path
 from datetime import datetime
 
+from shared.artifacts import get_store
+
 LOG_DIR = Path("reports") / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -27,3 +29,24 @@ def get_logger(name: str = "automation") -> logging.Logger:
     logger.addHandler(fh)
 
     return logger
+
+
+def archive_logs() -> list[Path]:
+    """Close the log files opened by get_logger and move them into the artifact store."""
+    store = get_store()
+    archived = []
+    loggers = [lg for lg in list(logging.root.manager.loggerDict.values()) if isinstance(lg, logging.Logger)]
+    for logger in loggers:
+        for handler in [h for h in logger.handlers if isinstance(h, logging.FileHandler)]:
+            path = Path(handler.baseFilename)
+            if LOG_DIR.resolve() not in path.parents:
+                continue
+            logger.removeHandler(handler)
+            handler.close()
+            if store is None or not path.exists():
+                continue
+            if path.stat().st_size == 0:
+                path.unlink()
+                continue
+            archived.append(store.put_file(path, "log"))
+    return archived
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+from .config import settings
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    Where a page object lives and how to tell it is usable.
+
+    `path` is joined to the app's base URL (`app` = "dashboard" | "customer").
+    `ready` is a selector that is visible once the page can be used.
+    `menu` names the page-object method that reaches the page by clicking
+    through the navigation, for tests that cover the menus themselves.
+    `direct` opts the route into deep linking once `path` is confirmed on the
+    target environment; until then it is reached through `menu`.
+    `direct_timeout_ms` caps the deep-link attempt before falling back to `menu`.
+    """
+
+    name: str
+    path: str
+    ready: str
+    app: str = "dashboard"
+    menu: str | None = None
+    direct: bool = False
+    direct_timeout_ms: int = 30000
+
+    def url_for(self, base_url: str | None = None) -> str:
+        """`path` joined to `base_url` (e.g. the page's), else to the app's configured base URL."""
+        base = base_url or (settings.dashboard_base_url if self.app == "dashboard" else settings.customer_base_url)
+        return f"{base.rstrip('/')}{self.path}"
+
+    @property
+    def url(self) -> str:
+        return self.url_for()
+
+
+ROUTES: dict[str, Route] = {}
+
+
+def register(route: Route) -> Route:
+    existing = ROUTES.get(route.name)
+    if existing is not None and existing != route:
+        raise ValueError(f"Route {route.name!r} is already registered with a different definition")
+    ROUTES[route.name] = route
+    return route
+
+
+@dataclass
+class NavRecord:
+    route: str
+    mode: str  # "direct" | "menu" | "fallback"
+    ms: float
+
+
+class NavigationLog:
+    """Thread-safe record of navigations in this process, drained per test."""
+
+    def __init__(self):
+        self._records: list[NavRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: NavRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def drain(self) -> list[NavRecord]:
+        with self._lock:
+            out, self._records = self._records, []
+        return out
+
+
+nav_log = NavigationLog()
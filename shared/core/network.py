@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import weakref
+from collections import deque
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+from playwright.sync_api import ConsoleMessage, Page, Request, Response
+
+from .config import settings
+
+
+@dataclass
+class RequestSample:
+    url: str
+    method: str
+    resource_type: str
+    status: int | None
+    duration_ms: float | None
+    size: int | None  # Content-Length when the server sent one (None for chunked / streamed bodies)
+    failure: str | None = None
+
+
+class NetworkCollector:
+    """
+    Buffers console, page-error and request events for one page.
+
+    Listeners are registered once per page (see `attach`) and only append
+    to bounded ring buffers - nothing is printed while the test runs. Call
+    `format_summary()` to get the slowest / largest / failed requests.
+    """
+
+    _by_page: "weakref.WeakKeyDictionary[Page, NetworkCollector]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page, maxlen: int = 500):
+        self.requests: deque[RequestSample] = deque(maxlen=maxlen)
+        self.console: deque[str] = deque(maxlen=maxlen)
+        self.page_errors: deque[str] = deque(maxlen=maxlen)
+        # Responses waiting for their requestfinished/requestfailed event.
+        self._responses: dict[Request, Response] = {}
+        self._maxlen = maxlen
+
+        page.on("console", self._on_console)
+        page.on("pageerror", self._on_page_error)
+        page.on("response", self._on_response)
+        page.on("requestfinished", self._on_finished)
+        page.on("requestfailed", self._on_failed)
+        page.on("close", self._on_close)
+
+    @classmethod
+    def attach(cls, page: Page) -> "NetworkCollector":
+        collector = cls._by_page.get(page)
+        if collector is None:
+            collector = cls._by_page[page] = cls(page, maxlen=settings.network_buffer)
+        return collector
+
+    @classmethod
+    def get(cls, page: Page) -> "NetworkCollector | None":
+        return cls._by_page.get(page)
+
+    # =========================
+    # Event handlers (keep cheap: no I/O, no driver round trips)
+    # =========================
+    def _on_console(self, msg: ConsoleMessage) -> None:
+        self.console.append(f"[{msg.type}] {msg.text}")
+
+    def _on_page_error(self, err) -> None:
+        self.page_errors.append(str(err))
+
+    def _on_response(self, response: Response) -> None:
+        self._responses[response.request] = response
+        # Streams and long polls never finish; don't let them pile up.
+        while len(self._responses) > self._maxlen:
+            del self._responses[next(iter(self._responses))]
+
+    def _sample(self, request: Request, failure: str | None) -> RequestSample:
+        response = self._responses.pop(request, None)
+        timing = request.timing
+        end = timing.get("responseEnd", -1)
+        size = response.headers.get("content-length") if response else None
+        return RequestSample(
+            url=request.url,
+            method=request.method,
+            resource_type=request.resource_type,
+            status=response.status if response else None,
+            duration_ms=round(end, 1) if end >= 0 else None,
+            size=int(size) if size and size.isdigit() else None,
+            failure=failure,
+        )
+
+    def _on_finished(self, request: Request) -> None:
+        self.requests.append(self._sample(request, None))
+
+    def _on_failed(self, request: Request) -> None:
+        self.requests.append(self._sample(request, request.failure or "failed"))
+
+    def _on_close(self, page: Page) -> None:
+        self._responses.clear()  # in-flight requests of a closed page never finish
+
+    # =========================
+    # Reporting
+    # =========================
+    def summary(self, top: int = 5) -> dict:
+        done = list(self.requests)
+        timed = [r for r in done if r.duration_ms is not None]
+        sized = [r for r in done if r.size is not None]
+        failed = [r for r in done if r.failure or (r.status or 0) >= 400]
+        return {
+            "requests": len(done),
+            "slowest": [asdict(r) for r in sorted(timed, key=lambda r: r.duration_ms, reverse=True)[:top]],
+            "largest": [asdict(r) for r in sorted(sized, key=lambda r: r.size, reverse=True)[:top]],
+            "failed": [asdict(r) for r in failed],
+            "console": list(self.console)[-top * 4:],
+            "page_errors": list(self.page_errors),
+        }
+
+    def format_summary(self, top: int = 5) -> str:
+        s = self.summary(top)
+        lines = [f"Requests seen: {s['requests']}"]
+        lines.append("Slowest:")
+        lines += [f"  {r['duration_ms']:>8.0f} ms  {r['method']} {r['url']}" for r in s["slowest"]]
+        lines.append("Largest (by Content-Length):")
+        lines += [f"  {r['size']:>10,} B  {r['method']} {r['url']}" for r in s["largest"]]
+        lines.append("Failed:")
+        lines += [f"  {r['status'] or '---'}  {r['method']} {r['url']}  {r['failure'] or ''}" for r in s["failed"]]
+        if s["page_errors"]:
+            lines.append("Page errors:")
+            lines += [f"  {e}" for e in s["page_errors"]]
+        if s["console"]:
+            lines.append("Console (latest):")
+            lines += [f"  {c}" for c in s["console"]]
+        return "\n".join(lines)
+
+    def dump(self, path: str | Path, top: int = 20) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(top), indent=2), encoding="utf-8")
+        return path
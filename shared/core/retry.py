@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, TypeVar
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from .errors import ElementNotFoundError, ReachabilityError
+
+T = TypeVar("T")
+
+
+class FailureClass(str, Enum):
+    NETWORK = "network"
+    TIMEOUT = "timeout"
+    LOCATOR = "locator"
+    ASSERTION = "assertion"
+    OTHER = "other"
+
+
+TRANSIENT = frozenset({FailureClass.NETWORK, FailureClass.TIMEOUT, FailureClass.LOCATOR})
+
+_NETWORK_MARKERS = (
+    "net::err_", "ns_error_", "econnrefused", "econnreset", "enotfound",
+    "could not connect", "connection refused", "name not resolved", "network is unreachable",
+)
+_LOCATOR_MARKERS = (
+    "strict mode violation", "not attached to the dom", "element is detached",
+    "intercepts pointer events", "element is not visible", "element is not enabled",
+)
+
+
+def classify(exc: BaseException) -> FailureClass:
+    """Map an exception raised by a test or page object to a failure class."""
+    if isinstance(exc, ReachabilityError):
+        return FailureClass.NETWORK
+    if isinstance(exc, ElementNotFoundError):
+        return FailureClass.LOCATOR
+    if isinstance(exc, AssertionError):
+        # Plain assertions (including expect() and login-result checks) are genuine failures.
+        return FailureClass.ASSERTION
+
+    msg = str(exc).lower()
+    if isinstance(exc, PlaywrightTimeoutError):
+        return FailureClass.LOCATOR if "waiting for locator" in msg else FailureClass.TIMEOUT
+    if isinstance(exc, PlaywrightError):
+        if any(m in msg for m in _NETWORK_MARKERS):
+            return FailureClass.NETWORK
+        if any(m in msg for m in _LOCATOR_MARKERS):
+            return FailureClass.LOCATOR
+        return FailureClass.OTHER
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return FailureClass.NETWORK if isinstance(exc, ConnectionError) else FailureClass.TIMEOUT
+    return FailureClass.OTHER
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 2
+    backoff_s: float = 1.0
+    factor: float = 2.0
+    max_backoff_s: float = 10.0
+    classes: frozenset[FailureClass] = field(default=TRANSIENT)
+
+    def delay(self, attempt: int) -> float:
+        return min(self.max_backoff_s, self.backoff_s * self.factor ** attempt)
+
+
+@dataclass
+class RetryStats:
+    attempts: int = 0
+    retries: int = 0
+    retry_time_s: float = 0.0  # time spent in failed attempts + backoff
+    classes: list[str] = field(default_factory=list)
+
+
+def retry_call(
+    fn: Callable[[], T],
+    policy: RetryPolicy = RetryPolicy(),
+    stats: RetryStats | None = None,
+    on_retry: Callable[[BaseException, FailureClass, float], None] | None = None,
+) -> T:
+    """
+    Call `fn`, retrying in place on transient failures.
+
+    Nothing is torn down between attempts: the same page, context and
+    cookies are reused, so a retry costs only the failed step plus backoff.
+    """
+    stats = stats if stats is not None else RetryStats()
+    while True:
+        stats.attempts += 1
+        t0 = time.perf_counter()
+        try:
+            return fn()
+        except Exception as e:
+            cls = classify(e)
+            if cls not in policy.classes or stats.retries >= policy.max_retries:
+                raise
+            delay = policy.delay(stats.retries)
+            if on_retry:
+                on_retry(e, cls, delay)
+            time.sleep(delay)
+            stats.retries += 1
+            stats.classes.append(cls.value)
+            stats.retry_time_s += time.perf_counter() - t0
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+
+# Runs one selector `repeat` times against the live DOM and returns the median cost.
+# CSS that only Playwright understands (:has-text, :visible...) makes querySelectorAll
+# throw; the caller then falls back to timing a locator round trip.
+_PROFILE_SCRIPT = """
+([sel, isXPath, repeat]) => {
+  const times = [];
+  let count = 0;
+  try {
+    for (let i = 0; i < repeat; i++) {
+      const t0 = performance.now();
+      count = isXPath
+        ? document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength
+        : document.querySelectorAll(sel).length;
+      times.push(performance.now() - t0);
+    }
+  } catch (e) {
+    return null;
+  }
+  times.sort((a, b) => a - b);
+  return {ms: times[Math.floor(times.length / 2)], count, nodes: document.getElementsByTagName("*").length};
+}
+"""
+
+_ROLE_OF_TAG = {
+    "a": "link",
+    "button": "button",
+    "h1": "heading",
+    "h2": "heading",
+    "h3": "heading",
+    "h4": "heading",
+    "th": "columnheader",
+    "li": "listitem",
+    "option": "option",
+    "select": "combobox",
+}
+
+_TEXT_EQ_RE = re.compile(r"""^(?:normalize-space\(\.?\)|text\(\)|\.)\s*=\s*(['"])(?P<text>.*)\1$""")
+_ATTR_EQ_RE = re.compile(r"""^@(?P<name>[\w-]+)\s*=\s*(['"])(?P<value>.*)\2$""")
+_STEP_RE = re.compile(r"^(?P<tag>[\w*]+)\[(?P<pred>.*)\]$")
+_DESC_PRED_RE = re.compile(r"^//(?P<outer>\w+)\[\.//(?P<inner>.+)\]$")
+_LABEL_FOLLOWING_RE = re.compile(
+    r"""//label\[contains\(normalize-space\(\.?\),\s*(['"])(?P<label>.+?)\1\)\]/following::"""
+)
+
+
+def _parse_step(step: str) -> tuple[str, dict[str, str], str | None] | None:
+    """`tag[@a='x' and normalize-space()='Text']` -> (tag, {"a": "x"}, "Text"); None for anything richer."""
+    m = _STEP_RE.match(step)
+    if m is None:
+        return None
+    attrs: dict[str, str] = {}
+    text = None
+    for part in re.split(r"\s+and\s+", m.group("pred")):
+        if (a := _ATTR_EQ_RE.match(part)) is not None:
+            attrs[a.group("name")] = a.group("value")
+        elif (t := _TEXT_EQ_RE.match(part)) is not None and text is None:
+            text = t.group("text")
+        else:
+            return None
+    return m.group("tag"), attrs, text
+
+
+def engine(selector: str) -> str:
+    """Selector engine as Playwright resolves it: "xpath", "css" or "playwright" (text=, role=, chains...)."""
+    if selector.startswith("xpath="):
+        return "xpath"
+    if selector.startswith(("//", "..", "(")):
+        return "xpath"
+    if ">>" in selector or re.match(r"^[\w-]+=", selector):
+        return "playwright"
+    return "css"
+
+
+def _strip_engine(selector: str) -> str:
+    return selector[len("xpath="):] if selector.startswith("xpath=") else selector
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    message: str
+    suggestion: str | None = None
+
+
+def _role_suggestion(tag: str, text: str, attrs: dict[str, str]) -> str | None:
+    role = attrs.get("role") or _ROLE_OF_TAG.get(tag)
+    if role is None and tag == "input" and attrs.get("type") in ("submit", "button"):
+        role = "button"
+    if role is None:
+        return None
+    return f'page.get_by_role("{role}", name="{text}", exact=True)'
+
+
+def _css_of(tag: str, attrs: dict[str, str]) -> str:
+    return ("" if tag == "*" else tag) + "".join(f'[{k}="{v}"]' for k, v in attrs.items())
+
+
+@lru_cache(maxsize=None)
+def analyze(selector: str) -> tuple[Finding, ...]:
+    """
+    Static review of one selector: known-slow XPath shapes and a faster equivalent.
+
+    Suggestions are starting points: a role locator matches the accessible
+    name, which usually but not always equals the visible text.
+    """
+    if engine(selector) != "xpath":
+        return ()
+    xp = _strip_engine(selector)
+    findings: list[Finding] = []
+
+    m = _LABEL_FOLLOWING_RE.search(xp)
+    if m:
+        findings.append(Finding(
+            "following-axis",
+            "following:: walks every node after the label in document order",
+            f'page.get_by_label("{m.group("label")}")',
+        ))
+    elif "following::" in xp or "preceding::" in xp:
+        findings.append(Finding(
+            "following-axis",
+            "following::/preceding:: walk the rest of the document",
+            "scope to the enclosing container (form, dialog) and use a child/descendant step",
+        ))
+
+    m = _DESC_PRED_RE.match(xp)
+    inner = _parse_step(m.group("inner")) if m else None
+    if inner is not None and inner[2] is not None:
+        findings.append(Finding(
+            "descendant-predicate",
+            f"[.//{inner[0]}[...]] rescans the subtree of every <{m.group('outer')}>",
+            f'{m.group("outer")}:has({inner[0]}:text-is("{inner[2]}"))',
+        ))
+
+    if "normalize-space(.)" in xp and "contains(" in xp and not _LABEL_FOLLOWING_RE.search(xp):
+        findings.append(Finding(
+            "string-value",
+            "contains(normalize-space(.), ...) concatenates the text of the whole subtree per candidate",
+        ))
+
+    step = _parse_step(xp.rsplit("//", 1)[-1]) if not findings else None
+    if xp.startswith(("//*", "//div[")):
+        suggestion = None
+        if step is not None and step[2] is not None:
+            suggestion = _role_suggestion(step[0], step[2], step[1])
+        elif step is not None and xp.count("//") == 1:
+            suggestion = _css_of(step[0], step[1])
+        findings.append(Finding("broad-scan", "starts from every element (//* or //div) in the document", suggestion))
+    elif step is not None:
+        tag, attrs, text = step
+        if text is not None:
+            findings.append(Finding(
+                "text-xpath",
+                "text match through XPath string functions; role and text locators are stricter and cheaper",
+                _role_suggestion(tag, text, attrs) or f'{tag}:text-is("{text}")',
+            ))
+        elif xp.count("//") == 1 and attrs:
+            if "placeholder" in attrs and set(attrs) <= {"placeholder", "type"}:
+                suggestion = f'page.get_by_placeholder("{attrs["placeholder"]}", exact=True)'
+            else:
+                suggestion = _css_of(tag, attrs)
+            findings.append(Finding("attribute-xpath", "attribute-only XPath; CSS matches it natively", suggestion))
+
+    return tuple(findings)
+
+
+def collect_selectors(cls: type) -> dict[str, str]:
+    """UPPER_CASE string constants of a page class and its bases, by attribute name."""
+    found: dict[str, str] = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if name.isupper() and isinstance(value, str) and not name.startswith("_"):
+                found[name] = value
+    return found
+
+
+# =========================
+# In-browser profiling
+# =========================
+@dataclass
+class SelectorSample:
+    page: str  # page-object class
+    name: str  # attribute name, or the selector itself when not a class constant
+    selector: str
+    engine: str
+    ms: float
+    matches: int
+    dom_nodes: int | None = None
+
+
+def measure(page: Page, selector: str, repeat: int = 5) -> tuple[float, int, int | None] | None:
+    """(median ms, matches, DOM size) for `selector` on the current document, or None if it can't be timed."""
+    kind = engine(selector)
+    try:
+        if kind in ("xpath", "css"):
+            result = page.evaluate(_PROFILE_SCRIPT, [_strip_engine(selector), kind == "xpath", repeat])
+            if result is not None:
+                return result["ms"], result["count"], result["nodes"]
+        # Playwright-only syntax: time the round trip instead (includes IPC, so it reads higher).
+        t0 = time.perf_counter()
+        count = page.locator(selector).count()
+        return (time.perf_counter() - t0) * 1000, count, None
+    except PlaywrightError:
+        return None  # page navigating / closed: skip this sample
+
+
+class SelectorProfile:
+    """Thread-safe samples collected in this process, drained per test."""
+
+    def __init__(self):
+        self._samples: list[SelectorSample] = []
+        self._lock = threading.Lock()
+
+    def add(self, sample: SelectorSample) -> None:
+        with self._lock:
+            self._samples.append(sample)
+
+    def drain(self) -> list[SelectorSample]:
+        with self._lock:
+            out, self._samples = self._samples, []
+        return out
+
+
+selector_profile = SelectorProfile()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile (same definition as numpy's default)."""
+    if not values:
+        return math.nan
+    data = sorted(values)
+    k = (len(data) - 1) * (pct / 100.0)
+    lo = math.floor(k)
+    hi = math.ceil(k)
+    if lo == hi:
+        return float(data[int(k)])
+    return data[lo] + (data[hi] - data[lo]) * (k - lo)
+
+
+def summarize(values: Iterable[float]) -> dict:
+    data = sorted(values)
+    if not data:
+        return {"count": 0}
+    return {
+        "count": len(data),
+        "min": data[0],
+        "mean": sum(data) / len(data),
+        "p50": percentile(data, 50),
+        "p95": percentile(data, 95),
+        "p99": percentile(data, 99),
+        "max": data[-1],
+    }
+
+
+def mann_whitney(baseline: Sequence[float], recent: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test: p-value for "recent tends to be larger than baseline".
+
+    Normal approximation with tie correction; fine from ~5 samples per side,
+    which is what a handful of runs gives us. Returns 1.0 when undecidable.
+    """
+    n1, n2 = len(baseline), len(recent)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(v, 0) for v in baseline] + [(v, 1) for v in recent])
+    ranks = [0.0] * len(pooled)
+    ties = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    r2 = sum(r for r, (_, side) in zip(ranks, pooled) if side == 1)
+    u2 = r2 - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    var = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if var <= 0:
+        return 1.0
+    z = (u2 - n1 * n2 / 2 - 0.5) / math.sqrt(var)  # continuity correction
+    return 0.5 * math.erfc(z / math.sqrt(2))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Iterator
+
+
+@dataclass
+class StepRecord:
+    name: str
+    started_at: float  # epoch seconds
+    duration_ms: float
+    ok: bool
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class StepRecorder:
+    """Thread-safe in-memory sink for step timings."""
+
+    def __init__(self):
+        self._records: list[StepRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: StepRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def drain(self) -> list[StepRecord]:
+        with self._lock:
+            out, self._records = self._records, []
+        return out
+
+    def snapshot(self) -> list[StepRecord]:
+        with self._lock:
+            return list(self._records)
+
+
+default_recorder = StepRecorder()
+_local = threading.local()
+
+
+def current_recorder() -> StepRecorder:
+    return getattr(_local, "recorder", default_recorder)
+
+
+@contextmanager
+def use_recorder(recorder: StepRecorder) -> Iterator[StepRecorder]:
+    """Route `step()` timings of the current thread into `recorder`."""
+    previous = getattr(_local, "recorder", None)
+    _local.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        if previous is None:
+            del _local.recorder
+        else:
+            _local.recorder = previous
+
+
+@contextmanager
+def step(name: str) -> Iterator[None]:
+    """
+    Time a named user-journey step.
+
+    with step("admin.login"):
+        ...
+    """
+    started_at = time.time()
+    t0 = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        ms = (time.perf_counter() - t0) * 1000
+        current_recorder().add(StepRecord(name, started_at, ms, False, f"{type(e).__name__}: {e}"[:500]))
+        raise
+    ms = (time.perf_counter() - t0) * 1000
+    current_recorder().add(StepRecord(name, started_at, ms, True))
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from playwright.sync_api import Page
+
+from .timeouts import timeouts
+
+# Shared helpers: first element for a CSS/XPath selector (XPath when it starts with
+# "/" or "("), and a fingerprint of what a re-render changes - first and last row
+# plus the header sort indicators, so a sort that keeps both end rows still counts.
+_HELPERS_JS = """
+  const find = (sel) => {
+    if (!sel) return null;
+    if (sel.startsWith("/") || sel.startsWith("(")) {
+      return document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(sel);
+  };
+  const cellText = (el) => (el.innerText ?? el.textContent).replace(/\\s+/g, " ").trim();
+  const fingerprint = (table) => {
+    const rows = table.querySelectorAll("tbody tr");
+    const t = (tr) => [...tr.children].map(cellText).join("|");
+    const sort = [...table.querySelectorAll("thead th")].map((th) => th.getAttribute("aria-sort") || "").join(",");
+    const ends = rows.length ? t(rows[0]) + "#" + t(rows[rows.length - 1]) : "";
+    return ends + "@" + sort;
+  };
+"""
+
+# Reads headers, every body row, sort indicators and the pager state in one round trip.
+_EXTRACT_SCRIPT = """
+(table, nextSelector) => {""" + _HELPERS_JS + """
+  const ths = [...table.querySelectorAll("thead th")];
+  const headers = ths.map(cellText);
+  const sort = Object.fromEntries(ths.filter((th) => th.hasAttribute("aria-sort")).map((th) => [cellText(th), th.getAttribute("aria-sort")]));
+  const rows = [...table.querySelectorAll("tbody tr")].map((tr) => [...tr.children].map(cellText));
+  const next = find(nextSelector);
+  const hasNext = !!next && !next.disabled && next.getAttribute("aria-disabled") !== "true";
+  return {headers, rows, sort, hasNext, fingerprint: fingerprint(table)};
+}
+"""
+
+# Re-queries the table on every poll: apps that re-mount <table> on sort or page
+# change would otherwise leave the predicate reading a detached node. An emptied
+# table (filter with no matches) is a change like any other.
+_CHANGED_SCRIPT = """
+([tableSelector, before]) => {""" + _HELPERS_JS + """
+  const table = find(tableSelector);
+  return !!table && table.isConnected && fingerprint(table) !== before;
+}
+"""
+
+
+def parse_int(value: str) -> int | None:
+    digits = re.sub(r"[^\d-]", "", value)
+    return int(digits) if digits not in ("", "-") else None
+
+
+def parse_datetime(value: str) -> datetime | None:
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M", "%d/%m/%Y %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _slug(header: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", header.lower()).strip("_")
+
+
+@dataclass(frozen=True)
+class Column:
+    key: str  # dict key in extracted rows
+    header: str  # header text as rendered
+    parse: Callable[[str], Any] = str
+
+
+class DataTable:
+    """
+    Bulk reader for an HTML data table.
+
+    `rows()` returns the current page as dicts in one `evaluate`; `iter_rows()`
+    walks the pager and yields rows lazily. Without `columns` every header
+    becomes a snake_case key with the raw text; with `columns` only those are
+    kept and converted by their `parse` function. `table` and `next_button`
+    are CSS or XPath selectors, since they are also resolved inside the page.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        table: str = "table",
+        columns: Sequence[Column] = (),
+        next_button: str | None = None,
+    ):
+        self.page = page
+        self.selector = table
+        self.table = page.locator(table).first
+        self.columns = tuple(columns)
+        self.next_button = next_button
+
+    def _read(self) -> dict:
+        return self.table.evaluate(_EXTRACT_SCRIPT, self.next_button)
+
+    def _to_dicts(self, headers: list[str], rows: list[list[str]]) -> list[dict]:
+        if not self.columns:
+            keys = [_slug(h) for h in headers]
+            return [dict(zip(keys, row)) for row in rows]
+        index = {h: i for i, h in enumerate(headers)}
+        missing = [c.header for c in self.columns if c.header not in index]
+        if missing:
+            raise AssertionError(f"❌ Table columns not found: {missing}. Headers: {headers}")
+        picked = [(c.key, index[c.header], c.parse) for c in self.columns]
+        return [{key: parse(row[i]) if i < len(row) else None for key, i, parse in picked} for row in rows]
+
+    def rows(self) -> list[dict]:
+        data = self._read()
+        return self._to_dicts(data["headers"], data["rows"])
+
+    def iter_rows(self, max_pages: int | None = None) -> Iterator[dict]:
+        """Yield rows page by page, clicking `next_button` until it is missing or disabled."""
+        pages = 0
+        while True:
+            data = self._read()
+            yield from self._to_dicts(data["headers"], data["rows"])
+            pages += 1
+            if not self.next_button or not data["hasNext"] or (max_pages and pages >= max_pages):
+                return
+            self.page.locator(self.next_button).first.click()
+            self._wait_changed(data["fingerprint"], "table.next_page")
+
+    def sort_direction(self, header: str) -> str | None:
+        """aria-sort of the column headed `header`: "ascending", "descending", "none"/"other", or None if unset."""
+        return self._read()["sort"].get(header)
+
+    def after(self, action: Callable[[], object], step: str = "table.refresh") -> None:
+        """
+        Run `action` (a sort click, a filter input...) and wait until the table re-renders.
+
+        Re-rendered means a different first or last row or a changed aria-sort
+        on a header, so a sort that only flips the indicator also returns.
+        """
+        fingerprint = self._read()["fingerprint"]
+        action()
+        self._wait_changed(fingerprint, step)
+
+    def _wait_changed(self, fingerprint: str, step: str) -> None:
+        with timeouts.window_for(step, 15000) as t:
+            self.page.wait_for_function(_CHANGED_SCRIPT, arg=[self.selector, fingerprint], timeout=t)
+
+
+# =========================
+# In-memory assertions (no browser round trips)
+# =========================
+def filter_rows(rows: Iterable[dict], **criteria: Any) -> list[dict]:
+    """Rows whose values equal every criterion; a callable criterion is used as a predicate."""
+    def match(row: dict) -> bool:
+        return all(v(row.get(k)) if callable(v) else row.get(k) == v for k, v in criteria.items())
+
+    return [r for r in rows if match(r)]
+
+
+def assert_sorted(
+    rows: Sequence[dict],
+    key: str,
+    descending: bool = False,
+    by: Callable[[Any], Any] | None = None,
+) -> None:
+    """
+    Rows are ordered by `key`; None values are skipped.
+
+    `by` maps each value before comparing, e.g. `str.casefold` for a
+    case-insensitive sort or a locale collation key.
+    """
+    values = [r[key] for r in rows]
+    for i in range(1, len(values)):
+        a, b = values[i - 1], values[i]
+        if a is None or b is None:
+            continue
+        ka, kb = (by(a), by(b)) if by is not None else (a, b)
+        if (ka < kb) if descending else (ka > kb):
+            raise AssertionError(
+                f"❌ Rows not sorted by {key!r} ({'desc' if descending else 'asc'}): "
+                f"row {i} {a!r} then row {i + 1} {b!r}"
+            )
+
+
+def assert_contains(rows: Iterable[dict], **criteria: Any) -> dict:
+    rows = list(rows)
+    found = filter_rows(rows, **criteria)
+    if not found:
+        raise AssertionError(f"❌ No row matches {criteria} among {len(rows)} rows")
+    return found[0]
+
+
+def assert_all(rows: Iterable[dict], description: str, predicate: Callable[[dict], bool]) -> None:
+    bad = [r for r in rows if not predicate(r)]
+    if bad:
+        raise AssertionError(f"❌ {len(bad)} row(s) violate: {description}. First: {bad[0]}")
+
+
+def assert_unique(rows: Iterable[dict], key: str) -> None:
+    seen: dict[Any, int] = {}
+    for i, r in enumerate(rows, 1):
+        if r[key] in seen:
+            raise AssertionError(f"❌ Duplicate {key}={r[key]!r} in rows {seen[r[key]]} and {i}")
+        seen[r[key]] = i
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from .config import settings
+from .stats import percentile
+
+TIMINGS_DIR = Path("reports") / "timings"
+
+
+def _parse_overrides(raw: str) -> dict[str, int]:
+    # "login.result=30000,navigation=45000"
+    out = {}
+    for part in raw.split(","):
+        if "=" in part:
+            name, value = part.split("=", 1)
+            out[name.strip()] = int(value)
+    return out
+
+
+def _target_key() -> str:
+    # The same ENV can point at QA or at a local stub; their latencies must not mix.
+    target = "|".join((settings.dashboard_base_url, settings.customer_base_url, settings.customer_api_url))
+    return f"{settings.env}.{hashlib.sha1(target.encode()).hexdigest()[:8]}"
+
+
+class TimeoutPolicy:
+    """
+    Central source of wait timeouts, looked up by step name.
+
+    In "adaptive" mode a step's timeout is p99 of its recorded latencies
+    (for the current ENV and target URLs) times `safety_factor`, never below `floor_ms` and
+    never above the fixed default the page object passes in. Steps with
+    fewer than `min_samples` recordings, "fixed" mode and TIMEOUT_OVERRIDES
+    all return fixed values.
+    """
+
+    def __init__(
+        self,
+        env: str | None = None,
+        mode: str = settings.timeout_mode,
+        safety_factor: float = settings.timeout_safety_factor,
+        floor_ms: int = settings.timeout_floor_ms,
+        min_samples: int = 20,
+        window: int = 200,
+        root: Path = TIMINGS_DIR,
+    ):
+        self.env = env or _target_key()
+        self.mode = mode
+        self.safety_factor = safety_factor
+        self.floor_ms = floor_ms
+        self.min_samples = min_samples
+        self.window = window
+        self.root = root
+        self.overrides = _parse_overrides(settings.timeout_overrides)
+        self._history: dict[str, list[float]] | None = None
+        self._new: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def _own_file(self) -> Path:
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return self.root / f"{self.env}-{worker}.json"
+
+    @property
+    def history(self) -> dict[str, list[float]]:
+        if self._history is None:
+            merged: dict[str, list[float]] = {}
+            for f in sorted(self.root.glob(f"{self.env}-*.json")):
+                try:
+                    data = json.loads(f.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    continue
+                for name, samples in data.items():
+                    merged.setdefault(name, []).extend(samples)
+            self._history = merged
+        return self._history
+
+    def get(self, step: str, default: int) -> int:
+        if step in self.overrides:
+            return self.overrides[step]
+        if self.mode != "adaptive":
+            return default
+        samples = self.history.get(step, [])
+        if len(samples) < self.min_samples:
+            return default
+        learned = int(percentile(samples, 99) * self.safety_factor)
+        return min(default, max(self.floor_ms, learned))
+
+    def record(self, step: str, elapsed_ms: float) -> None:
+        if settings.selector_profile:
+            return  # profiling evaluates inside the waits; those timings would skew the history
+        with self._lock:
+            self._new.setdefault(step, []).append(round(elapsed_ms, 1))
+
+    @contextmanager
+    def window_for(self, step: str, default: int) -> Iterator[int]:
+        """
+        Yield the timeout for `step` and record how long the block took.
+
+        with timeouts.window_for("login.form_visible", 20000) as t:
+            locator.wait_for(state="visible", timeout=t)
+
+        A block that fails after using up its whole window is recorded at the
+        window length, so a step that keeps timing out pushes its p99 up
+        instead of being left out of the history.
+        """
+        timeout = self.get(step, default)
+        t0 = time.perf_counter()
+        try:
+            yield timeout
+        except BaseException:
+            if (time.perf_counter() - t0) * 1000 >= timeout:
+                self.record(step, timeout)
+            raise
+        self.record(step, (time.perf_counter() - t0) * 1000)
+
+    def save(self) -> Path | None:
+        """Append this process's samples to its own file, keeping the last `window` per step."""
+        with self._lock:
+            new, self._new = self._new, {}
+        if not new:
+            return None
+        path = self._own_file
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        for name, samples in new.items():
+            data[name] = (data.get(name, []) + samples)[-self.window:]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+    def report(self) -> dict[str, dict]:
+        """Sample count and p99 (ms) of the recorded history per step, for debugging the policy."""
+        return {
+            name: {"samples": len(s), "p99_ms": round(percentile(s, 99), 1)}
+            for name, s in sorted(self.history.items())
+        }
+
+
+timeouts = TimeoutPolicy()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from playwright.sync_api import Page, Error as PlaywrightError
+
+from shared.reporting.attachments import VIDEOS
+
+from .config import settings
+
+
+def _parse_size(raw: str) -> dict[str, int]:
+    w, _, h = raw.lower().partition("x")
+    return {"width": int(w), "height": int(h)}
+
+
+@dataclass
+class _Encode:
+    proc: subprocess.Popen
+    source: Path
+    target: Path
+
+
+class VideoRecorder:
+    """
+    Failure-only screen recording for one process (xdist worker or plain run).
+
+    Contexts record at `size` into a scratch directory. After the context
+    closes, a passing test's video is deleted straight away; a failing one
+    is moved into the run directory and, when ffmpeg is available, trimmed to
+    the last `tail_s` seconds by a background ffmpeg process. Videos that would
+    push the run directory past `max_mb` are dropped.
+    """
+
+    def __init__(
+        self,
+        mode: str = settings.video,
+        size: str = settings.video_size,
+        tail_s: int = settings.video_tail_s,
+        max_mb: float = settings.video_max_mb,
+        root: Path = VIDEOS,
+    ):
+        self.enabled = mode == "on-failure"
+        self.size = _parse_size(size)
+        self.tail_s = tail_s
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.root = root
+        self.run_dir = root / datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.kept: list[Path] = []
+        self.dropped = 0
+        self._encodes: list[_Encode] = []
+        self._lock = threading.Lock()
+        self._ffmpeg = shutil.which("ffmpeg")
+
+    @property
+    def scratch_dir(self) -> Path:
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return self.root / ".raw" / worker
+
+    def context_options(self) -> dict:
+        if not self.enabled:
+            return {}
+        return {"record_video_dir": str(self.scratch_dir), "record_video_size": self.size}
+
+    def _run_bytes(self) -> int:
+        # Shared by every worker of the run, so measure the directory, not our own list.
+        if not self.run_dir.exists():
+            return 0
+        return sum(f.stat().st_size for f in self.run_dir.iterdir() if f.is_file())
+
+    def finish(self, page: Page, name: str, failed: bool) -> Path | None:
+        """Call after the page's context is closed (the file is only complete then)."""
+        if not self.enabled or page.video is None:
+            return None
+        try:
+            raw = Path(page.video.path())
+        except PlaywrightError:
+            return None
+        if not failed or not raw.exists():
+            raw.unlink(missing_ok=True)
+            return None
+
+        with self._lock:
+            if self._run_bytes() + raw.stat().st_size > self.max_bytes:
+                raw.unlink(missing_ok=True)
+                self.dropped += 1
+                return None
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            target = self.run_dir / f"{name}.webm"
+            if not self._ffmpeg or not self.tail_s:
+                shutil.move(str(raw), target)
+            else:
+                source = self.run_dir / f"{name}.full.webm"
+                shutil.move(str(raw), source)
+                cmd = [
+                    self._ffmpeg, "-nostdin", "-loglevel", "error", "-y",
+                    "-sseof", f"-{self.tail_s}", "-i", str(source),
+                    "-an", "-c:v", "libvpx", "-b:v", "300k", "-deadline", "realtime", "-cpu-used", "8",
+                    str(target),
+                ]
+                proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                self._encodes.append(_Encode(proc, source, target))
+            self.kept.append(target)
+            return target
+
+    def wait(self, timeout_s: float = 60.0) -> None:
+        """Wait for background trims; on failure keep the untrimmed recording instead."""
+        with self._lock:
+            encodes, self._encodes = self._encodes, []
+        for e in encodes:
+            try:
+                ok = e.proc.wait(timeout=timeout_s) == 0
+            except subprocess.TimeoutExpired:
+                e.proc.kill()
+                ok = False
+            if ok and e.target.exists():
+                e.source.unlink(missing_ok=True)
+            else:
+                e.target.unlink(missing_ok=True)
+                os.replace(e.source, e.target)
+
+
+videos = VideoRecorder()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import io
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image, ImageDraw
+except ImportError as e:  # optional dependency group
+    raise ImportError("Visual checks need numpy and Pillow: pip install -e .[visual]") from e
+
+from .config import ROOT_DIR, settings
+
+BASELINE_DIR = ROOT_DIR / "testdata" / "visual"
+DIFF_DIR = Path("artifacts") / "visual"
+
+# (x, y, width, height) in screenshot pixels
+Region = tuple[int, int, int, int]
+
+
+def dhash(img: "Image.Image", size: int = 16) -> int:
+    """Difference hash: sign of horizontal gradients on a size x size grayscale thumbnail."""
+    small = np.asarray(img.convert("L").resize((size + 1, size), Image.BILINEAR), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def paint_masks(img: "Image.Image", masks: tuple[Region, ...]) -> "Image.Image":
+    """Copy of `img` with every mask region filled, so masked content can't change the hash."""
+    if not masks:
+        return img
+    painted = img.convert("RGB")
+    draw = ImageDraw.Draw(painted)
+    for x, y, w, h in masks:
+        draw.rectangle((x, y, x + w - 1, y + h - 1), fill=(255, 0, 255))
+    return painted
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def baseline_path(page_name: str, browser: str, viewport: dict | None, name: str) -> Path:
+    vp = f"{viewport['width']}x{viewport['height']}" if viewport else "window"
+    return BASELINE_DIR / page_name / browser / vp / f"{name}.png"
+
+
+def _artifact_stem(baseline: Path) -> str:
+    # <PageObject>-<browser>-<viewport>-<name>: one set of evidence per engine and viewport.
+    return "-".join((*baseline.parent.parts[-3:], baseline.stem))
+
+
+@dataclass
+class VisualResult:
+    name: str
+    status: str  # "hash-match" | "pixel-match" | "new" | "updated" | "size-mismatch" | "diff"
+    hash_distance: int | None = None
+    diff_ratio: float | None = None
+    elapsed_ms: float = 0.0
+    artifacts: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.status not in ("size-mismatch", "diff")
+
+
+def _write_baseline(path: Path, img: "Image.Image", png: bytes, h: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(png)
+    meta = {"dhash": f"{h:x}", "width": img.width, "height": img.height}
+    path.with_suffix(".json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+
+def pixel_diff(actual: "np.ndarray", expected: "np.ndarray", masks: tuple[Region, ...] = (), tolerance: int = 16):
+    """Boolean map of pixels whose largest channel difference exceeds `tolerance`, masks excluded."""
+    changed = np.abs(actual.astype(np.int16) - expected.astype(np.int16)).max(axis=2) > tolerance
+    for x, y, w, h in masks:
+        changed[y:y + h, x:x + w] = False
+    return changed
+
+
+def check(
+    png: bytes,
+    baseline: Path,
+    masks: tuple[Region, ...] = (),
+    max_diff_ratio: float = settings.visual_max_diff,
+    hash_threshold: int = 0,
+    update: bool = settings.visual_update,
+) -> VisualResult:
+    """
+    Compare a PNG screenshot with its baseline.
+
+    The baseline's dHash is read from the JSON next to it, so an unchanged
+    screen costs one thumbnail and no baseline decode. Only when the hashes
+    differ by more than `hash_threshold` bits are both images decoded and
+    diffed per pixel. `masks` are painted over before hashing and ignored
+    by the pixel diff.
+    """
+    t0 = time.perf_counter()
+    img = Image.open(io.BytesIO(png))
+    h = dhash(paint_masks(img, masks))
+    name = baseline.stem
+    meta_path = baseline.with_suffix(".json")
+
+    def done(status: str, **kw) -> VisualResult:
+        return VisualResult(name, status, elapsed_ms=(time.perf_counter() - t0) * 1000, **kw)
+
+    if update or not baseline.exists():
+        existed = baseline.exists()
+        _write_baseline(baseline, img, png, h)
+        return done("updated" if existed else "new")
+
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    distance = hamming(h, int(meta["dhash"], 16))
+    same_size = (img.width, img.height) == (meta["width"], meta["height"])
+    if same_size and distance <= hash_threshold:
+        return done("hash-match", hash_distance=distance)
+
+    DIFF_DIR.mkdir(parents=True, exist_ok=True)
+    actual_path = DIFF_DIR / f"{_artifact_stem(baseline)}-actual.png"
+    actual_path.write_bytes(png)
+    if not same_size:
+        return done("size-mismatch", hash_distance=distance, artifacts=[str(actual_path)])
+
+    actual = np.asarray(img.convert("RGB"))
+    expected = np.asarray(Image.open(baseline).convert("RGB"))
+    changed = pixel_diff(actual, expected, masks)
+    ratio = float(changed.mean())
+    if ratio <= max_diff_ratio:
+        actual_path.unlink(missing_ok=True)
+        return done("pixel-match", hash_distance=distance, diff_ratio=ratio)
+
+    overlay = (expected * 0.3).astype(np.uint8)
+    overlay[changed] = (255, 0, 0)
+    diff_path = DIFF_DIR / f"{_artifact_stem(baseline)}-diff.png"
+    Image.fromarray(overlay).save(diff_path)
+    return done("diff", hash_distance=distance, diff_ratio=ratio, artifacts=[str(actual_path), str(diff_path)])
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import weakref
+from datetime import datetime
+from pathlib import Path
+
+from playwright.sync_api import Page, Error as PlaywrightError
+
+PERF_DIR = Path("reports") / "perf"
+
+# Installed before any page script runs so LCP / CLS / long tasks are
+# observed from the very start of every navigation of the page.
+_OBSERVER_SCRIPT = """
+(() => {
+  if (window.__waakiaPerf) return;
+  const perf = window.__waakiaPerf = {lcp: null, cls: 0, longTasks: 0, tbt: 0};
+  const observe = (type, cb) => {
+    try { new PerformanceObserver((list) => list.getEntries().forEach(cb)).observe({type, buffered: true}); }
+    catch (e) { /* entry type not supported by this engine */ }
+  };
+  observe("largest-contentful-paint", (e) => { perf.lcp = e.renderTime || e.startTime; });
+  observe("layout-shift", (e) => { if (!e.hadRecentInput) perf.cls += e.value; });
+  observe("longtask", (e) => { perf.longTasks += 1; perf.tbt += Math.max(0, e.duration - 50); });
+})();
+"""
+
+_COLLECT_SCRIPT = """
+() => {
+  const nav = performance.getEntriesByType("navigation")[0];
+  const paint = Object.fromEntries(performance.getEntriesByType("paint").map((p) => [p.name, p.startTime]));
+  const p = window.__waakiaPerf || {};
+  const r = (v) => (v === undefined || v === null ? null : Math.round(v * 1000) / 1000);
+  return {
+    ttfb: nav ? r(nav.responseStart - nav.startTime) : null,
+    dom_content_loaded: nav ? r(nav.domContentLoadedEventEnd - nav.startTime) : null,
+    load: nav && nav.loadEventEnd ? r(nav.loadEventEnd - nav.startTime) : null,
+    transfer_size: nav ? nav.transferSize : null,
+    first_paint: r(paint["first-paint"]),
+    fcp: r(paint["first-contentful-paint"]),
+    lcp: r(p.lcp),
+    cls: p.cls === undefined ? null : r(p.cls),
+    long_tasks: p.longTasks === undefined ? null : p.longTasks,
+    tbt: p.tbt === undefined ? null : r(p.tbt),
+    resources: performance.getEntriesByType("resource").length,
+  };
+}
+"""
+
+_installed: "weakref.WeakSet[Page]" = weakref.WeakSet()
+_cdp_sessions: "weakref.WeakKeyDictionary[Page, object]" = weakref.WeakKeyDictionary()
+
+
+def install(page: Page) -> None:
+    """Register the in-page observers once per page."""
+    if page in _installed:
+        return
+    page.add_init_script(_OBSERVER_SCRIPT)
+    _installed.add(page)
+
+
+def _cdp_metrics(page: Page) -> dict:
+    # Chromium only: heap and DOM size from the Performance domain.
+    if page.context.browser is None or page.context.browser.browser_type.name != "chromium":
+        return {}
+    try:
+        session = _cdp_sessions.get(page)
+        if session is None:
+            session = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+            _cdp_sessions[page] = session
+        raw = {m["name"]: m["value"] for m in session.send("Performance.getMetrics")["metrics"]}
+    except PlaywrightError:
+        return {}
+    return {"js_heap_used": raw.get("JSHeapUsedSize"), "dom_nodes": raw.get("Nodes")}
+
+
+def collect(page: Page) -> dict:
+    """Navigation Timing, paint timings, LCP, CLS and long tasks for the current document."""
+    try:
+        metrics = page.evaluate(_COLLECT_SCRIPT)
+    except PlaywrightError:
+        return {}
+    metrics.update(_cdp_metrics(page))
+    return metrics
+
+
+def check_budget(metrics: dict, budget: dict[str, float]) -> list[str]:
+    """Budget violations as readable lines; metrics the engine did not report are skipped."""
+    violations = []
+    for name, limit in budget.items():
+        value = metrics.get(name)
+        if value is not None and value > limit:
+            violations.append(f"{name}={value:g} > budget {limit:g}")
+    return violations
+
+
+class PerfStore:
+    """Append-only JSONL of metrics, one file per process (xdist-safe)."""
+
+    def __init__(self, root: Path = PERF_DIR):
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.path = root / f"metrics-{worker}.jsonl"
+        self._lock = threading.Lock()
+
+    def add(self, url: str, page_name: str, metrics: dict, violations: list[str]) -> None:
+        record = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "test": os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0],
+            "page": page_name,
+            "url": url,
+            "metrics": metrics,
+            "violations": violations,
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+
+perf_store = PerfStore()
@@ -0,0 +1,3 @@
+from .daemon import STATE_FILE, find_daemon, serve, start, stop, touch
+
+__all__ = ["STATE_FILE", "find_daemon", "serve", "start", "stop", "touch"]
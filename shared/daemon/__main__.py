@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from . import find_daemon, serve, start, stop
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        prog="python -m shared.daemon",
+        description="Keep a Chromium running between local pytest runs.",
+    )
+    ap.add_argument("command", choices=["start", "stop", "status", "serve"])
+    ap.add_argument("--idle-timeout", type=float, default=1800, help="seconds without use before exiting")
+    ap.add_argument("--port", type=int, default=0, help="CDP port (default: any free port)")
+    ap.add_argument("--profile", help="launch profile, defaults to LAUNCH_PROFILE")
+    args = ap.parse_args()
+
+    if args.command == "serve":
+        serve(args.idle_timeout, args.port, args.profile)
+    elif args.command == "start":
+        state = start(args.idle_timeout, args.port, args.profile)
+        print(f"🔥 Browser daemon on {state['endpoint']} (pid {state['pid']}, idle timeout {state['idle_timeout_s']:.0f}s)")
+    elif args.command == "stop":
+        print("🛑 Browser daemon stopped" if stop() else "No browser daemon running")
+    else:
+        state = find_daemon()
+        if state is None:
+            print("No browser daemon running")
+        else:
+            up = time.time() - state["started"]
+            print(f"Browser daemon on {state['endpoint']} (pid {state['pid']}, profile {state['profile']}, up {up:.0f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from shared.core.browser_server import ChromiumServer, cdp_version
+from shared.core.config import ROOT_DIR
+from shared.core.launch_profiles import get_profile
+
+STATE_FILE = ROOT_DIR / "artifacts" / ".browser-daemon.json"
+LOG_FILE = ROOT_DIR / "artifacts" / ".browser-daemon.log"
+
+
+def _read_state(path: Path = STATE_FILE) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def find_daemon(path: Path = STATE_FILE) -> dict | None:
+    """State of a running daemon, or None (a stale state file is removed)."""
+    state = _read_state(path)
+    if state is None:
+        return None
+    if cdp_version(state["endpoint"], timeout=0.5) is None:
+        path.unlink(missing_ok=True)
+        return None
+    return state
+
+
+def touch(path: Path = STATE_FILE) -> None:
+    """Mark the daemon as used; its idle timer counts from the state file's mtime."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _open_pages(endpoint: str) -> int:
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/list", timeout=1) as resp:
+            targets = json.load(resp)
+    except (OSError, ValueError):
+        return 0
+    return sum(1 for t in targets if t.get("type") == "page" and t.get("url") != "about:blank")
+
+
+def serve(idle_timeout_s: float, port: int = 0, profile: str | None = None, path: Path = STATE_FILE) -> None:
+    """
+    Run Chromium in the foreground until idle for `idle_timeout_s`, SIGTERM or Ctrl+C.
+
+    Clients bump the state file's mtime (see `touch`); open, non-blank pages
+    also count as activity so a long single test does not get cut off.
+    """
+    srv = ChromiumServer(get_profile(profile), port=port).start()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state = {
+        "pid": os.getpid(),
+        "chromium_pid": srv.pid,
+        "endpoint": srv.endpoint,
+        "profile": srv.profile.name,
+        "headless": srv.headless,
+        "idle_timeout_s": idle_timeout_s,
+        "started": time.time(),
+    }
+    path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            time.sleep(min(5.0, idle_timeout_s))
+            if _open_pages(srv.endpoint):
+                touch(path)
+            elif time.time() - path.stat().st_mtime > idle_timeout_s:
+                break
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        srv.stop()
+        if (_read_state(path) or {}).get("pid") == os.getpid():
+            path.unlink(missing_ok=True)
+
+
+def start(idle_timeout_s: float, port: int = 0, profile: str | None = None, wait_s: float = 30.0) -> dict:
+    """Start the daemon detached from this terminal, or return the one already running."""
+    state = find_daemon()
+    if state is not None:
+        return state
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [sys.executable, "-m", "shared.daemon", "serve", "--idle-timeout", str(idle_timeout_s), "--port", str(port)]
+    if profile:
+        cmd += ["--profile", profile]
+    with open(LOG_FILE, "ab") as log:
+        proc = subprocess.Popen(
+            cmd, cwd=ROOT_DIR, stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True
+        )
+    deadline = time.monotonic() + wait_s
+    while time.monotonic() < deadline:
+        state = find_daemon()
+        if state is not None:
+            return state
+        if proc.poll() is not None:
+            break
+        time.sleep(0.2)
+    raise RuntimeError(f"Browser daemon did not start; see {LOG_FILE}")
+
+
+def stop() -> bool:
+    state = _read_state()
+    if state is None:
+        return False
+    try:
+        os.kill(state["pid"], signal.SIGTERM)
+    except ProcessLookupError:
+        STATE_FILE.unlink(missing_ok=True)
+        return False
+    deadline = time.monotonic() + 10
+    while STATE_FILE.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    return True
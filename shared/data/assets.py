@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import os
+import random
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from shared.core.config import ROOT_DIR
+
+IMAGES_DIR = ROOT_DIR / "testdata" / "images"
+
+MIME_TYPES = {
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+}
+
+
+@dataclass(frozen=True)
+class ImageAsset:
+    path: Path
+    size: int
+    format: str | None = None  # detected from magic bytes, not from the suffix
+    width: int | None = None
+    height: int | None = None
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def valid(self) -> bool:
+        return self.size > 0 and self.format is not None and bool(self.width and self.height)
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES.get(self.format or "", "application/octet-stream")
+
+    def payload(self) -> dict:
+        """In-memory payload accepted by `Locator.set_input_files`."""
+        return {"name": self.name, "mimeType": self.mime_type, "buffer": self.path.read_bytes()}
+
+
+def _sniff(head: bytes) -> tuple[str | None, int | None, int | None]:
+    # A recognised signature with a header cut short keeps its format but no size (invalid asset).
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        if head[12:16] != b"IHDR" or len(head) < 24:
+            return "png", None, None
+        w, h = struct.unpack(">II", head[16:24])
+        return "png", w, h
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        if len(head) < 10:
+            return "gif", None, None
+        w, h = struct.unpack("<HH", head[6:10])
+        return "gif", w, h
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        chunk = head[12:16]
+        if len(head) < 30:
+            return "webp", None, None
+        if chunk == b"VP8 ":
+            w, h = struct.unpack("<HH", head[26:30])
+            return "webp", w & 0x3FFF, h & 0x3FFF
+        if chunk == b"VP8L":
+            b = head[21:25]
+            w = 1 + (((b[1] & 0x3F) << 8) | b[0])
+            h = 1 + (((b[3] & 0x0F) << 10) | (b[2] << 2) | ((b[1] & 0xC0) >> 6))
+            return "webp", w, h
+        if chunk == b"VP8X":
+            w = 1 + int.from_bytes(head[24:27], "little")
+            h = 1 + int.from_bytes(head[27:30], "little")
+            return "webp", w, h
+        return "webp", None, None
+    if head[:2] == b"\xff\xd8":
+        return "jpeg", None, None  # dimensions need a marker walk, see _jpeg_size
+    return None, None, None
+
+
+def _jpeg_size(path: Path) -> tuple[int | None, int | None]:
+    # SOF0..SOF15 (minus DHT/JPG/DAC) carry height/width; walk markers until one shows up.
+    with path.open("rb") as f:
+        f.read(2)
+        while True:
+            prefix = f.read(1)
+            if prefix != b"\xff":
+                return None, None
+            code = 0xFF
+            while code == 0xFF:  # any number of 0xFF fill bytes may precede a marker code
+                raw = f.read(1)
+                if not raw:
+                    return None, None
+                code = raw[0]
+            if code == 0x00:
+                return None, None  # stuffed byte outside entropy-coded data: corrupt
+            if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+                continue
+            length_raw = f.read(2)
+            if len(length_raw) < 2:
+                return None, None
+            length = struct.unpack(">H", length_raw)[0]
+            if length < 2:
+                return None, None  # corrupt segment; seeking back would loop forever
+            if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                data = f.read(5)
+                if len(data) < 5:
+                    return None, None  # truncated file: treated as an invalid asset
+                h, w = struct.unpack(">HH", data[1:5])
+                return w, h
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def inspect_image(path: Path) -> ImageAsset:
+    path = Path(path).resolve()
+    size = path.stat().st_size
+    if size == 0:
+        return ImageAsset(path=path, size=0)
+
+    with path.open("rb") as f:
+        head = f.read(32)
+    fmt, w, h = _sniff(head)
+    if fmt == "jpeg":
+        w, h = _jpeg_size(path)
+    return ImageAsset(path=path, size=size, format=fmt, width=w, height=h)
+
+
+class AssetCatalog:
+    """
+    Index of the image fixtures in a directory.
+
+    The directory is scanned once per catalog; lookups afterwards are pure
+    in-memory filters over the cached metadata, ordered by file name so the
+    same query always returns the same asset.
+    """
+
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif")
+
+    def __init__(self, images_dir: str | Path = IMAGES_DIR):
+        self.images_dir = Path(images_dir).resolve()
+        self._assets: list[ImageAsset] | None = None
+
+    @property
+    def assets(self) -> list[ImageAsset]:
+        if self._assets is None:
+            if not self.images_dir.exists():
+                raise FileNotFoundError(f"Images folder not found: {self.images_dir}")
+            files = sorted(
+                p for p in self.images_dir.iterdir()
+                if p.is_file() and p.suffix.lower() in self.EXTENSIONS
+            )
+            self._assets = [inspect_image(p) for p in files]
+        return self._assets
+
+    def refresh(self) -> None:
+        self._assets = None
+
+    def find(
+        self,
+        *,
+        valid: bool | None = True,
+        format: str | None = None,
+        min_bytes: int | None = None,
+        max_bytes: int | None = None,
+        min_width: int | None = None,
+        min_height: int | None = None,
+        square: bool | None = None,
+        where: Callable[[ImageAsset], bool] | None = None,
+    ) -> Iterator[ImageAsset]:
+        for a in self.assets:
+            if valid is not None and a.valid != valid:
+                continue
+            if format is not None and a.format != format:
+                continue
+            if min_bytes is not None and a.size < min_bytes:
+                continue
+            if max_bytes is not None and a.size > max_bytes:
+                continue
+            if min_width is not None and (a.width or 0) < min_width:
+                continue
+            if min_height is not None and (a.height or 0) < min_height:
+                continue
+            if square is not None and (a.width == a.height and a.width is not None) != square:
+                continue
+            if where is not None and not where(a):
+                continue
+            yield a
+
+    def pick(self, **criteria) -> ImageAsset:
+        asset = next(self.find(**criteria), None)
+        if asset is None:
+            raise FileNotFoundError(f"No image in {self.images_dir} matches {criteria or 'defaults'}")
+        return asset
+
+
+_catalogs: dict[Path, AssetCatalog] = {}
+
+
+def get_catalog(images_dir: str | Path = IMAGES_DIR) -> AssetCatalog:
+    key = Path(images_dir).resolve()
+    if key not in _catalogs:
+        _catalogs[key] = AssetCatalog(key)
+    return _catalogs[key]
+
+
+# =========================
+# Synthetic images
+# =========================
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def synthetic_png(width: int, height: int, *, min_bytes: int = 0, seed: int = 0) -> bytes:
+    """
+    Build a valid RGB PNG of the given dimensions in memory.
+
+    Flat colour compresses to almost nothing, so when `min_bytes` is set the
+    pixels are filled with seeded noise and stored uncompressed until the
+    file reaches that size - enough to exercise "image too large" checks
+    without committing multi-MB fixtures.
+    """
+    row_len = width * 3
+    if min_bytes:
+        rnd = random.Random(seed)
+        row = bytes(rnd.getrandbits(8) for _ in range(row_len))
+        level = 0
+    else:
+        row = bytes((seed * 37 + 90) % 256 for _ in range(row_len))
+        level = 9
+    raw = (b"\x00" + row) * height
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    body = _png_chunk(b"IHDR", ihdr) + _png_chunk(b"IDAT", zlib.compress(raw, level))
+    data = b"\x89PNG\r\n\x1a\n" + body
+    # Pad with an ancillary chunk so the byte target is met regardless of dimensions.
+    pad = min_bytes - len(data) - 12 - 12 - 4  # IEND, chunk framing, "pad\0" keyword
+    if pad > 0:
+        data += _png_chunk(b"teXt", b"pad\x00" + b"0" * pad)
+    return data + _png_chunk(b"IEND", b"")
+
+
+def synthetic_image_payload(
+    width: int,
+    height: int,
+    *,
+    min_bytes: int = 0,
+    name: str | None = None,
+    seed: int = 0,
+) -> dict:
+    name = name or f"synthetic_{width}x{height}.png"
+    buffer = synthetic_png(width, height, min_bytes=min_bytes, seed=seed)
+    return {"name": name, "mimeType": "image/png", "buffer": buffer}
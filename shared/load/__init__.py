@@ -0,0 +1,3 @@
+from .runner import LoadProfile, Stage, run_load, think
+
+__all__ = ["LoadProfile", "Stage", "run_load", "think"]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from shared.core.config import settings
+from .runner import LOAD_DIR, LoadProfile, Stage, format_summary, run_load
+
+
+def _parse_stages(raw: str) -> list[Stage]:
+    # "30:10,60:10,10:0" -> 30s ramp to 10 users, hold 60s, 10s ramp down
+    stages = []
+    for part in raw.split(","):
+        seconds, users = part.split(":")
+        stages.append(Stage(float(seconds.rstrip("s")), int(users)))
+    return stages
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        prog="python -m shared.load",
+        description="Run page-object flows as concurrent virtual users.",
+    )
+    ap.add_argument("scenario", help="module:function, e.g. dashboard_app.load.scenarios:admin_categories")
+    ap.add_argument("--users", type=int, default=5)
+    ap.add_argument("--ramp-up", type=float, default=10.0, help="seconds to reach --users")
+    ap.add_argument("--duration", type=float, default=60.0, help="seconds to hold --users")
+    ap.add_argument("--stages", help="custom profile 'seconds:users,...' (overrides the three above)")
+    ap.add_argument("--iterations", type=int, help="stop each user after N iterations")
+    ap.add_argument("--think", default="1-3", help="think time range in seconds, e.g. 0.5-2")
+    ap.add_argument("--processes", type=int, default=1)
+    ap.add_argument("--base-url", help="defaults to DASHBOARD_BASE_URL, or the stand-in with --stub")
+    ap.add_argument(
+        "--stub",
+        action="store_true",
+        default=settings.dashboard_stub,
+        help="start dashboard_app.stub in this process and load it (default: DASHBOARD_STUB)",
+    )
+    ap.add_argument("--out", type=Path, default=LOAD_DIR)
+    args = ap.parse_args()
+    if args.processes < 1:
+        ap.error("--processes must be >= 1")
+
+    stub = None
+    if args.stub:
+        from dashboard_app.stub import build_server
+
+        try:
+            stub = build_server(port=settings.stub_port).start()
+        except OSError:
+            print(f"ℹ️ Port {settings.stub_port} is busy; assuming a stand-in is already running there")
+        # The stand-in accepts any non-empty login; workers are spawned and read these from the environment.
+        if not settings.admin_user or not settings.admin_pass:
+            os.environ["ADMIN_USER"] = settings.admin_user or "load@stub.local"
+            os.environ["ADMIN_PASS"] = settings.admin_pass or "stub"
+    base_url = args.base_url or (
+        f"http://127.0.0.1:{settings.stub_port}" if args.stub else settings.dashboard_base_url
+    )
+    if not base_url:
+        ap.error("no target: set DASHBOARD_BASE_URL, pass --base-url, or use --stub")
+
+    lo, _, hi = args.think.partition("-")
+    stages = _parse_stages(args.stages) if args.stages else [
+        Stage(args.ramp_up, args.users),
+        Stage(args.duration, args.users),
+    ]
+    profile = LoadProfile(
+        stages=stages,
+        think_min_s=float(lo),
+        think_max_s=float(hi or lo),
+        processes=args.processes,
+        iterations=args.iterations,
+    )
+
+    try:
+        out_dir = run_load(args.scenario, profile, base_url, args.out)
+    finally:
+        if stub is not None:
+            stub.stop()
+    summary = json.loads((out_dir / "summary.json").read_text(encoding="utf-8"))
+    print(format_summary(summary))
+    print(f"\nResults: {out_dir.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import importlib
+import json
+import multiprocessing as mp
+import random
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from playwright.sync_api import Page
+
+from shared.core.browser_server import BrowserClient, ChromiumServer
+from shared.core.config import settings
+from shared.core.stats import summarize
+from shared.core.steps import StepRecorder, step, use_recorder
+
+Scenario = Callable[[Page], None]
+
+LOAD_DIR = Path("reports") / "load"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Move linearly to `target` virtual users over `duration_s` seconds."""
+
+    duration_s: float
+    target: int
+
+
+@dataclass
+class LoadProfile:
+    stages: list[Stage] = field(default_factory=lambda: [Stage(0, 1), Stage(60, 1)])
+    think_min_s: float = 1.0
+    think_max_s: float = 3.0
+    processes: int = 1
+    iterations: int | None = None  # per virtual user; None = run until the profile ends
+
+    @classmethod
+    def ramp(cls, users: int, ramp_up_s: float, hold_s: float, **kwargs) -> "LoadProfile":
+        return cls(stages=[Stage(ramp_up_s, users), Stage(hold_s, users)], **kwargs)
+
+    @property
+    def total_s(self) -> float:
+        return sum(s.duration_s for s in self.stages)
+
+    @property
+    def peak_users(self) -> int:
+        return max((s.target for s in self.stages), default=0)
+
+    def schedule(self) -> list[tuple[float, float]]:
+        """
+        (start, stop) offsets in seconds for every virtual user.
+
+        User `i` is alive while the interpolated user count is above `i`, so
+        ramp-up stages start users one by one and ramp-down stages stop them
+        in reverse order.
+        """
+        windows: list[list[float | None]] = [[None, None] for _ in range(self.peak_users)]
+        t, users = 0.0, 0
+        for s in self.stages:
+            if s.target > users:
+                for i in range(users, s.target):
+                    frac = (i - users) / (s.target - users)
+                    windows[i][0] = t + frac * s.duration_s
+                    windows[i][1] = None
+            elif s.target < users:
+                for i in range(users - 1, s.target - 1, -1):
+                    frac = (users - i) / (users - s.target)
+                    windows[i][1] = t + frac * s.duration_s
+            t += s.duration_s
+            users = s.target
+        return [(w[0], w[1] if w[1] is not None else t) for w in windows if w[0] is not None]
+
+
+# =========================
+# Think time
+# =========================
+_local = threading.local()
+
+
+def think() -> None:
+    """Pause like a real user between steps. No-op outside a load run."""
+    bounds = getattr(_local, "think", None)
+    if bounds:
+        time.sleep(random.uniform(*bounds))
+
+
+# =========================
+# Worker process
+# =========================
+def _load_scenario(ref: str) -> Scenario:
+    module, _, name = ref.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def _run_user(
+    vu: int,
+    window: tuple[float, float],
+    t0: float,
+    scenario: Scenario,
+    profile: LoadProfile,
+    base_url: str,
+    endpoint: str | None,
+    sink,
+    sink_lock: threading.Lock,
+) -> None:
+    start, stop = window
+    time.sleep(max(0.0, t0 + start - time.time()))
+
+    _local.think = (profile.think_min_s, profile.think_max_s)
+    recorder = StepRecorder()
+    # Sync Playwright objects belong to the thread that created them, so each user
+    # has its own driver connection; with `endpoint` they all attach to the same
+    # Chromium and only add a context each.
+    client = BrowserClient(endpoint)
+    try:
+        iteration = 0
+        while time.time() < t0 + stop:
+            if profile.iterations is not None and iteration >= profile.iterations:
+                break
+            context = client.new_context(settings.browser, base_url)
+            page = context.new_page()
+            page.base_url = base_url
+            with use_recorder(recorder):
+                try:
+                    with step("iteration"):
+                        scenario(page)
+                except Exception:
+                    pass  # recorded by step(); keep the virtual user alive
+                finally:
+                    context.close()
+
+            lines = [
+                json.dumps({"vu": vu, "iteration": iteration, **r.to_dict()})
+                for r in recorder.drain()
+            ]
+            with sink_lock:
+                sink.write("\n".join(lines) + "\n")
+                sink.flush()
+            iteration += 1
+            think()
+    finally:
+        client.close()  # also stops this user's Playwright driver
+
+
+def _worker(
+    worker_id: int,
+    users: list[tuple[int, tuple[float, float]]],
+    t0: float,
+    scenario_ref: str,
+    profile: LoadProfile,
+    base_url: str,
+    out_dir: str,
+) -> None:
+    scenario = _load_scenario(scenario_ref)
+    lock = threading.Lock()
+    # One browser per process, one context per virtual user. Firefox/WebKit cannot
+    # be shared across threads without a server, so there each user launches its own.
+    server = ChromiumServer().start() if settings.browser == "chromium" else None
+    endpoint = server.endpoint if server else None
+    try:
+        with open(Path(out_dir) / f"samples-{worker_id}.jsonl", "a", encoding="utf-8") as sink:
+            threads = [
+                threading.Thread(
+                    target=_run_user,
+                    args=(vu, window, t0, scenario, profile, base_url, endpoint, sink, lock),
+                    name=f"vu-{vu}",
+                    daemon=True,
+                )
+                for vu, window in users
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+    finally:
+        if server is not None:
+            server.stop()
+
+
+# =========================
+# Controller
+# =========================
+def summarize_samples(out_dir: Path, wall_s: float | None = None) -> dict:
+    by_step: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    for part in sorted(out_dir.glob("samples-*.jsonl")):
+        with part.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                s = json.loads(line)
+                by_step.setdefault(s["name"], []).append(s["duration_ms"])
+                if not s["ok"]:
+                    errors[s["name"]] = errors.get(s["name"], 0) + 1
+
+    steps = {}
+    for name, durations in by_step.items():
+        stats = summarize(durations)
+        stats["errors"] = errors.get(name, 0)
+        stats["error_rate"] = stats["errors"] / stats["count"]
+        if wall_s:
+            stats["throughput_per_s"] = stats["count"] / wall_s
+        steps[name] = stats
+    return {"wall_s": wall_s, "steps": steps}
+
+
+def format_summary(summary: dict) -> str:
+    header = f"{'step':<32}{'count':>7}{'err%':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    lines = [header, "-" * len(header)]
+    for name, s in sorted(summary["steps"].items()):
+        lines.append(
+            f"{name:<32}{s['count']:>7}{s['error_rate'] * 100:>6.1f}%"
+            f"{s['p50']:>10.0f}{s['p95']:>10.0f}{s['p99']:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+def run_load(
+    scenario_ref: str,
+    profile: LoadProfile,
+    base_url: str,
+    out_root: Path = LOAD_DIR,
+) -> Path:
+    """
+    Run `scenario_ref` ("package.module:function") as virtual users.
+
+    Users are spread round-robin over `profile.processes` spawned processes;
+    each process runs one shared Chromium and each user is a thread with a
+    fresh context per iteration. Raw samples land in samples-*.jsonl, the
+    aggregate in summary.json.
+    """
+    if profile.processes < 1:
+        raise ValueError(f"processes must be >= 1, got {profile.processes}")
+    _load_scenario(scenario_ref)  # fail fast on a bad reference
+
+    out_dir = out_root / datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    windows = profile.schedule()
+    buckets: list[list[tuple[int, tuple[float, float]]]] = [[] for _ in range(profile.processes)]
+    for vu, window in enumerate(windows):
+        buckets[vu % profile.processes].append((vu, window))
+
+    ctx = mp.get_context("spawn")  # Playwright does not survive fork()
+    t0 = time.time() + 2.0  # let the processes boot before the first user starts
+    procs = [
+        ctx.Process(
+            target=_worker,
+            args=(i, users, t0, scenario_ref, profile, base_url, str(out_dir)),
+            name=f"load-worker-{i}",
+        )
+        for i, users in enumerate(buckets)
+        if users
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+    summary = summarize_samples(out_dir, wall_s=time.time() - t0)
+    summary["scenario"] = scenario_ref
+    summary["base_url"] = base_url
+    summary["profile"] = asdict(profile)
+    (out_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return out_dir
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from shared.core.api_checks import BatchStats, CheckJob, CheckResult, case_id, run_checks
+from shared.core.config import settings
+
+_loop: asyncio.AbstractEventLoop | None = None
+_results: dict["ApiCheckItem", CheckResult] = {}
+_batches: list[BatchStats] = []
+
+
+class ApiCheckItem(pytest.Item):
+    """
+    One `@api_check` function (or one of its cases).
+
+    The first item of a module to run executes every not-yet-run check of that
+    module concurrently on the session's event loop; each item then reports
+    its own stored outcome. Under xdist a worker only knows the item it was
+    handed, so there each item runs on its own.
+    """
+
+    def __init__(self, *, fn, spec, index: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.fn = fn
+        self.spec = spec
+        self.case = spec.cases[index]
+        self.add_marker("api")
+
+    def runtest(self) -> None:
+        if self not in _results:
+            _run_batch(self)
+        result = _results.pop(self)
+        self.check_ms = result.ms
+        if result.error is not None:
+            raise result.error
+
+    def reportinfo(self):
+        return self.path, self.fn.__code__.co_firstlineno - 1, self.name
+
+
+def _run_batch(item: ApiCheckItem) -> None:
+    global _loop
+    if hasattr(item.config, "workerinput"):
+        batch = [item]
+    else:
+        batch = [
+            i for i in item.session.items
+            if isinstance(i, ApiCheckItem) and i.parent is item.parent and not getattr(i, "_batched", False)
+        ]
+    for i in batch:
+        i._batched = True
+    jobs = [CheckJob(i, i.fn, i.spec, i.case) for i in batch]
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    results, stats = _loop.run_until_complete(run_checks(jobs, settings.api_concurrency))
+    _results.update(results)
+    _batches.append(stats)
+
+
+def pytest_pycollect_makeitem(collector, name, obj):
+    spec = getattr(obj, "_api_check", None)
+    if spec is None or not callable(obj):
+        return None
+    items = []
+    for index in range(len(spec.cases)):
+        cid = case_id(spec, index)
+        items.append(ApiCheckItem.from_parent(
+            collector, name=f"{name}[{cid}]" if cid is not None else name, fn=obj, spec=spec, index=index,
+        ))
+    return items
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    # The batch runs inside the first item's call; report each check's own time instead.
+    if isinstance(item, ApiCheckItem) and rep.when == "call" and hasattr(item, "check_ms"):
+        rep.duration = item.check_ms / 1000
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _batches:
+        return
+    checks = sum(b.checks for b in _batches)
+    wall = sum(b.wall_ms for b in _batches) / 1000
+    busy = sum(b.busy_ms for b in _batches) / 1000
+    terminalreporter.write_sep("-", "api checks")
+    terminalreporter.write_line(
+        f"  {checks} check(s) in {len(_batches)} batch(es): {wall:.2f}s wall, {busy:.2f}s of check time "
+        f"(x{busy / wall if wall else 0:.1f} overlap, concurrency {settings.api_concurrency})"
+    )
+
+
+def pytest_unconfigure(config):
+    global _loop
+    if _loop is not None:
+        _loop.close()
+        _loop = None
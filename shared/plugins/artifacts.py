@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from shared.artifacts import close_store, get_store
+from shared.core.config import settings
+from shared.core.logger import archive_logs
+from shared.reporting.live_report import prune_runs
+
+
+@pytest.hookimpl(trylast=True)  # after the other plugins have stored their last artifacts
+def pytest_sessionfinish(session):
+    archive_logs()
+    # Retention runs once per run, in the controller, after every worker is done.
+    store = get_store()
+    if store is not None and not hasattr(session.config, "workerinput"):
+        session.config._artifact_gc = store.gc(settings.artifact_max_age_days, settings.artifact_max_mb)
+        session.config._live_pruned = prune_runs(
+            settings.artifact_max_age_days, keep=getattr(session.config, "_live_report_dir", None)
+        )
+    close_store()  # checkpoint and drop index.db-wal / -shm
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = getattr(config, "_artifact_gc", None)
+    if stats is not None and stats.objects_removed:
+        terminalreporter.write_line(
+            f"artifact store: removed {stats.objects_removed} object(s), {stats.bytes_freed / 2**20:.1f} MB freed"
+        )
+    pruned = getattr(config, "_live_pruned", 0)
+    if pruned:
+        terminalreporter.write_line(f"live reports: removed {pruned} run director{'y' if pruned == 1 else 'ies'}")
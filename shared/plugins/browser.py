@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from shared import daemon
+from shared.artifacts import get_store
+from shared.core.browser_factory import new_context
+from shared.core.browser_server import BrowserClient, ChromiumServer
+from shared.core.config import settings
+from shared.core.video import videos
+from shared.reporting.attachments import TRACES
+
+_client: BrowserClient | None = None
+_videos_seen: list[tuple[str, str]] = []
+
+
+def _uses_chromium() -> bool:
+    engines = [b.lower() for b in settings.browsers] or [settings.browser.lower()]
+    return "chromium" in engines
+
+
+def pytest_configure(config):
+    # The controller (or the only process without xdist) decides where Chromium
+    # comes from: a run-wide server it owns, a warm daemon from an earlier
+    # `python -m shared.daemon start`, or a normal launch. Workers receive the
+    # endpoint through workerinput.
+    global _client
+    if hasattr(config, "workerinput"):
+        videos.run_dir = Path(config.workerinput.get("video_run_dir", videos.run_dir))
+        endpoint = config.workerinput.get("browser_server")
+        if endpoint or settings.browser_server:
+            _client = BrowserClient(endpoint)
+        return
+
+    endpoint = None
+    if settings.browser_server and _uses_chromium():
+        try:
+            config._browser_server = ChromiumServer().start()
+        except (OSError, RuntimeError) as e:
+            raise pytest.UsageError(f"BROWSER_SERVER=true but Chromium could not be started: {e}") from e
+        endpoint = config._browser_server.endpoint
+    elif settings.browser_daemon and _uses_chromium():
+        config._browser_daemon = daemon.find_daemon()
+        if config._browser_daemon is not None:
+            daemon.touch()
+            endpoint = config._browser_daemon["endpoint"]
+    config._browser_endpoint = endpoint
+    if endpoint or settings.browser_server:
+        _client = BrowserClient(endpoint)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["browser_server"] = getattr(node.config, "_browser_endpoint", None)
+    node.workerinput["video_run_dir"] = str(videos.run_dir)  # one directory (and cap) for the whole run
+
+
+def pytest_unconfigure(config):
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+    srv = getattr(config, "_browser_server", None)
+    if srv is not None:
+        srv.stop()
+    if getattr(config, "_browser_daemon", None) is not None:
+        daemon.touch()  # idle timeout counts from the end of the last run
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Exposes item.rep_setup / rep_call so the page fixture knows the outcome at teardown.
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+
+
+def pytest_runtest_logreport(report):
+    # Controller side: every worker's kept videos end up here.
+    for name, value in report.user_properties:
+        if name == "video":
+            _videos_seen.append((report.nodeid, value))
+
+
+def pytest_sessionfinish(session):
+    videos.wait()  # background trims of this process
+
+
+def pytest_report_header(config):
+    srv = getattr(config, "_browser_server", None)
+    if srv is not None:
+        return f"browser server: chromium pid {srv.pid} at {srv.endpoint}"
+    state = getattr(config, "_browser_daemon", None)
+    if state is not None:
+        return f"browser daemon: chromium pid {state['chromium_pid']} at {state['endpoint']} (profile {state['profile']})"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    srv = getattr(config, "_browser_server", None)
+    if srv is not None and srv.restarts:
+        terminalreporter.write_line(f"browser server restarted {srv.restarts} time(s) during the run")
+    if _videos_seen and not hasattr(config, "workerinput"):
+        tr = terminalreporter
+        tr.write_sep("-", "failure videos")
+        for nodeid, value in _videos_seen:
+            tr.write_line(f"  {nodeid}: {value}")
+
+
+@pytest.fixture(scope="session")
+def app_base_url() -> str:
+    # Overridden per app in <app>/conftest.py.
+    return settings.customer_base_url
+
+
+def _failed(item) -> bool:
+    rep = getattr(item, "rep_call", None) or getattr(item, "rep_setup", None)
+    return rep is not None and rep.failed
+
+
+def _artifact_name(item) -> str:
+    # item.name repeats across modules; the nodeid is unique within a run.
+    return re.sub(r"[^\w.-]+", "_", item.nodeid.replace(".py::", "__")).strip("_")
+
+
+def _finish_trace(item, context) -> None:
+    if settings.trace != "on-failure":
+        return
+    if not _failed(item):
+        context.tracing.stop()
+        return
+    path = TRACES / f"{_artifact_name(item)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    context.tracing.stop(path=str(path))
+    store = get_store()
+    if store is not None:
+        path = store.put_file(path, "trace", nodeid=item.nodeid)
+    item.user_properties.append(("trace", str(path)))
+
+
+def _finish_video(item, page) -> None:
+    failed = _failed(item)
+    dropped = videos.dropped
+    path = videos.finish(page, _artifact_name(item), failed)
+    if path is not None:
+        item.user_properties.append(("video", str(path)))
+    elif videos.dropped > dropped:
+        item.user_properties.append(("video", "dropped: per-run cap reached"))
+
+
+@pytest.fixture(scope="function")
+def page(request, browser_name, app_base_url):
+    extra = videos.context_options()
+    if _client is not None:
+        context = _client.new_context(browser_name, app_base_url, **extra)
+        closers = []
+    else:
+        p, browser, context = new_context(app_base_url, browser_name=browser_name, context_options=extra)
+        closers = [browser.close, p.stop]
+    if settings.trace == "on-failure":
+        context.tracing.start(screenshots=True, snapshots=True)
+    page = context.new_page()
+    page.base_url = app_base_url
+    yield page
+    _finish_trace(request.node, context)
+    context.close()
+    _finish_video(request.node, page)
+    for close in closers:
+        close()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from shared.core.config import settings
+
+MATRIX_REPORT = Path("reports") / "matrix.json"
+
+_per_engine: dict[str, dict] = {}
+
+
+def _engines() -> list[str]:
+    return [b.lower() for b in settings.browsers] or [settings.browser.lower()]
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "browsers(*names): restrict a test to these engines in matrix mode")
+    # One engine per xdist worker: group items by engine and schedule groups whole.
+    # Workers re-parse the command line, so they learn about the switch via workerinput.
+    if not settings.browsers:
+        return
+    if hasattr(config, "workerinput"):
+        if config.workerinput.get("matrix_loadgroup"):
+            config.option.loadgroup = True
+    elif getattr(config.option, "dist", "no") == "load":
+        config.option.dist = "loadgroup"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["matrix_loadgroup"] = node.config.getvalue("dist") == "loadgroup"
+
+
+@pytest.fixture(scope="session")
+def browser_name(request) -> str:
+    return getattr(request, "param", settings.browser.lower())
+
+
+def pytest_generate_tests(metafunc):
+    if not settings.browsers or "browser_name" not in metafunc.fixturenames:
+        return
+    engines = _engines()
+    marker = metafunc.definition.get_closest_marker("browsers")
+    if marker is not None:
+        engines = [e for e in engines if e in marker.args]
+    metafunc.parametrize("browser_name", engines, indirect=True, ids=engines, scope="session")
+
+
+@pytest.hookimpl(tryfirst=True)  # before xdist turns xdist_group marks into nodeid suffixes
+def pytest_collection_modifyitems(config, items):
+    if not settings.browsers:
+        return
+    for item in items:
+        engine = getattr(item, "callspec", None) and item.callspec.params.get("browser_name")
+        if engine:
+            item.add_marker(pytest.mark.xdist_group(name=engine))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    callspec = getattr(item, "callspec", None)
+    engine = callspec.params.get("browser_name") if callspec else None
+    if engine:
+        rep.user_properties.append(("browser", engine))
+
+
+def pytest_runtest_logreport(report):
+    # Runs in the xdist controller, so results from every worker end up here.
+    engine = dict(report.user_properties).get("browser")
+    if not engine:
+        return
+    s = _per_engine.setdefault(
+        engine, {"passed": 0, "failed": 0, "skipped": 0, "duration_s": 0.0, "slowest": ("", 0.0)}
+    )
+    s["duration_s"] += report.duration
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        s[report.outcome] += 1
+    if report.when == "call" and report.duration > s["slowest"][1]:
+        s["slowest"] = (report.nodeid, report.duration)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _per_engine or hasattr(config, "workerinput"):
+        return
+    tr = terminalreporter
+    tr.write_sep("-", "browser matrix")
+    tr.write_line(f"  {'engine':<10}{'passed':>8}{'failed':>8}{'skipped':>9}{'total s':>10}{'avg s':>8}")
+    for engine, s in sorted(_per_engine.items(), key=lambda kv: kv[1]["duration_s"]):
+        n = s["passed"] + s["failed"] + s["skipped"]
+        tr.write_line(
+            f"  {engine:<10}{s['passed']:>8}{s['failed']:>8}{s['skipped']:>9}"
+            f"{s['duration_s']:>10.1f}{s['duration_s'] / max(n, 1):>8.2f}"
+        )
+    MATRIX_REPORT.parent.mkdir(parents=True, exist_ok=True)
+    MATRIX_REPORT.write_text(json.dumps(_per_engine, indent=2), encoding="utf-8")
+    tr.write_line(f"  merged report: {MATRIX_REPORT}")
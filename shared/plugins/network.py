@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from shared.core.config import settings
+from shared.core.network import NetworkCollector
+from shared.plugins.browser import _artifact_name
+
+NETWORK_DIR = Path("reports") / "network"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+
+    mode = settings.network_log
+    if mode == "off" or not (rep.failed or (mode == "always" and rep.when == "call")):
+        return
+    page = getattr(item, "funcargs", {}).get("page")
+    collector = NetworkCollector.get(page) if page is not None else None
+    if collector is None:
+        return
+
+    rep.sections.append((f"network ({rep.when})", collector.format_summary()))
+    if rep.failed:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        collector.dump(NETWORK_DIR / f"{_artifact_name(item)}_{ts}.json")
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import pytest
+
+from shared.core.config import settings
+from shared.core.health import CircuitBreaker, ProbeResult, probe_all
+from shared.core.retry import classify
+
+# Tests are mapped to their target app by top-level package.
+APPS = {
+    "dashboard": ("dashboard_app/", lambda: settings.dashboard_base_url),
+    "customer": ("customer_app/", lambda: settings.customer_base_url),
+    "customer_api": ("customer_app/", lambda: settings.customer_api_url),  # items marked `api`
+}
+PREFLIGHT_TAG = "[preflight]"
+BREAKER_TAG = "[circuit-open]"
+
+_probes: dict[str, dict] = {}
+_breakers: dict[str, CircuitBreaker] = {}
+_short_circuited: dict[str, int] = {}
+
+
+def _app_of(item) -> str | None:
+    for app, (prefix, _) in APPS.items():
+        if item.nodeid.startswith(prefix):
+            if item.get_closest_marker("api") and f"{app}_api" in APPS:
+                return f"{app}_api"
+            return app
+    return None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    if not settings.preflight:
+        return
+    config = session.config
+    if hasattr(config, "workerinput"):
+        # xdist worker: reuse the controller's probe instead of probing again
+        _probes.update(config.workerinput.get("preflight", {}))
+        return
+    results = probe_all({app: url() for app, (_, url) in APPS.items()}, settings.preflight_timeout_s)
+    _probes.update({app: r.to_dict() for app, r in results.items()})
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["preflight"] = dict(_probes)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    app = _app_of(item)
+    if app is None:
+        return
+    probe = _probes.get(app)
+    breaker = _breakers.get(app)
+    reason = None
+    if probe and not probe["ok"]:
+        reason = f"{PREFLIGHT_TAG} {app} unreachable: {probe['url']} ({probe['error']})"
+    elif breaker and breaker.is_open:
+        reason = (
+            f"{BREAKER_TAG} {app}: {breaker.threshold} consecutive network failures "
+            f"(last: {breaker.opened_by})"
+        )
+    if reason is None:
+        return
+    if settings.preflight_action == "fail":
+        pytest.fail(reason, pytrace=False)
+    pytest.skip(reason)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    app = _app_of(item)
+    if app is None or rep.when not in ("setup", "call"):
+        return
+    if rep.failed and call.excinfo is not None:
+        text = str(call.excinfo.value)
+        if text.startswith((PREFLIGHT_TAG, BREAKER_TAG)):
+            return
+        breaker = _breakers.setdefault(app, CircuitBreaker(settings.breaker_threshold))
+        breaker.record(classify(call.excinfo.value), item.nodeid)
+    elif rep.when == "call" and rep.passed:
+        _breakers.setdefault(app, CircuitBreaker(settings.breaker_threshold)).record(None)
+
+
+def pytest_runtest_logreport(report):
+    # Controller-side count of short-circuited tests (covers every xdist worker).
+    if report.when != "setup" or report.passed:
+        return
+    longrepr = report.longrepr
+    text = longrepr[2] if isinstance(longrepr, tuple) else str(longrepr)
+    for tag in (PREFLIGHT_TAG, BREAKER_TAG):
+        if tag in text:
+            _short_circuited[tag] = _short_circuited.get(tag, 0) + 1
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _probes and not _short_circuited:
+        return
+    tr = terminalreporter
+    tr.write_sep("-", "preflight")
+    for app, p in _probes.items():
+        r = ProbeResult(**p)
+        state = f"HTTP {r.status}" if r.ok else f"DOWN ({r.error})"
+        tr.write_line(f"  {app:<12} {state:<40} {r.elapsed_ms:>7.0f} ms  {r.url}")
+    if _short_circuited:
+        tr.write_line(
+            f"  short-circuited: {_short_circuited.get(PREFLIGHT_TAG, 0)} by preflight, "
+            f"{_short_circuited.get(BREAKER_TAG, 0)} by open circuit breaker "
+            f"(action: {settings.preflight_action})"
+        )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from shared.core.config import settings
+from shared.reporting.live_report import REPORT_ROOT, ResultWriter, build_html, set_writer, result_record
+
+_writer: ResultWriter | None = None
+_phases: dict[str, dict[str, dict]] = {}
+
+
+def pytest_configure(config):
+    # One directory per run; every process appends to its own JSONL inside it.
+    global _writer
+    if not settings.live_report:
+        return
+    if hasattr(config, "workerinput"):
+        run_dir = Path(config.workerinput["live_report_dir"])
+    else:
+        run_dir = config._live_report_dir = REPORT_ROOT / datetime.now().strftime("%Y%m%d_%H%M%S")
+    _writer = ResultWriter(run_dir)
+    set_writer(_writer)
+    if not hasattr(config, "workerinput"):
+        _writer.write({
+            "type": "run",
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "env": settings.env,
+            "browsers": list(settings.browsers) or [settings.browser],
+        })
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    run_dir = getattr(node.config, "_live_report_dir", None)
+    if run_dir is not None:
+        node.workerinput["live_report_dir"] = str(run_dir)
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)  # outermost: sees user_properties added by other plugins
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    if _writer is None:
+        return
+    phases = _phases.setdefault(item.nodeid, {})
+    phases[rep.when] = {
+        "outcome": rep.outcome,
+        "duration": rep.duration,
+        "longrepr": str(rep.longrepr) if rep.failed else "",
+    }
+    if rep.when == "teardown":
+        _writer.write(result_record(item.nodeid, _phases.pop(item.nodeid), rep.user_properties))
+
+
+def pytest_sessionfinish(session):
+    global _writer
+    if _writer is None:
+        return
+    _writer.close()
+    set_writer(None)
+    _writer = None
+    run_dir = getattr(session.config, "_live_report_dir", None)
+    if run_dir is not None and run_dir.exists():
+        session.config._live_report_html = build_html(run_dir)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    path = getattr(config, "_live_report_html", None)
+    if path is not None:
+        terminalreporter.write_line(f"HTML report: {path.resolve()}")
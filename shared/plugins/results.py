@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+from shared.core.config import settings
+from shared.core.steps import default_recorder
+
+_store = None
+_run_id: int | None = None
+_durations: dict[str, dict[str, float]] = {}
+_outcomes: dict[str, str] = {}
+
+
+def pytest_sessionstart(session):
+    # Only the controller writes; xdist workers ship data in report user_properties.
+    global _store, _run_id
+    if not settings.results_db or hasattr(session.config, "workerinput"):
+        return
+    from shared.results import ResultsStore
+
+    _store = ResultsStore(settings.results_db)
+    _run_id = _store.start_run(list(settings.browsers) or [settings.browser])
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    if not settings.results_db:
+        return
+    if rep.when == "setup":
+        default_recorder.drain()  # leftovers from outside any test are not ours
+    elif rep.when == "teardown":
+        rep.user_properties.append(("steps", [s.to_dict() for s in default_recorder.drain()]))
+        funcargs = getattr(item, "funcargs", {})
+        # Not "browser": that prop is the matrix plugin's signal that a run is a matrix run.
+        if "browser_name" in funcargs:
+            rep.user_properties.append(("results_browser", funcargs["browser_name"]))
+        if funcargs.get("app_base_url"):
+            rep.user_properties.append(("base_url", funcargs["app_base_url"]))
+
+
+def _outcome(report) -> str | None:
+    if report.when == "call":
+        return report.outcome
+    if report.failed:
+        return "error"
+    if report.when == "setup" and report.skipped:
+        return "skipped"
+    return None
+
+
+def pytest_runtest_logreport(report):
+    if _store is None:
+        return
+    nodeid = report.nodeid
+    _durations.setdefault(nodeid, {})[report.when] = report.duration
+    outcome = _outcome(report)
+    if outcome and _outcomes.get(nodeid) in (None, "passed"):
+        _outcomes[nodeid] = outcome
+    if report.when == "teardown":
+        props = dict(report.user_properties)
+        _store.add_result(_run_id, nodeid, _outcomes.pop(nodeid, "passed"), _durations.pop(nodeid), props)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    global _store
+    if _store is None:
+        return
+    _store.finish_run(_run_id, exitstatus)
+    _store.close()
+    _store = None
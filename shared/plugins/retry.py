@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from shared.core.config import settings
+from shared.core.retry import FailureClass, RetryPolicy, RetryStats, retry_call
+
+_results: list[tuple[str, str, dict]] = []
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "smart_retry(max_retries=2, classes=None): retry transient failures in place "
+        "(same page/context); classes is a list of network|timeout|locator",
+    )
+
+
+def _policy(item) -> RetryPolicy | None:
+    marker = item.get_closest_marker("smart_retry")
+    max_retries = settings.retries
+    classes = settings.retry_classes
+    if marker is not None:
+        max_retries = marker.kwargs.get("max_retries", marker.args[0] if marker.args else 2)
+        classes = marker.kwargs.get("classes") or classes  # None (documented default) keeps RETRY_CLASSES
+    if max_retries <= 0:
+        return None
+    return RetryPolicy(
+        max_retries=max_retries,
+        backoff_s=settings.retry_backoff_s,
+        classes=frozenset(FailureClass(c) for c in classes),
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    policy = _policy(pyfuncitem)
+    if policy is None:
+        return None  # default pytest call
+
+    testargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    stats = RetryStats()
+
+    def on_retry(exc, cls, delay):
+        print(f"🔁 {cls.value} failure, retrying in {delay:.1f}s: {str(exc).splitlines()[0][:200]}")
+
+    try:
+        retry_call(lambda: pyfuncitem.obj(**testargs), policy, stats, on_retry)
+    finally:
+        if stats.retries:
+            pyfuncitem.user_properties.append(("retries", stats.retries))
+            pyfuncitem.user_properties.append(("retry_time_s", round(stats.retry_time_s, 2)))
+            pyfuncitem.user_properties.append(("retry_classes", ",".join(stats.classes)))
+    return True
+
+
+def pytest_runtest_logreport(report):
+    # Runs in the xdist controller too, so the summary covers every worker.
+    if report.when != "call":
+        return
+    props = dict(report.user_properties)
+    if props.get("retries"):
+        _results.append((report.nodeid, report.outcome, props))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    tr = terminalreporter
+    total_retries = sum(p["retries"] for _, _, p in _results)
+    total_time = sum(p["retry_time_s"] for _, _, p in _results)
+    tr.write_sep("-", "smart retry")
+    tr.write_line(f"{len(_results)} test(s) retried, {total_retries} retries, {total_time:.1f}s spent retrying")
+    for nodeid, outcome, p in _results:
+        tr.write_line(f"  {outcome:<7} {p['retries']}x  {p['retry_time_s']:>6.1f}s  [{p['retry_classes']}]  {nodeid}")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import pytest
+
+from shared.core.config import settings
+from shared.core.navigation import nav_log
+from shared.core.selectors import analyze, selector_profile
+from shared.core.stats import percentile
+from shared.core.timeouts import timeouts
+
+_navigations: list[dict] = []
+_selector_samples: list[dict] = []
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    if rep.when == "teardown":
+        navs = nav_log.drain()
+        if navs:
+            rep.user_properties.append(("navigation", [asdict(n) for n in navs]))
+        samples = selector_profile.drain()
+        if samples:
+            rep.user_properties.append(("selectors", [asdict(s) for s in samples]))
+
+
+def pytest_runtest_logreport(report):
+    # Controller side: collects navigations and selector timings from every xdist worker.
+    if report.when == "teardown":
+        props = dict(report.user_properties)
+        _navigations.extend(props.get("navigation", []))
+        _selector_samples.extend(props.get("selectors", []))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    if _navigations:
+        _navigation_summary(terminalreporter)
+    if _selector_samples:
+        _selector_summary(terminalreporter)
+
+
+def _navigation_summary(tr) -> None:
+    tr.write_sep("-", "navigation")
+    tr.write_line(f"  {'route':<28}{'direct':>8}{'p50 ms':>9}{'menu p50':>10}{'fallback':>10}{'saved s':>9}")
+    total_saved = 0.0
+    for name in sorted({n["route"] for n in _navigations}):
+        runs = [n for n in _navigations if n["route"] == name]
+        direct = [n["ms"] for n in runs if n["mode"] == "direct"]
+        menu = [n["ms"] for n in runs if n["mode"] == "menu"]
+        # Menu cost from this run if any test clicked through, else from recorded history.
+        menu = menu or timeouts.history.get(f"nav.{name}.menu", [])
+        menu_p50 = percentile(menu, 50) if menu else None
+        saved = sum(max(0.0, menu_p50 - ms) for ms in direct) / 1000 if menu_p50 else 0.0
+        total_saved += saved
+        tr.write_line(
+            f"  {name:<28}{len(direct):>8}{percentile(direct, 50) if direct else 0:>9.0f}"
+            f"{menu_p50 if menu_p50 else float('nan'):>10.0f}"
+            f"{sum(n['mode'] == 'fallback' for n in runs):>10}{saved:>9.1f}"
+        )
+    tr.write_line(f"  deep links saved ~{total_saved:.1f}s versus clicking through the menus")
+
+
+def _selector_summary(tr, limit: int = 15) -> None:
+    by_selector: dict[tuple[str, str], list[dict]] = {}
+    for sample in _selector_samples:
+        by_selector.setdefault((sample["page"], sample["name"]), []).append(sample)
+    rows = []
+    for (page, name), samples in by_selector.items():
+        ms = [s["ms"] for s in samples]
+        rows.append((percentile(ms, 50), max(ms), page, name, samples[0]))
+    rows.sort(key=lambda r: r[0], reverse=True)
+
+    tr.write_sep("-", "selectors")
+    tr.write_line(f"  {'page.selector':<48}{'engine':>8}{'uses':>6}{'p50 ms':>8}{'max ms':>8}{'matches':>9}")
+    for p50, worst, page, name, first in rows[:limit]:
+        label = f"{page}.{name}"
+        label = label if len(label) <= 46 else label[:43] + "..."
+        tr.write_line(
+            f"  {label:<48}{first['engine']:>8}{len(by_selector[(page, name)]):>6}"
+            f"{p50:>8.2f}{worst:>8.2f}{first['matches']:>9}"
+        )
+
+    flagged = []
+    for p50, _, page, name, first in rows:
+        findings = analyze(first["selector"])
+        slow = p50 >= settings.selector_slow_ms
+        if slow or findings:
+            flagged.append((slow, p50, page, name, first["selector"], findings))
+    if not flagged:
+        return
+    tr.write_line(f"  flagged (slow >= {settings.selector_slow_ms} ms or known-slow XPath shape):")
+    for slow, p50, page, name, selector, findings in sorted(flagged, key=lambda f: (not f[0], -f[1])):
+        tr.write_line(f"  {'🐢' if slow else '⚠️'} {page}.{name}  {p50:.2f} ms  {selector}")
+        for f in findings:
+            tr.write_line(f"      {f.rule}: {f.message}")
+            if f.suggestion:
+                tr.write_line(f"      try: {f.suggestion}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Each process (xdist worker or plain run) persists its own step latencies.
+    timeouts.save()
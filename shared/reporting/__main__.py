@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from .live_report import REPORT_ROOT, build_html, latest_run
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        prog="python -m shared.reporting",
+        description="Build the HTML report from a run's JSONL files (also works for killed runs).",
+    )
+    ap.add_argument("run_dir", nargs="?", type=Path, help=f"default: newest directory in {REPORT_ROOT}")
+    ap.add_argument("--out", type=Path)
+    args = ap.parse_args()
+
+    run_dir = args.run_dir or latest_run()
+    if run_dir is None:
+        ap.error(f"no runs in {REPORT_ROOT}")
+    print(f"📄 {build_html(run_dir, args.out).resolve()}")
+
+
+if __name__ == "__main__":
+    main()
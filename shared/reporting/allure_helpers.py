@@ -1,10 +0,0 @@
-from __future__ import annotations
-
-# Optional: enable later if you install allure-pytest.
-# This file is a placeholder for reporting helpers.
-#
-# Example (after installing allure-pytest):
-# import allure
-#
-# def attach_text(name: str, text: str):
-#     allure.attach(text, name=name, attachment_type=allure.attachment_type.TEXT)
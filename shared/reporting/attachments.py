@@ -12,6 +12,11 @@ for d in (SCREENSHOTS, TRACES, VIDEOS):
     d.mkdir(parents=True, exist_ok=True)
 
 def save_screenshot(page: Page, name_prefix: str = "shot") -> Path:
+    from shared.artifacts import get_store
+
+    store = get_store()
+    if store is not None:
+        return store.put_bytes(page.screenshot(full_page=True), name_prefix, "screenshot", ".png")
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = SCREENSHOTS / f"{name_prefix}_{ts}.png"
     page.screenshot(path=str(path), full_page=True)
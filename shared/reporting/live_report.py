@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import html
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+REPORT_ROOT = Path("reports") / "live"
+
+_SCREENSHOT_RE = re.compile(r"Screenshot: (\S+\.png)")
+
+
+class ResultWriter:
+    """
+    Append-only JSONL sink for one process (xdist worker or plain run).
+
+    Every record is written and flushed as soon as it exists, so nothing
+    accumulates in memory and a killed run still leaves every finished test
+    on disk for `build_html`.
+    """
+
+    def __init__(self, run_dir: Path):
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.run_dir = run_dir
+        self.attachments_dir = run_dir / "attachments"
+        self.path = run_dir / f"results-{worker}.jsonl"
+        self._lock = threading.Lock()
+        self._file = None
+
+    def write(self, record: dict) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.run_dir.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_writer: ResultWriter | None = None
+
+
+def set_writer(writer: ResultWriter | None) -> None:
+    global _writer
+    _writer = writer
+
+
+def _current_test() -> str:
+    return os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0]
+
+
+def attach_file(name: str, path: str | Path, kind: str = "file") -> None:
+    """Link an existing file (screenshot, trace, JSON dump...) to the running test."""
+    if _writer is not None:
+        _writer.write({"type": "attachment", "nodeid": _current_test(), "name": name, "kind": kind, "path": str(path)})
+
+
+def attach_text(name: str, text: str) -> None:
+    """Store `text` next to the report and link it to the running test."""
+    if _writer is None:
+        return
+    _writer.attachments_dir.mkdir(parents=True, exist_ok=True)
+    safe = re.sub(r"[^\w.-]+", "_", f"{_current_test()}-{name}")[-150:]
+    path = _writer.attachments_dir / f"{safe}.txt"
+    path.write_text(text, encoding="utf-8")
+    attach_file(name, path, "text")
+
+
+def result_record(nodeid: str, phases: dict[str, dict], props: list[tuple[str, object]]) -> dict:
+    """One record per test, built at teardown from the phase reports."""
+    outcome = "passed"
+    for when in ("setup", "call", "teardown"):
+        p = phases.get(when)
+        if p is None:
+            continue
+        if p["outcome"] == "failed":
+            outcome = "failed" if when == "call" else "error"
+            break
+        if p["outcome"] == "skipped":
+            outcome = "skipped"
+    text = "\n\n".join(p["longrepr"] for p in phases.values() if p.get("longrepr"))
+    links = [{"name": k, "kind": k, "path": str(v)} for k, v in props if k in ("video", "trace") and v]
+    shots = dict.fromkeys(_SCREENSHOT_RE.findall(text))  # the message appears in traceback and summary
+    links += [{"name": "screenshot", "kind": "screenshot", "path": m} for m in shots]
+    return {
+        "type": "test",
+        "nodeid": nodeid,
+        "outcome": outcome,
+        "duration_s": round(sum(p["duration"] for p in phases.values()), 3),
+        "longrepr": text[-20000:],
+        "links": links,
+        "ts": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+# =========================
+# Streaming merge -> static HTML
+# =========================
+def iter_records(run_dir: Path) -> Iterator[dict]:
+    for f in sorted(run_dir.glob("results-*.jsonl")):
+        with f.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # last line of a killed worker
+
+
+_STYLE = """
+body { font-family: sans-serif; margin: 24px; }
+table { border-collapse: collapse; width: 100%; }
+td, th { border-bottom: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }
+.passed { color: #1a7f37; } .failed, .error { color: #cf222e; } .skipped { color: #9a6700; }
+pre { white-space: pre-wrap; max-height: 320px; overflow: auto; background: #f6f8fa; padding: 8px; }
+#summary span { margin-right: 16px; }
+"""
+
+
+def _link(path: str, out_dir: Path, name: str) -> str:
+    href = os.path.relpath(Path(path).resolve(), out_dir.resolve())
+    return f'<a href="{html.escape(href)}">{html.escape(name)}</a>'
+
+
+def build_html(run_dir: Path, out: Path | None = None) -> Path:
+    """
+    Merge every worker's JSONL into one static HTML page.
+
+    Rows are written while the files are read; only per-outcome counters and
+    the not-yet-matched attachments stay in memory.
+    """
+    out = out or run_dir / "report.html"
+    counts: dict[str, int] = {}
+    pending: dict[str, list[dict]] = {}
+    tmp = out.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        fh.write(f"<!doctype html><html><head><meta charset='utf-8'><title>Test report {run_dir.name}</title>")
+        fh.write(f"<style>{_STYLE}</style></head><body><h1>Test report {html.escape(run_dir.name)}</h1>")
+        fh.write("<div id='summary'></div><table><tr><th>Test</th><th>Outcome</th><th>Time</th><th>Details</th></tr>")
+        for rec in iter_records(run_dir):
+            if rec.get("type") == "attachment":
+                pending.setdefault(rec["nodeid"], []).append(rec)
+                continue
+            if rec.get("type") != "test":
+                continue
+            counts[rec["outcome"]] = counts.get(rec["outcome"], 0) + 1
+            links = rec["links"] + pending.pop(rec["nodeid"], [])
+            details = " ".join(_link(a["path"], out.parent, a["name"]) for a in links)
+            if rec["longrepr"] and rec["outcome"] in ("failed", "error"):
+                details += f"<details><summary>error</summary><pre>{html.escape(rec['longrepr'])}</pre></details>"
+            fh.write(
+                f"<tr><td>{html.escape(rec['nodeid'])}</td><td class='{rec['outcome']}'>{rec['outcome']}</td>"
+                f"<td>{rec['duration_s']:.2f}s</td><td>{details}</td></tr>\n"
+            )
+        fh.write("</table>")
+        summary = "".join(f"<span class='{k}'>{k}: {v}</span>" for k, v in sorted(counts.items()))
+        fh.write(f"<script>document.getElementById('summary').innerHTML = {json.dumps(summary)};</script>")
+        fh.write("</body></html>")
+    os.replace(tmp, out)
+    return out
+
+
+def prune_runs(max_age_days: float, root: Path = REPORT_ROOT, keep: Path | None = None) -> int:
+    """Delete run directories not written to for `max_age_days`, except `keep`; returns how many."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for run_dir in sorted(p for p in root.glob("*") if p.is_dir()):
+        if keep is not None and run_dir.resolve() == Path(keep).resolve():
+            continue
+        if run_dir.stat().st_mtime < cutoff:
+            shutil.rmtree(run_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def latest_run(root: Path = REPORT_ROOT) -> Path | None:
+    runs = sorted(p for p in root.glob("*") if p.is_dir())
+    return runs[-1] if runs else None
@@ -0,0 +1,3 @@
+from .store import Regression, ResultsStore
+
+__all__ = ["Regression", "ResultsStore"]
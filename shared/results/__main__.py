@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from shared.core.config import settings
+from . import ResultsStore
+
+
+def _fmt(ms: float | None) -> str:
+    return f"{ms:>8.0f}" if ms is not None else f"{'-':>8}"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="python -m shared.results", description="Query the local test-run history.")
+    ap.add_argument("--db", default=settings.results_db)
+    ap.add_argument("--env", default=settings.env)
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    tr = sub.add_parser("trends", help="median call duration (ms) per test over the last runs")
+    tr.add_argument("--runs", type=int, default=10)
+    tr.add_argument("-k", dest="pattern", default="", help="substring of the test node id")
+
+    rg = sub.add_parser("regressions", help="tests / steps significantly slower than the baseline window")
+    rg.add_argument("--baseline", type=int, default=10, help="runs in the baseline window")
+    rg.add_argument("--recent", type=int, default=3, help="latest runs compared against it")
+    rg.add_argument("--alpha", type=float, default=0.01)
+    rg.add_argument("--min-ratio", type=float, default=1.2, help="minimum median slowdown, e.g. 1.2 = +20%%")
+    args = ap.parse_args()
+
+    store = ResultsStore(args.db)
+    if args.command == "trends":
+        rows = store.trends(args.env, args.runs, f"%{args.pattern}%")
+        if not rows:
+            print(f"No finished runs for ENV={args.env} in {args.db}")
+            return
+        for row in rows:
+            print(f"{row['test']}\n   " + "".join(_fmt(ms) for ms in row["runs"]))
+        return
+
+    found = store.regressions(args.env, args.baseline, args.recent, args.alpha, args.min_ratio)
+    if not found:
+        print(f"✅ No significant slowdowns (last {args.recent} runs vs previous {args.baseline}, ENV={args.env})")
+        return
+    print(f"❌ {len(found)} significant slowdown(s) (ENV={args.env}):")
+    for r in found:
+        print(
+            f"  {r.kind:<5} {r.name}\n"
+            f"        median {r.baseline_median:.0f} ms -> {r.recent_median:.0f} ms "
+            f"(x{r.ratio:.2f}, p={r.p_value:.4f})"
+        )
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
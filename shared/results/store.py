@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import socket
+import sqlite3
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from shared.core.config import ROOT_DIR, settings
+from shared.core.stats import mann_whitney, percentile
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at   TEXT NOT NULL,
+    finished_at  TEXT,
+    env          TEXT NOT NULL,
+    browsers     TEXT NOT NULL,
+    profile      TEXT NOT NULL,
+    git_sha      TEXT,
+    host         TEXT,
+    exitstatus   INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id      INTEGER NOT NULL REFERENCES runs(id),
+    nodeid      TEXT NOT NULL,
+    outcome     TEXT NOT NULL,
+    browser     TEXT,
+    base_url    TEXT,
+    setup_s     REAL,
+    call_s      REAL,
+    teardown_s  REAL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id       INTEGER NOT NULL REFERENCES runs(id),
+    nodeid       TEXT NOT NULL,
+    name         TEXT NOT NULL,
+    duration_ms  REAL NOT NULL,
+    ok           INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results(nodeid, run_id);
+CREATE INDEX IF NOT EXISTS steps_name ON steps(name, run_id);
+"""
+
+# Results are committed in small batches so a killed run keeps what it finished.
+COMMIT_EVERY = 20
+COMMIT_INTERVAL_S = 5.0
+
+
+def _git_sha() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.strip() or None
+
+
+@dataclass
+class Regression:
+    kind: str  # "test" | "step"
+    name: str
+    baseline_median: float
+    recent_median: float
+    p_value: float
+
+    @property
+    def ratio(self) -> float:
+        return self.recent_median / self.baseline_median if self.baseline_median else float("inf")
+
+
+class ResultsStore:
+    """
+    SQLite history of test runs: one row per run, per test and per `step()`.
+
+    Only the pytest controller writes (xdist workers ship their data in
+    report user_properties), so a single connection is enough.
+    """
+
+    def __init__(self, path: str | Path = settings.results_db):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(_SCHEMA)
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+    def _commit(self) -> None:
+        self.db.commit()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    # =========================
+    # Writing
+    # =========================
+    def start_run(self, browsers: list[str]) -> int:
+        cur = self.db.execute(
+            "INSERT INTO runs (started_at, env, browsers, profile, git_sha, host) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                datetime.now().isoformat(timespec="seconds"),
+                settings.env,
+                ",".join(browsers),
+                settings.launch_profile,
+                _git_sha(),
+                socket.gethostname(),
+            ),
+        )
+        self._commit()
+        return cur.lastrowid
+
+    def add_result(self, run_id: int, nodeid: str, outcome: str, durations: dict[str, float], props: dict) -> None:
+        self.db.execute(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id, nodeid, outcome, props.get("results_browser"), props.get("base_url"),
+                durations.get("setup"), durations.get("call"), durations.get("teardown"),
+            ),
+        )
+        self.db.executemany(
+            "INSERT INTO steps VALUES (?, ?, ?, ?, ?)",
+            [(run_id, nodeid, s["name"], s["duration_ms"], int(s["ok"])) for s in props.get("steps", [])],
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= COMMIT_EVERY or time.monotonic() - self._last_commit >= COMMIT_INTERVAL_S:
+            self._commit()
+
+    def finish_run(self, run_id: int, exitstatus: int) -> None:
+        self.db.execute(
+            "UPDATE runs SET finished_at = ?, exitstatus = ? WHERE id = ?",
+            (datetime.now().isoformat(timespec="seconds"), int(exitstatus), run_id),
+        )
+        self._commit()
+
+    # =========================
+    # Queries
+    # =========================
+    def _run_ids(self, env: str, limit: int) -> list[int]:
+        rows = self.db.execute(
+            "SELECT id FROM runs WHERE env = ? AND finished_at IS NOT NULL ORDER BY id DESC LIMIT ?", (env, limit)
+        )
+        return [r["id"] for r in rows][::-1]
+
+    def _durations(self, kind: str, run_ids: list[int], pattern: str = "%") -> dict[str, list[float]]:
+        if not run_ids:
+            return {}
+        marks = ",".join("?" * len(run_ids))
+        if kind == "test":
+            sql = (
+                f"SELECT nodeid AS name, call_s * 1000 AS ms FROM results "
+                f"WHERE outcome = 'passed' AND call_s IS NOT NULL AND nodeid LIKE ? AND run_id IN ({marks})"
+            )
+        else:
+            sql = f"SELECT name, duration_ms AS ms FROM steps WHERE ok = 1 AND name LIKE ? AND run_id IN ({marks})"
+        out: dict[str, list[float]] = {}
+        for r in self.db.execute(sql, (pattern, *run_ids)):
+            out.setdefault(r["name"], []).append(r["ms"])
+        return out
+
+    def trends(self, env: str = settings.env, runs: int = 10, pattern: str = "%") -> list[dict]:
+        """Median call duration (ms) per test for each of the last `runs` runs, oldest first."""
+        run_ids = self._run_ids(env, runs)
+        table: dict[str, dict[int, float]] = {}
+        for run_id in run_ids:
+            for name, ms in self._durations("test", [run_id], pattern).items():
+                table.setdefault(name, {})[run_id] = percentile(ms, 50)
+        return [
+            {"test": name, "runs": [by_run.get(run_id) for run_id in run_ids]}
+            for name, by_run in sorted(table.items())
+        ]
+
+    def regressions(
+        self,
+        env: str = settings.env,
+        baseline_runs: int = 10,
+        recent_runs: int = 3,
+        alpha: float = 0.01,
+        min_ratio: float = 1.2,
+        min_samples: int = 3,
+    ) -> list[Regression]:
+        """
+        Tests and steps whose recent durations are significantly slower than the baseline window.
+
+        The last `recent_runs` finished runs are compared with the `baseline_runs`
+        before them (one-sided Mann-Whitney U, passing results only). A hit needs
+        both p < `alpha` and a median slowdown of at least `min_ratio`, so tiny
+        but consistent shifts do not page anyone.
+        """
+        run_ids = self._run_ids(env, baseline_runs + recent_runs)
+        if len(run_ids) <= recent_runs:
+            return []
+        base_ids, recent_ids = run_ids[:-recent_runs], run_ids[-recent_runs:]
+        found = []
+        for kind in ("test", "step"):
+            base, recent = self._durations(kind, base_ids), self._durations(kind, recent_ids)
+            for name, now in recent.items():
+                before = base.get(name, [])
+                if len(before) < min_samples or len(now) < min_samples:
+                    continue
+                reg = Regression(kind, name, percentile(before, 50), percentile(now, 50), mann_whitney(before, now))
+                if reg.p_value < alpha and reg.ratio >= min_ratio:
+                    found.append(reg)
+        return sorted(found, key=lambda r: r.ratio, reverse=True)
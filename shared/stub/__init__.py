@@ -0,0 +1,3 @@
+from .server import Request, Response, StubServer
+
+__all__ = ["Request", "Response", "StubServer"]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import mimetypes
+import threading
+import time
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes = b""
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        jar = SimpleCookie(self.headers.get("cookie", ""))
+        return {k: m.value for k, m in jar.items()}
+
+    def arg(self, name: str, default: str | None = None) -> str | None:
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def json(self):
+        return json.loads(self.body or b"null")
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: bytes = b""
+    content_type: str = "text/plain; charset=utf-8"
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, data, status: int = 200, **headers) -> "Response":
+        return cls(status, json.dumps(data).encode(), "application/json", headers)
+
+    @classmethod
+    def html(cls, text: str, status: int = 200) -> "Response":
+        return cls(status, text.encode(), "text/html; charset=utf-8")
+
+    @classmethod
+    def redirect(cls, location: str, status: int = 302) -> "Response":
+        return cls(status, headers={"Location": location})
+
+
+Handler = Callable[[Request], Response]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # the default of 5 drops connects from concurrent API clients
+
+
+class StubServer:
+    """
+    Minimal threaded HTTP server for local stand-ins of the apps under test.
+
+    Routes are exact paths, or prefixes when they end with "*". Everything
+    runs on a daemon thread so it can live inside a pytest session:
+
+        with StubServer(port=0) as srv:
+            page.goto(srv.url + "/en/login")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: int = 0):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms  # added to every response, to simulate a slow backend
+        self._routes: dict[tuple[str, str], Handler] = {}
+        self._prefix_routes: list[tuple[str, str, Handler]] = []
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    # =========================
+    # Routing
+    # =========================
+    def route(self, method: str, path: str) -> Callable[[Handler], Handler]:
+        def decorator(fn: Handler) -> Handler:
+            if path.endswith("*"):
+                self._prefix_routes.append((method.upper(), path[:-1], fn))
+                self._prefix_routes.sort(key=lambda r: len(r[1]), reverse=True)
+            else:
+                self._routes[(method.upper(), path)] = fn
+            return fn
+
+        return decorator
+
+    def static(self, url_prefix: str, directory: str | Path) -> None:
+        root = Path(directory).resolve()
+        prefix = url_prefix.rstrip("/") + "/"
+
+        def serve(req: Request) -> Response:
+            target = (root / req.path[len(prefix):]).resolve()
+            if root not in target.parents or not target.is_file():
+                return Response(404, b"not found")
+            ctype = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+            return Response(200, target.read_bytes(), ctype, {"Cache-Control": "max-age=3600"})
+
+        self.route("GET", prefix + "*")(serve)
+
+    def dispatch(self, req: Request) -> Response:
+        fn = self._routes.get((req.method, req.path))
+        if fn is None:
+            for method, prefix, handler in self._prefix_routes:
+                if method == req.method and req.path.startswith(prefix):
+                    fn = handler
+                    break
+        if fn is None:
+            return Response.json({"error": f"no route for {req.method} {req.path}"}, status=404)
+        return fn(req)
+
+    # =========================
+    # Lifecycle
+    # =========================
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _make_handler(self):
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so browsers reuse connections
+            disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+            def _handle(self) -> None:
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                req = Request(
+                    method=self.command,
+                    path=parts.path,
+                    query=parse_qs(parts.query),
+                    headers={k.lower(): v for k, v in self.headers.items()},
+                    body=self.rfile.read(length) if length else b"",
+                )
+                try:
+                    resp = server.dispatch(req)
+                except Exception as e:  # surface handler bugs as 500s, not dropped sockets
+                    resp = Response.json({"error": f"{type(e).__name__}: {e}"}, status=500)
+
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+
+                self.send_response(resp.status)
+                self.send_header("Content-Type", resp.content_type)
+                self.send_header("Content-Length", str(len(resp.body)))
+                for k, v in resp.headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(resp.body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return _Handler
+
+    def start(self) -> "StubServer":
+        self._httpd = _Server((self.host, self.port), self._make_handler())
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def serve_forever(self) -> None:
+        self.start()
+        try:
+            while self._thread and self._thread.is_alive():
+                self._thread.join(0.5)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,69 @@
+import os
+import time
+
+from shared.artifacts import ArtifactStore
+from shared.reporting.live_report import prune_runs
+
+
+def _age(store, days):
+    # Backdate every ref and object as if written `days` ago.
+    cutoff = time.time() - days * 86400
+    with store.db:
+        store.db.execute("UPDATE refs SET created = ?", (cutoff,))
+        store.db.execute("UPDATE objects SET last_used = ?", (cutoff,))
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    a = store.put_bytes(b"same screen", "retry1", "screenshot", ".png", nodeid="t.py::a")
+    b = store.put_bytes(b"same screen", "retry2", "screenshot", ".png", nodeid="t.py::a")
+    log = store.put_bytes(b"line\n" * 100, "run", "log", ".log", nodeid="t.py::a")
+    assert a == b
+    assert log.suffix == ".gz" and store.read(log) == b"line\n" * 100
+    assert store.stats()["objects"] == 2 and store.stats()["refs"] == 3
+    store.close()
+
+
+def test_gc_expires_old_refs_then_their_objects(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    old = store.put_bytes(b"old", "old", "trace", ".zip", nodeid="t.py::old")
+    _age(store, 30)
+    new = store.put_bytes(b"new", "new", "trace", ".zip", nodeid="t.py::new")
+
+    stats = store.gc(max_age_days=14)
+    assert (stats.refs_removed, stats.objects_removed, stats.bytes_freed) == (1, 1, 3)
+    assert not old.exists() and new.exists()
+    assert [n for n, *_ in store.find("t.py")] == ["t.py::new"]
+    store.close()
+
+
+def test_gc_size_budget_evicts_least_recently_used(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    first = store.put_bytes(os.urandom(600_000), "a", "video", ".webm")
+    _age(store, 1)
+    second = store.put_bytes(os.urandom(600_000), "b", "video", ".webm")
+
+    stats = store.gc(max_total_mb=1)
+    assert stats.objects_removed == 1
+    assert not first.exists() and second.exists()
+    store.close()
+
+
+def test_close_checkpoints_the_wal(tmp_path):
+    store = ArtifactStore(tmp_path / "store")
+    store.put_bytes(b"x", "x", "log", ".log")
+    store.close()
+    assert not (tmp_path / "store" / "index.db-wal").exists()
+    assert ArtifactStore(tmp_path / "store").stats()["refs"] == 1
+
+
+def test_prune_runs_keeps_recent_and_current(tmp_path):
+    old, current, recent = (tmp_path / n for n in ("20260101_000000", "20260102_000000", "20261019_000000"))
+    for d in (old, current, recent):
+        d.mkdir()
+    month_ago = time.time() - 30 * 86400
+    for d in (old, current):
+        os.utime(d, (month_ago, month_ago))
+
+    assert prune_runs(14, root=tmp_path, keep=current) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [current.name, recent.name]
@@ -0,0 +1,121 @@
+import struct
+import zlib
+
+import pytest
+from shared.data.assets import AssetCatalog, inspect_image, synthetic_image_payload, synthetic_png
+
+
+def _jpeg(width=64, height=48, fill=0, app0=True) -> bytes:
+    out = b"\xff\xd8"
+    if app0:
+        out += b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof = b"\x08" + struct.pack(">HH", height, width) + b"\x03" + b"\x00" * 9
+    out += b"\xff" * fill + b"\xff\xc0" + struct.pack(">H", len(sof) + 2) + sof
+    return out + b"\xff\xd9"
+
+
+def _write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return inspect_image(path)
+
+
+@pytest.mark.parametrize(
+    "name, data, fmt, size",
+    [
+        ("a.png", synthetic_png(7, 5), "png", (7, 5)),
+        ("b.gif", b"GIF89a" + struct.pack("<HH", 9, 4) + b"\x00" * 20, "gif", (9, 4)),
+        (
+            "c.webp",
+            b"RIFF\x00\x00\x00\x00WEBPVP8 " + b"\x00" * 10 + struct.pack("<HH", 30, 20) + b"\x00" * 4,
+            "webp",
+            (30, 20),
+        ),
+        (
+            "d.webp",
+            b"RIFF\x00\x00\x00\x00WEBPVP8X" + b"\x00" * 8 + (11).to_bytes(3, "little") + (5).to_bytes(3, "little"),
+            "webp",
+            (12, 6),
+        ),
+        ("e.jpg", _jpeg(), "jpeg", (64, 48)),
+    ],
+)
+def test_sniffed_formats(tmp_path, name, data, fmt, size):
+    asset = _write(tmp_path, name, data)
+    assert (asset.format, asset.width, asset.height) == (fmt, *size)
+    assert asset.valid
+
+
+def test_format_comes_from_bytes_not_suffix(tmp_path):
+    asset = _write(tmp_path, "really_a_png.jpg", synthetic_png(3, 3))
+    assert asset.format == "png" and asset.mime_type == "image/png"
+
+
+def test_jpeg_fill_bytes_between_segments(tmp_path):
+    asset = _write(tmp_path, "fill.jpg", _jpeg(320, 200, fill=3))
+    assert (asset.width, asset.height) == (320, 200)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        _jpeg()[:26],  # SOF cut short
+        _jpeg(app0=False)[:5],  # marker length missing
+        b"\xff\xd8\xff\xe0\x00\x01",  # segment length < 2
+        b"\xff\xd8\x00\x00\x00\x00",  # no marker where one must be
+        b"\xff\xd8\xff\x00\x00\x00",  # stuffed byte outside scan data
+    ],
+)
+def test_truncated_or_corrupt_jpeg_is_invalid(tmp_path, data):
+    asset = _write(tmp_path, "bad.jpg", data)
+    assert asset.format == "jpeg"
+    assert not asset.valid
+
+
+@pytest.mark.parametrize("cut", [10, 20])
+def test_truncated_png_header_is_invalid(tmp_path, cut):
+    asset = _write(tmp_path, "bad.png", synthetic_png(4, 4)[:cut])
+    assert asset.format == "png"
+    assert not asset.valid
+
+
+def test_empty_and_unknown_files_are_invalid(tmp_path):
+    assert not _write(tmp_path, "empty.png", b"").valid
+    assert _write(tmp_path, "text.png", b"not an image at all").format is None
+
+
+def test_synthetic_png_round_trip():
+    data = synthetic_png(16, 9, seed=3)
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks, pos = {}, 8
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos:pos + 4])
+        tag, body = data[pos + 4:pos + 8], data[pos + 8:pos + 8 + length]
+        (crc,) = struct.unpack(">I", data[pos + 8 + length:pos + 12 + length])
+        assert crc == zlib.crc32(tag + body)
+        chunks[tag] = body
+        pos += 12 + length
+    assert struct.unpack(">II", chunks[b"IHDR"][:8]) == (16, 9)
+    raw = zlib.decompress(chunks[b"IDAT"])
+    assert len(raw) == 9 * (1 + 16 * 3)
+    assert b"IEND" in chunks
+
+
+def test_synthetic_png_meets_min_bytes_and_decodes():
+    Image = pytest.importorskip("PIL.Image")
+    import io
+
+    payload = synthetic_image_payload(40, 30, min_bytes=50_000, seed=1)
+    assert len(payload["buffer"]) >= 50_000
+    assert payload["name"] == "synthetic_40x30.png"
+    assert Image.open(io.BytesIO(payload["buffer"])).size == (40, 30)
+
+
+def test_catalog_picks_valid_assets_in_name_order(tmp_path):
+    (tmp_path / "a_empty.png").write_bytes(b"")
+    (tmp_path / "b.png").write_bytes(synthetic_png(2, 2))
+    (tmp_path / "c.jpg").write_bytes(_jpeg())
+    catalog = AssetCatalog(tmp_path)
+    assert catalog.pick().name == "b.png"
+    assert catalog.pick(format="jpeg").name == "c.jpg"
+    assert [a.name for a in catalog.find(valid=False)] == ["a_empty.png"]
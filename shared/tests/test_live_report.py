@@ -0,0 +1,40 @@
+import json
+
+from shared.reporting.live_report import ResultWriter, build_html, iter_records, result_record
+
+
+def _phase(outcome, longrepr=""):
+    return {"outcome": outcome, "duration": 0.5, "longrepr": longrepr}
+
+
+def test_build_html_survives_a_truncated_last_line(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+    writer = ResultWriter(tmp_path)
+    writer.write(result_record("t.py::ok", {"call": _phase("passed")}, []))
+    writer.write(result_record("t.py::bad", {"call": _phase("failed", "AssertionError: <boom>")}, []))
+    writer.close()
+    # A worker killed mid-write leaves half a JSON object behind.
+    with writer.path.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(result_record("t.py::cut", {"call": _phase("passed")}, []))[:40])
+
+    assert [r["nodeid"] for r in iter_records(tmp_path)] == ["t.py::ok", "t.py::bad"]
+
+    html = build_html(tmp_path).read_text(encoding="utf-8")
+    assert "t.py::ok" in html and "t.py::bad" in html
+    assert "t.py::cut" not in html
+    assert "&lt;boom&gt;" in html
+    assert "passed: 1" in html and "failed: 1" in html
+    assert not (tmp_path / "report.tmp").exists()
+
+
+def test_attachments_are_joined_to_their_test_across_workers(tmp_path):
+    (tmp_path / "results-gw1.jsonl").write_text(
+        json.dumps({"type": "attachment", "nodeid": "t.py::a", "name": "log", "kind": "text", "path": "log.txt"}) + "\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "results-gw2.jsonl").write_text(
+        json.dumps(result_record("t.py::a", {"call": _phase("passed")}, [])) + "\n", encoding="utf-8"
+    )
+
+    html = build_html(tmp_path).read_text(encoding="utf-8")
+    assert ">log</a>" in html
@@ -0,0 +1,30 @@
+import sqlite3
+
+from shared.results import ResultsStore
+from shared.results import store as results_store
+
+
+def _count(path, table):
+    with sqlite3.connect(path) as db:
+        return db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_results_are_committed_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(results_store, "COMMIT_EVERY", 2)
+    monkeypatch.setattr(results_store, "COMMIT_INTERVAL_S", 3600)
+    path = tmp_path / "results.db"
+    store = ResultsStore(path)
+    run = store.start_run(["chromium"])
+    steps = {"steps": [{"name": "login", "duration_ms": 12.5, "ok": True}], "results_browser": "chromium"}
+
+    store.add_result(run, "t.py::a", "passed", {"call": 0.1}, steps)
+    assert _count(path, "results") == 0  # visible to other readers only after a commit
+    store.add_result(run, "t.py::b", "failed", {"call": 0.2}, {})
+    assert _count(path, "results") == 2
+    assert _count(path, "steps") == 1
+
+    store.add_result(run, "t.py::c", "passed", {"call": 0.3}, {})
+    store.close()  # flushes the partial batch
+    assert _count(path, "results") == 3
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT browser FROM results WHERE nodeid = 't.py::a'").fetchone()[0] == "chromium"
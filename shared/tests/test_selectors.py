@@ -0,0 +1,56 @@
+from dashboard_app.pages.category_management_page import CategoryManagementPage
+from shared.core.selectors import analyze, collect_selectors, engine
+
+
+def _rules(selector):
+    return [f.rule for f in analyze(selector)]
+
+
+def test_engine():
+    assert engine("//h1") == "xpath"
+    assert engine("xpath=//h1") == "xpath"
+    assert engine("(//button)[2]") == "xpath"
+    assert engine("input[type='file']") == "css"
+    assert engine("text=Login") == "playwright"
+    assert engine("div >> text=Save") == "playwright"
+
+
+def test_label_following_suggests_get_by_label():
+    findings = analyze(CategoryManagementPage.CMB_SERVICE_TYPE)
+    assert [f.rule for f in findings] == ["following-axis"]
+    assert findings[0].suggestion == 'page.get_by_label("Service Type")'
+
+
+def test_descendant_predicate_suggests_has():
+    (finding,) = analyze("//a[.//span[normalize-space()='Categories']]")
+    assert finding.rule == "descendant-predicate"
+    assert finding.suggestion == 'a:has(span:text-is("Categories"))'
+
+
+def test_broad_scan_with_role_suggestion():
+    (finding,) = analyze("//div[@role='option' and normalize-space()='Digital Services']")
+    assert finding.rule == "broad-scan"
+    assert finding.suggestion == 'page.get_by_role("option", name="Digital Services", exact=True)'
+
+
+def test_text_and_attribute_xpath():
+    (text,) = analyze("//button[normalize-space()='Add Category']")
+    assert text.rule == "text-xpath"
+    assert text.suggestion == 'page.get_by_role("button", name="Add Category", exact=True)'
+
+    (attr,) = analyze("//input[@type='text' and @placeholder='Enter one or more names']")
+    assert attr.rule == "attribute-xpath"
+    assert attr.suggestion == 'page.get_by_placeholder("Enter one or more names", exact=True)'
+
+    assert analyze("//button[@aria-label='Next page']")[0].suggestion == 'button[aria-label="Next page"]'
+
+
+def test_css_and_unparsed_xpath_are_not_flagged():
+    assert analyze("input[type='file']") == ()
+    assert _rules("//table/tbody") == []
+
+
+def test_collect_selectors_keeps_only_string_constants():
+    found = collect_selectors(CategoryManagementPage)
+    assert found["BTN_ADD_CATEGORY"] == CategoryManagementPage.BTN_ADD_CATEGORY
+    assert "PERF_BUDGET" not in found and "ROUTE" not in found
@@ -0,0 +1,42 @@
+import math
+
+import pytest
+from shared.core.stats import mann_whitney, percentile, summarize
+
+
+def test_percentile_matches_linear_interpolation():
+    data = [15, 20, 35, 40, 50]
+    assert percentile(data, 0) == 15
+    assert percentile(data, 100) == 50
+    assert percentile(data, 50) == 35
+    assert percentile(data, 40) == pytest.approx(29.0)  # numpy.percentile(data, 40)
+    assert percentile([3, 1, 2], 50) == 2  # input need not be sorted
+
+
+def test_percentile_of_nothing_is_nan():
+    assert math.isnan(percentile([], 99))
+
+
+def test_summarize():
+    s = summarize([4, 1, 3, 2])
+    assert (s["count"], s["min"], s["max"], s["mean"]) == (4, 1, 4, 2.5)
+    assert summarize([]) == {"count": 0}
+
+
+def test_mann_whitney_flags_a_clear_slowdown():
+    baseline = [100, 102, 98, 101, 99, 103, 97]
+    assert mann_whitney(baseline, [150, 155, 148, 160, 152]) < 0.01
+
+
+def test_mann_whitney_is_one_sided():
+    baseline = [100, 102, 98, 101, 99, 103, 97]
+    assert mann_whitney(baseline, [50, 55, 48, 60, 52]) > 0.99
+
+
+def test_mann_whitney_same_distribution_is_not_significant():
+    assert mann_whitney([1, 2, 3, 4, 5, 6], [1.5, 2.5, 3.5, 4.5, 5.5, 6.5]) > 0.1
+
+
+def test_mann_whitney_undecidable_inputs():
+    assert mann_whitney([], [1, 2]) == 1.0
+    assert mann_whitney([5, 5, 5], [5, 5, 5]) == 1.0  # all ties: no variance
@@ -0,0 +1,23 @@
+import pytest
+from shared.core.table import assert_sorted, parse_datetime, parse_int
+
+
+def test_assert_sorted_case_insensitive():
+    rows = [{"name": "airtime"}, {"name": "Cable TV"}, {"name": "cashin"}]
+    with pytest.raises(AssertionError, match="not sorted"):
+        assert_sorted(rows, "name")  # plain < puts "C" before "a"
+    assert_sorted(rows, "name", by=str.casefold)
+
+
+def test_assert_sorted_descending_skips_missing_values():
+    rows = [{"sn": 3}, {"sn": None}, {"sn": 2}, {"sn": 1}]
+    assert_sorted(rows, "sn", descending=True)
+    with pytest.raises(AssertionError, match=r"row 1 1 then row 2 2"):
+        assert_sorted([{"sn": 1}, {"sn": 2}], "sn", descending=True)
+
+
+def test_cell_parsers():
+    assert parse_int("1,204") == 1204
+    assert parse_int("—") is None
+    assert parse_datetime("2026-10-19 14:05").hour == 14
+    assert parse_datetime("yesterday") is None
@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from shared.core import visual  # noqa: E402
+
+
+def _png(noise_box=None, seed=0) -> bytes:
+    rng = np.random.default_rng(seed)
+    pixels = np.tile(np.linspace(0, 255, 200, dtype=np.uint8), (120, 1))[..., None].repeat(3, axis=2)
+    if noise_box:
+        x, y, w, h = noise_box
+        pixels[y:y + h, x:x + w] = rng.integers(0, 255, (h, w, 3), dtype=np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(pixels).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def test_masked_region_does_not_change_the_hash(tmp_path):
+    box = (20, 20, 80, 60)
+    baseline = tmp_path / "Page" / "chromium" / "200x120" / "home.png"
+    assert visual.check(_png(box, seed=1), baseline, masks=(box,), update=False).status == "new"
+
+    result = visual.check(_png(box, seed=2), baseline, masks=(box,), update=False)
+    assert result.status == "hash-match"
+
+
+def test_unmasked_change_is_a_diff(tmp_path, monkeypatch):
+    monkeypatch.setattr(visual, "DIFF_DIR", tmp_path / "diffs")
+    baseline = tmp_path / "Page" / "chromium" / "200x120" / "home.png"
+    visual.check(_png(), baseline, update=False)
+
+    result = visual.check(_png((20, 20, 80, 60)), baseline, max_diff_ratio=0.01, update=False)
+    assert result.status == "diff"
+    assert not result.ok
+    assert result.diff_ratio > 0.1
+
+
+def test_diff_artifacts_are_per_browser_and_viewport(tmp_path, monkeypatch):
+    monkeypatch.setattr(visual, "DIFF_DIR", tmp_path / "diffs")
+    names = set()
+    for browser, vp in (("chromium", "200x120"), ("firefox", "200x120"), ("chromium", "1280x720")):
+        baseline = tmp_path / "Page" / browser / vp / "home.png"
+        visual.check(_png(), baseline, update=False)
+        result = visual.check(_png((20, 20, 80, 60)), baseline, max_diff_ratio=0.01, update=False)
+        names.update(result.artifacts)
+    assert len(names) == 6
+    assert str(tmp_path / "diffs" / "Page-firefox-200x120-home-diff.png") in names